@@ -0,0 +1,44 @@
+import logging
+from typing import Protocol
+
+from benchmarks._timing import ns_per_call, print_table
+from uncoupled.bundle import Bundle
+from uncoupled.container import Container
+
+INTERFACES = [type(f"IService{i}", (Protocol,), {}) for i in range(12)]
+
+
+def main() -> None:
+    Container._delete_instance()
+    container = Container.create(log_level=logging.ERROR)
+    for i, interface in enumerate(INTERFACES):
+        concrete = type(f"Service{i}", (interface,), {})
+        if i % 3 == 0:
+            container.add_singleton(interface, concrete)
+        elif i % 3 == 1:
+            container.add_scoped(interface, concrete)
+        else:
+            container.add_transient(interface, concrete)
+
+    bundle = Bundle(*INTERFACES)
+    with container.scope():
+        one_by_one = ns_per_call(
+            lambda: tuple(container.get(i) for i in INTERFACES), number=20_000
+        )
+        get_many = ns_per_call(lambda: container.get_many(*INTERFACES), number=20_000)
+        bundled = ns_per_call(bundle.resolve, number=20_000)
+    Container._delete_instance()
+
+    print("Resolving 12 services (4 singleton, 4 scoped, 4 transient)")
+    print_table(
+        ["path", "ns/batch", "speedup"],
+        [
+            ["one by one", one_by_one, "1.00x"],
+            ["get_many", get_many, f"{one_by_one / get_many:.2f}x"],
+            ["Bundle", bundled, f"{one_by_one / bundled:.2f}x"],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
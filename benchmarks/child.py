@@ -0,0 +1,63 @@
+import logging
+import time
+from typing import Protocol
+
+from benchmarks._timing import ns_per_call, print_table
+from uncoupled.container import Container
+
+
+class IConfig(Protocol): ...
+
+
+class Config(IConfig): ...
+
+
+class TenantConfig(IConfig): ...
+
+
+def main() -> None:
+    Container._delete_instance()
+    container = Container.create(log_level=logging.ERROR)
+    interfaces = [type(f"IService{i}", (Protocol,), {}) for i in range(1000)]
+    for i, interface in enumerate(interfaces):
+        container.add_singleton(interface, type(f"Service{i}", (interface,), {}))
+    container.add_singleton(IConfig, Config)
+    shared = interfaces[0]
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        container.child()
+    child_us = (time.perf_counter() - start) * 1e3
+
+    start = time.perf_counter()
+    for _ in range(10):
+        Container._instance = None
+        rebuilt = Container.create(log_level=logging.ERROR)
+        for i, interface in enumerate(interfaces):
+            rebuilt.add_singleton(interface, type(f"Service{i}", (interface,), {}))
+        rebuilt.get(shared)
+    rebuild_us = (time.perf_counter() - start) * 1e5
+    Container._instance = container
+
+    child = container.child().add_singleton(IConfig, TenantConfig)
+    grandchild = child.child()
+    rows = [
+        ["parent", ns_per_call(lambda: container.get(shared))],
+        ["child, inherited", ns_per_call(lambda: child.get(shared))],
+        ["child, overridden", ns_per_call(lambda: child.get(IConfig))],
+        ["grandchild, inherited", ns_per_call(lambda: grandchild.get(shared))],
+    ]
+    Container._delete_instance()
+
+    print("1000 singleton registrations")
+    print(
+        f"container.child(): {child_us:.1f}us, delete and rebuild: {rebuild_us:.1f}us"
+    )
+    print_table(
+        ["resolve through", "ns", "vs parent"],
+        [[name, ns, f"{ns / rows[0][1]:.2f}x"] for name, ns in rows],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+from typing import Protocol
+
+from benchmarks._timing import ns_per_call, print_table
+from uncoupled.container import Container
+
+
+class IConfig(Protocol): ...
+
+
+class ISession(Protocol): ...
+
+
+class ILeaf1(Protocol): ...
+
+
+class ILeaf2(Protocol): ...
+
+
+class ILeaf3(Protocol): ...
+
+
+class ILeaf4(Protocol): ...
+
+
+class IMid1(Protocol): ...
+
+
+class IMid2(Protocol): ...
+
+
+class IMid3(Protocol): ...
+
+
+class IMid4(Protocol): ...
+
+
+class IRoot(Protocol): ...
+
+
+class Config(IConfig): ...
+
+
+class Session(ISession): ...
+
+
+class Leaf:
+    def __init__(self, config: IConfig, session: ISession) -> None:
+        self.config = config
+        self.session = session
+
+
+class Mid:
+    def __init__(self, a: ILeaf1, b: ILeaf2, c: ILeaf3, d: ILeaf4) -> None:
+        self.leaves = (a, b, c, d)
+
+
+class Root(IRoot):
+    def __init__(self, a: IMid1, b: IMid2, c: IMid3, d: IMid4) -> None:
+        self.mids = (a, b, c, d)
+
+
+def hand_wired(config: Config, session: Session) -> Root:
+    def mid() -> Mid:
+        return Mid(
+            Leaf(config, session),
+            Leaf(config, session),
+            Leaf(config, session),
+            Leaf(config, session),
+        )
+
+    return Root(mid(), mid(), mid(), mid())
+
+
+def main() -> None:
+    container = (
+        Container.create()
+        .add_singleton(IConfig, Config)
+        .add_scoped(ISession, Session)
+        .add_transient(IRoot, Root)
+    )
+    for leaf in (ILeaf1, ILeaf2, ILeaf3, ILeaf4):
+        container.add_transient(leaf, Leaf)
+    for mid in (IMid1, IMid2, IMid3, IMid4):
+        container.add_transient(mid, Mid)
+
+    compiled = container.compile()
+    factory = compiled.factory(IRoot)
+    config = Config()
+    session = Session()
+
+    with container.scope():
+        rows = [
+            [name, ns_per_call(fn, number=10_000)]
+            for name, fn in (
+                ("generic", lambda: container.get_concrete_instance(IRoot)),
+                ("compiled get", lambda: compiled.get(IRoot)),
+                ("compiled factory", factory),
+                ("hand-wired", lambda: hand_wired(config, session)),
+            )
+        ]
+
+    baseline = rows[-1][1]
+    print("Resolving a graph of 21 transients, 1 singleton and 1 scoped")
+    print_table(
+        ["path", "ns/resolve", "vs hand-wired"],
+        [row + [f"{row[1] / baseline:.2f}x"] for row in rows],
+    )
+
+
+if __name__ == "__main__":
+    main()
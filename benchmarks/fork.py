@@ -0,0 +1,94 @@
+import gc
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import Callable
+from typing import Protocol
+
+from benchmarks._timing import print_table
+from uncoupled.container import Container
+
+WORKERS = 4
+WORDS = 300_000
+
+
+class IVocabulary(Protocol): ...
+
+
+class Vocabulary(IVocabulary):
+    def __init__(self) -> None:
+        self.words = {f"word{i}": (i, str(i)) for i in range(WORDS)}
+
+
+def private_mb() -> float:
+    kb = 0
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                kb += int(line.split()[1])
+    return kb / 1024
+
+
+def in_process(fn: Callable[[], object]) -> object:
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        try:
+            os.write(write, json.dumps(fn()).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write)
+    with os.fdopen(read, "rb") as f:
+        result = json.loads(f.read())
+    os.waitpid(pid, 0)
+    return result
+
+
+def worker(container: Container) -> tuple[float, float]:
+    start = time.perf_counter()
+    container.get(IVocabulary)
+    seconds = time.perf_counter() - start
+    gc.collect()
+    return private_mb(), seconds
+
+
+def master(policy: str) -> list[tuple[float, float]]:
+    Container._delete_instance()
+    container = Container.create(log_level=logging.ERROR)
+    container.add_singleton(
+        IVocabulary, Vocabulary, fork="rebuild" if policy == "rebuild" else "share"
+    )
+    if policy == "share":
+        container.get(IVocabulary)
+    elif policy == "share + prefork":
+        container.prefork()
+    return [in_process(lambda: worker(container)) for _ in range(WORKERS)]
+
+
+def main() -> None:
+    if not hasattr(os, "fork") or not os.path.exists("/proc/self/smaps_rollup"):
+        print("Requires os.fork and /proc/self/smaps_rollup (Linux).")
+        sys.exit(1)
+
+    rows = []
+    baseline = None
+    for policy in ("rebuild", "share", "share + prefork"):
+        results = in_process(lambda: master(policy))
+        mb = sum(r[0] for r in results) / WORKERS
+        ms = sum(r[1] for r in results) / WORKERS * 1e3
+        baseline = mb if baseline is None else baseline
+        rows.append([policy, mb, baseline - mb, ms])
+
+    print(f"{WORKERS} forked workers, singleton holding {WORDS} entries")
+    print_table(
+        ["policy", "private MB/worker", "saved MB/worker", "first resolve (ms)"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import logging
+import tracemalloc
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from benchmarks._timing import ns_per_call, print_table
+from uncoupled.container import Container, DependsAll
+
+PLUGINS = 8
+
+
+class IMiddleware(Protocol):
+    def __call__(self, value: int) -> int: ...
+
+
+MIDDLEWARES = [
+    type(f"Middleware{i}", (), {"__call__": lambda self, value: value + 1})
+    for i in range(PLUGINS)
+]
+
+
+def peak_bytes(fn: Callable[[], Any]) -> int:
+    fn()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    Container._delete_instance()
+    container = Container.create(log_level=logging.ERROR)
+    for i, middleware in enumerate(MIDDLEWARES):
+        container.add_singleton(IMiddleware, middleware, marker=str(i))
+    markers = [str(i) for i in range(PLUGINS)]
+    middlewares = DependsAll(IMiddleware)
+
+    def by_hand() -> int:
+        value = 0
+        for middleware in [
+            container.get(IMiddleware, marker=marker) for marker in markers
+        ]:
+            value = middleware(value)
+        return value
+
+    def get_all() -> int:
+        value = 0
+        for middleware in container.get_all(IMiddleware):
+            value = middleware(value)
+        return value
+
+    def depends_all() -> int:
+        value = 0
+        for middleware in middlewares:
+            value = middleware(value)
+        return value
+
+    rows = [
+        [name, ns_per_call(fn, number=20_000), peak_bytes(fn)]
+        for name, fn in (
+            ("list built by hand", by_hand),
+            ("container.get_all", get_all),
+            ("DependsAll", depends_all),
+        )
+    ]
+    Container._delete_instance()
+
+    print(f"Running a chain of {PLUGINS} singleton middlewares")
+    print_table(["resolution", "ns/chain", "peak bytes"], rows)
+
+
+if __name__ == "__main__":
+    main()
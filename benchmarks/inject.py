@@ -0,0 +1,63 @@
+from typing import Protocol
+
+from benchmarks._timing import ns_per_call, print_table
+from uncoupled.container import Container, Depends
+from uncoupled.inject import inject
+
+
+class IService(Protocol):
+    def a(self) -> int: ...
+
+    def b(self) -> int: ...
+
+    def c(self) -> int: ...
+
+
+class Service(IService):
+    def a(self) -> int:
+        return 1
+
+    def b(self) -> int:
+        return 2
+
+    def c(self) -> int:
+        return 3
+
+
+def handler(svc: IService) -> int:
+    return svc.a() + svc.b() + svc.c()
+
+
+def proxy_handler(svc: IService = Depends(IService)) -> int:
+    return svc.a() + svc.b() + svc.c()
+
+
+@inject
+def injected_handler(svc: IService = Depends(IService)) -> int:
+    return svc.a() + svc.b() + svc.c()
+
+
+def main() -> None:
+    rows = []
+    for lifetime in ("singleton", "transient"):
+        container = Container.create()
+        getattr(container, f"add_{lifetime}")(IService, Service)
+        service = Service()
+
+        direct = ns_per_call(lambda: handler(service))
+        rows += [
+            [lifetime, name, ns, ns - direct]
+            for name, ns in (
+                ("direct", direct),
+                ("Depends proxy", ns_per_call(proxy_handler)),
+                ("@inject", ns_per_call(injected_handler)),
+            )
+        ]
+        Container._delete_instance()
+
+    print("A handler making three method calls on one dependency")
+    print_table(["lifetime", "path", "ns/call", "overhead (ns)"], rows)
+
+
+if __name__ == "__main__":
+    main()
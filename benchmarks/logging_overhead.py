@@ -0,0 +1,60 @@
+import io
+import logging
+from typing import Any
+
+from benchmarks._timing import ns_per_call, print_table
+from uncoupled.container import Container
+
+formatted = 0
+
+
+class CountingMeta(type):
+    def __repr__(cls) -> str:
+        global formatted
+        formatted += 1
+        return super().__repr__()
+
+
+class IService(metaclass=CountingMeta): ...
+
+
+class Service(IService):
+    def __repr__(self) -> str:
+        global formatted
+        formatted += 1
+        return "Service()"
+
+
+def count_formatting(container: Container, number: int) -> int:
+    global formatted
+    formatted = 0
+    for _ in range(number):
+        container.get_concrete_instance(IService)
+    return formatted
+
+
+def main() -> None:
+    container = Container.create().add_transient(IService, Service)
+    logging.getLogger("uncoupled").addHandler(logging.StreamHandler(io.StringIO()))
+
+    rows: list[list[Any]] = []
+    for level in (logging.WARNING, logging.DEBUG):
+        container.set_log_level(level)
+        number = 10_000
+        rows.append(
+            [
+                logging.getLevelName(level),
+                ns_per_call(lambda: container.get_concrete_instance(IService)),
+                count_formatting(container, number) / number,
+            ]
+        )
+
+    print_table(["level", "resolve (ns)", "reprs per resolve"], rows)
+
+    disabled_reprs = rows[0][2]
+    if disabled_reprs != 0:
+        raise SystemExit(f"Disabled logging formatted {disabled_reprs} reprs/resolve")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from typing import Protocol
+
+from benchmarks._timing import ns_per_call, print_table
+from uncoupled.container import Container
+from uncoupled.providers.provider import Registered
+
+
+class IPlugin(Protocol): ...
+
+
+class Plugin(IPlugin): ...
+
+
+def last(registered: list[Registered[IPlugin]]) -> Registered[IPlugin]:
+    return next(r for r in registered if r.marker == "last")
+
+
+def main() -> None:
+    rows = []
+    for implementations in (1, 10, 100, 1000):
+        container = Container.create()
+        for i in range(implementations - 1):
+            container.add_transient(IPlugin, Plugin, marker=str(i))
+        container.add_transient(IPlugin, Plugin, marker="last")
+        container.get(IPlugin)
+        concretes = container._lifetime_to_provider["transient"].registrations()[
+            IPlugin
+        ]
+
+        rows.append(
+            [
+                implementations,
+                ns_per_call(lambda: last(concretes).concrete(), number=10_000),
+                ns_per_call(lambda: container.get(IPlugin, last), number=10_000),
+                ns_per_call(
+                    lambda: container.get(IPlugin, marker="last"), number=10_000
+                ),
+            ]
+        )
+        Container._delete_instance()
+
+    print_table(
+        [
+            "implementations",
+            "resolver scan (ns)",
+            "memoized resolver (ns)",
+            "marker (ns)",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
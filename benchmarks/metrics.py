@@ -0,0 +1,39 @@
+import logging
+from typing import Protocol
+
+from benchmarks._timing import ns_per_call, print_table
+from uncoupled.container import Container
+from uncoupled.metrics import Metrics
+
+
+class IService(Protocol): ...
+
+
+class Service(IService): ...
+
+
+def main() -> None:
+    rows = []
+    for lifetime in ("transient", "singleton", "scoped"):
+        Container._delete_instance()
+        container = Container.create(log_level=logging.ERROR)
+        getattr(container, f"add_{lifetime}")(IService, Service)
+
+        with container.scope():
+            before = ns_per_call(lambda: container.get(IService))
+            metrics = Metrics()
+            container.observe(metrics)
+            enabled = ns_per_call(lambda: container.get(IService))
+            container.unobserve(metrics)
+            disabled = ns_per_call(lambda: container.get(IService))
+        rows.append([lifetime, before, enabled, disabled])
+
+    Container._delete_instance()
+    print_table(
+        ["lifetime", "never enabled (ns)", "enabled (ns)", "disabled again (ns)"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
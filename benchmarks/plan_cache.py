@@ -0,0 +1,72 @@
+import importlib
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks._timing import print_table
+from uncoupled.container import Container
+
+MODULES = 30
+SERVICES = 10
+REPEAT = 5
+
+
+def write_package(root: Path) -> None:
+    (root / "planned_app").mkdir()
+    (root / "planned_app" / "__init__.py").write_text("")
+    for m in range(MODULES):
+        lines = ["from typing import Protocol", ""]
+        for s in range(SERVICES):
+            lines += [f"class IService{s}(Protocol): ...", ""]
+        for s in range(SERVICES):
+            params = ", ".join(f"d{d}: IService{d}" for d in range(s))
+            lines += [
+                f"class Service{s}(IService{s}):",
+                f"    def __init__(self, {params}) -> None: ..."
+                if params
+                else "    def __init__(self) -> None: ...",
+                "",
+            ]
+        (root / "planned_app" / f"services{m}.py").write_text("\n".join(lines))
+
+
+def start(cache: Path | None) -> float:
+    Container._delete_instance()
+    started = time.perf_counter()
+    container = Container.create(log_level=logging.ERROR)
+    if cache is not None:
+        container.cache_plans(cache)
+    for m in range(MODULES):
+        module = importlib.import_module(f"planned_app.services{m}")
+        for s in range(SERVICES):
+            container.add_singleton(
+                getattr(module, f"IService{s}"), getattr(module, f"Service{s}")
+            )
+    container.warm_up(max_workers=1)
+    container.save_plans()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        write_package(Path(root))
+        sys.path.insert(0, root)
+        cache = Path(root) / "plans"
+        start(None)
+
+        rows = [
+            ["no cache", min(start(None) for _ in range(REPEAT)) * 1e3],
+            ["cold cache", start(cache) * 1e3],
+            ["warm cache", min(start(cache) for _ in range(REPEAT)) * 1e3],
+        ]
+        sys.path.remove(root)
+    Container._delete_instance()
+
+    print(f"{MODULES * SERVICES} singletons with type-hinted constructors")
+    print_table(["startup", "register + warm up (ms)"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import logging
+import threading
+import time
+from typing import Protocol
+
+from benchmarks._timing import print_table
+from uncoupled.container import Container
+
+constructions = 0
+
+
+class ICodec(Protocol): ...
+
+
+class Codec(ICodec):
+    def __init__(self) -> None:
+        global constructions
+        time.sleep(0.001)
+        constructions += 1
+
+
+def run(lifetime: str, threads: int, requests: int) -> list[object]:
+    global constructions
+    Container._delete_instance()
+    container = Container.create(log_level=logging.ERROR)
+    if lifetime == "pooled":
+        container.add_pooled(ICodec, Codec, size=4)
+    else:
+        container.add_transient(ICodec, Codec)
+
+    def worker() -> None:
+        for _ in range(requests):
+            with container.scope():
+                container.get(ICodec)
+
+    constructions = 0
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    seconds = time.perf_counter() - start
+
+    row: list[object] = [lifetime, constructions, threads * requests / seconds]
+    if lifetime == "pooled":
+        stats = container.pool_stats(ICodec)
+        row += [stats.exhausted, stats.max_wait_seconds * 1e3]
+    else:
+        row += ["-", "-"]
+    return row
+
+
+def main() -> None:
+    rows = [run(lifetime, 8, 200) for lifetime in ("transient", "pooled")]
+    Container._delete_instance()
+    print("8 threads, 200 scopes each, 1ms constructor, pool of 4")
+    print_table(
+        ["lifetime", "constructions", "scopes/s", "exhausted", "max wait (ms)"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import gc
+import logging
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Protocol
+
+from benchmarks._timing import print_table
+from uncoupled.container import Container
+
+SIZES = (1_000, 10_000, 100_000)
+BASELINE_BYTES_PER_REGISTRATION = {1_000: 909.9, 10_000: 857.8, 100_000: 994.7}
+
+
+def classes(n: int) -> tuple[list[type], list[type]]:
+    interfaces = [type(f"IService{i}", (Protocol,), {}) for i in range(n)]
+    concretes = [
+        type(f"Service{i}", (interface,), {})
+        for interface, i in zip(interfaces, range(n))
+    ]
+    return interfaces, concretes
+
+
+def one_by_one(interfaces: list[type], concretes: list[type]) -> Container:
+    container = Container.create(log_level=logging.ERROR)
+    for interface, concrete in zip(interfaces, concretes):
+        container.add_singleton(interface, concrete, marker="primary")
+    return container
+
+
+def bulk(interfaces: list[type], concretes: list[type]) -> Container:
+    return Container.create(log_level=logging.ERROR).register_many(
+        "singleton",
+        [
+            (interface, concrete, "primary")
+            for interface, concrete in zip(interfaces, concretes)
+        ],
+    )
+
+
+def measure(
+    register: Callable[[list[type], list[type]], Container],
+    interfaces: list[type],
+    concretes: list[type],
+) -> tuple[float, float, float]:
+    Container._delete_instance()
+    gc.collect()
+    start = time.perf_counter()
+    container = register(interfaces, concretes)
+    seconds = time.perf_counter() - start
+
+    gc.collect()
+    start = time.perf_counter()
+    container.get(interfaces[0])
+    first = time.perf_counter() - start
+
+    Container._delete_instance()
+    del container
+    tracemalloc.start()
+    container = register(interfaces, concretes)
+    container._get_index()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    Container._delete_instance()
+    return seconds, first, size
+
+
+def main() -> None:
+    rows = []
+    for n in SIZES:
+        interfaces, concretes = classes(n)
+        for name, register in (("add_singleton", one_by_one), ("register_many", bulk)):
+            seconds, first, size = measure(register, interfaces, concretes)
+            rows.append(
+                [
+                    n,
+                    name,
+                    seconds / n * 1e6,
+                    size / n,
+                    f"{size / n / BASELINE_BYTES_PER_REGISTRATION[n]:.2f}x",
+                    size / 2**20,
+                    first * 1e3,
+                ]
+            )
+
+    print_table(
+        [
+            "registrations",
+            "path",
+            "us/registration",
+            "bytes/registration",
+            "vs baseline",
+            "total MiB",
+            "first resolve (ms)",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+from typing import Protocol
+
+from benchmarks._timing import ns_per_call, print_table
+from uncoupled.container import Container
+from uncoupled.exception import ResolverError, UnregisteredInterfaceError
+from uncoupled.lifetime import Lifetime
+
+
+class ITransient(Protocol): ...
+
+
+class ISingleton(Protocol): ...
+
+
+class IScoped(Protocol): ...
+
+
+class Impl: ...
+
+
+def scan_resolve[I](container: Container, interface: type[I]) -> I:
+    # Resolution as it was done before the registry index: walk every provider
+    # and rely on `UnregisteredInterfaceError` to move on to the next one.
+    for provider in container._lifetime_to_provider.values():
+        try:
+            concrete = provider.get(interface)
+            container._logger.debug(
+                f"Resolved {interface} to {concrete} with {provider.__class__.__name__}"
+            )
+            return concrete
+        except (UnregisteredInterfaceError, ResolverError):
+            pass
+
+    raise UnregisteredInterfaceError(interface)
+
+
+def main() -> None:
+    container = (
+        Container.create(get_scope=lambda: 0)
+        .add_transient(ITransient, Impl)
+        .add_singleton(ISingleton, Impl)
+        .add_scoped(IScoped, Impl)
+    )
+
+    interfaces: dict[Lifetime, type] = {
+        "transient": ITransient,
+        "singleton": ISingleton,
+        "scoped": IScoped,
+    }
+
+    rows = []
+    for lifetime, interface in interfaces.items():
+        before = ns_per_call(lambda: scan_resolve(container, interface))
+        after = ns_per_call(lambda: container.get_concrete_instance(interface))
+        rows.append([lifetime, before, after, f"{before / after:.2f}x"])
+
+    print_table(["lifetime", "scan (ns)", "index (ns)", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
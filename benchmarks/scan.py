@@ -0,0 +1,94 @@
+import importlib
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks._timing import print_table
+from uncoupled.container import Container
+
+MODULES = 50
+SERVICES = 5
+IMPORT_SECONDS = 0.005
+
+
+def write_package(root: Path) -> None:
+    (root / "scan_app" / "services").mkdir(parents=True)
+    (root / "scan_app" / "__init__.py").write_text("")
+    (root / "scan_app" / "services" / "__init__.py").write_text("")
+    (root / "scan_app" / "ports.py").write_text(
+        "from typing import Protocol\n"
+        + "".join(
+            f"class IService{m}_{s}(Protocol): ...\n"
+            for m in range(MODULES)
+            for s in range(SERVICES)
+        )
+    )
+    for m in range(MODULES):
+        lines = [
+            "import time",
+            "from uncoupled.scan import singleton",
+            "from scan_app import ports",
+            f"time.sleep({IMPORT_SECONDS})",
+        ]
+        for s in range(SERVICES):
+            lines += [
+                f"@singleton(ports.IService{m}_{s})",
+                f"class Service{s}(ports.IService{m}_{s}): ...",
+            ]
+        (root / "scan_app" / "services" / f"module{m}.py").write_text(
+            "\n".join(lines) + "\n"
+        )
+
+
+def fresh() -> Container:
+    Container._delete_instance()
+    for name in [n for n in sys.modules if n.startswith("scan_app")]:
+        del sys.modules[name]
+    return Container.create(log_level=logging.ERROR)
+
+
+def eager() -> list[object]:
+    container = fresh()
+    before = len(sys.modules)
+    start = time.perf_counter()
+    ports = importlib.import_module("scan_app.ports")
+    for m in range(MODULES):
+        module = importlib.import_module(f"scan_app.services.module{m}")
+        for s in range(SERVICES):
+            container.add_singleton(
+                getattr(ports, f"IService{m}_{s}"), getattr(module, f"Service{s}")
+            )
+    seconds = time.perf_counter() - start
+    return ["eager imports", seconds * 1e3, len(sys.modules) - before]
+
+
+def scanned(name: str, cache: Path | None) -> list[object]:
+    report = fresh().scan("scan_app.services", cache=cache)
+    return [name, report.seconds * 1e3, len(report.imported)]
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        write_package(Path(root))
+        sys.path.insert(0, root)
+        cache = Path(root) / "discovery"
+        rows = [
+            eager(),
+            scanned("scan", None),
+            scanned("scan, cold cache", cache),
+            scanned("scan, warm cache", cache),
+        ]
+        sys.path.remove(root)
+    Container._delete_instance()
+
+    print(
+        f"{MODULES} modules of {SERVICES} services, "
+        f"each taking {IMPORT_SECONDS * 1e3:.0f}ms to import"
+    )
+    print_table(["registration", "startup (ms)", "modules imported"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+from collections.abc import Callable, Hashable
+from typing import Any, Protocol
+
+from benchmarks._timing import print_table
+from uncoupled.providers.provider import Registered
+from uncoupled.providers.scoped import ScopedProvider
+
+constructions = 0
+
+
+class IService(Protocol): ...
+
+
+class Service(IService):
+    def __init__(self) -> None:
+        global constructions
+        constructions += 1
+
+
+class SingleSlotScopedProvider(ScopedProvider):
+    # Scoped resolution as it was done before the multi-scope cache: a single
+    # `current_scope`/`current_instance` slot per registration.
+    def __init__(self, *, get_scope: Callable[[], Hashable]) -> None:
+        super().__init__(get_scope=get_scope)
+        self._slots: dict[Registered[Any], tuple[Hashable, Any]] = {}
+
+    def get_instance[T](self, registered: Registered[T]) -> T:
+        scope = self._get_scope()
+        slot = self._slots.get(registered)
+        if slot is None or slot[0] != scope:
+            slot = self._slots[registered] = (scope, registered.concrete())
+        return slot[1]
+
+
+def count_constructions(
+    make_provider: Callable[[Callable[[], Hashable]], ScopedProvider],
+    scopes: int,
+    rounds: int,
+) -> int:
+    global constructions
+    current = [0]
+    provider = make_provider(lambda: current[0])
+    provider.register(IService, Service)
+
+    constructions = 0
+    for _ in range(rounds):
+        for scope in range(scopes):
+            current[0] = scope
+            provider.get(IService)
+    return constructions
+
+
+def main() -> None:
+    rounds = 100
+    rows = []
+    for scopes in (1, 4, 16, 64, 256):
+        rows.append(
+            [
+                scopes,
+                count_constructions(
+                    lambda get_scope: SingleSlotScopedProvider(get_scope=get_scope),
+                    scopes,
+                    rounds,
+                ),
+                count_constructions(
+                    lambda get_scope: ScopedProvider(get_scope=get_scope),
+                    scopes,
+                    rounds,
+                ),
+                count_constructions(
+                    lambda get_scope: ScopedProvider(
+                        get_scope=get_scope, max_scopes=32
+                    ),
+                    scopes,
+                    rounds,
+                ),
+            ]
+        )
+
+    print(f"Constructions for {rounds} round-robin rounds over interleaved scopes")
+    print_table(["scopes", "single slot", "multi-scope", "multi-scope (max 32)"], rows)
+
+
+if __name__ == "__main__":
+    main()
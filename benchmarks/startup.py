@@ -0,0 +1,71 @@
+import importlib
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Protocol
+
+from benchmarks._timing import print_table
+from uncoupled.container import Container
+from uncoupled.usage import UsageTracker
+
+MODULES = 20
+IMPORT_SECONDS = 0.02
+
+INTERFACES = [type(f"IService{i}", (Protocol,), {}) for i in range(MODULES)]
+
+
+def write_package(root: Path, name: str) -> None:
+    (root / name).mkdir()
+    (root / name / "__init__.py").write_text("")
+    for i in range(MODULES):
+        (root / name / f"service{i}.py").write_text(
+            f"import time\ntime.sleep({IMPORT_SECONDS})\nclass Service: ...\n"
+        )
+
+
+def register(package: str, eager: bool) -> tuple[Container, float]:
+    Container._delete_instance()
+    start = time.perf_counter()
+    container = Container.create(log_level=logging.ERROR)
+    for i, interface in enumerate(INTERFACES):
+        path = f"{package}.service{i}:Service"
+        if eager:
+            module = importlib.import_module(f"{package}.service{i}")
+            container.add_singleton(interface, module.Service)
+        else:
+            container.add_singleton(interface, path)
+    return container, time.perf_counter() - start
+
+
+def main() -> None:
+    rows = []
+    with tempfile.TemporaryDirectory() as root:
+        sys.path.insert(0, root)
+        for package, eager in (("eager_app", True), ("lazy_app", False)):
+            write_package(Path(root), package)
+            container, startup = register(package, eager)
+            usage = UsageTracker()
+            container.observe(usage)
+
+            start = time.perf_counter()
+            container.get(INTERFACES[0])
+            first = time.perf_counter() - start
+            rows.append(
+                [
+                    "eager" if eager else "lazy",
+                    startup * 1e3,
+                    first * 1e3,
+                    len(usage.unused(container)),
+                ]
+            )
+        sys.path.remove(root)
+    Container._delete_instance()
+
+    print(f"{MODULES} modules taking {IMPORT_SECONDS * 1e3:.0f}ms each to import")
+    print_table(["registration", "startup (ms)", "first resolve (ms)", "unused"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Hashable
+from datetime import UTC, datetime
+from importlib import metadata
+from typing import Any, Protocol
+
+from benchmarks._timing import ns_per_call, print_table
+from uncoupled.container import Container, Depends
+from uncoupled.providers.provider import Registered
+from uncoupled.providers.scoped import ScopedProvider
+
+LIFETIMES = ("transient", "singleton", "scoped")
+HIGHER_IS_BETTER = {"resolves/s"}
+NOT_COMPARED = (".direct",)
+REPEATS = 5
+RUNS = 5
+
+
+class IService(Protocol):
+    def ping(self) -> int: ...
+
+
+class Service(IService):
+    constructions = 0
+
+    def __init__(self) -> None:
+        Service.constructions += 1
+
+    def ping(self) -> int:
+        return 1
+
+
+class IPlugin(Protocol): ...
+
+
+class Plugin(IPlugin): ...
+
+
+def last_registered(registered: list[Registered[IPlugin]]) -> Registered[IPlugin]:
+    return registered[-1]
+
+
+type Results = dict[str, dict[str, Any]]
+
+
+def record(results: Results, name: str, value: float, unit: str) -> None:
+    results[name] = {"value": round(value, 3), "unit": unit}
+
+
+def new_container() -> Container:
+    Container._delete_instance()
+    return Container.create(log_level=logging.ERROR)
+
+
+def container_for(lifetime: str) -> Container:
+    container = new_container()
+    getattr(container, f"add_{lifetime}")(IService, Service)
+    return container
+
+
+def resolves_per_second(results: Results, number: int) -> None:
+    for lifetime in LIFETIMES:
+        container = container_for(lifetime)
+        with container.scope():
+            ns = ns_per_call(
+                lambda: container.get_concrete_instance(IService), number=number
+            )
+        record(results, f"resolve.{lifetime}", 1e9 / ns, "resolves/s")
+
+
+def allocations_per_resolve(results: Results, number: int) -> None:
+    for lifetime in LIFETIMES:
+        container = container_for(lifetime)
+        with container.scope():
+            container.get_concrete_instance(IService)
+            instances: list[Any] = [None] * number
+
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            for i in range(number):
+                instances[i] = container.get_concrete_instance(IService)
+            after = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            container.get_concrete_instance(IService)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        stats = after.compare_to(before, "filename")
+        record(
+            results,
+            f"allocations.{lifetime}.retained_blocks",
+            sum(s.count_diff for s in stats) / number,
+            "blocks",
+        )
+        record(results, f"allocations.{lifetime}.peak_bytes", peak - current, "bytes")
+
+
+def proxy_overhead(results: Results, number: int) -> None:
+    def through_proxy(service: IService = Depends(IService)) -> int:
+        return service.ping()
+
+    def direct(service: IService) -> int:
+        return service.ping()
+
+    for lifetime in LIFETIMES:
+        container = container_for(lifetime)
+        with container.scope():
+            service = container.get_concrete_instance(IService)
+            baseline = ns_per_call(lambda: direct(service), number=number)
+            proxied = ns_per_call(through_proxy, number=number)
+        record(results, f"proxy.{lifetime}.direct", baseline, "ns")
+        record(results, f"proxy.{lifetime}.overhead", proxied - baseline, "ns")
+
+
+def scoped_interleaving(results: Results, rounds: int) -> None:
+    for scopes in (1, 16, 256):
+        for max_scopes in (32, 1024):
+            current = [0]
+            provider = ScopedProvider(
+                get_scope=lambda: current[0], max_scopes=max_scopes
+            )
+            provider.register(IService, Service)
+
+            Service.constructions = 0
+            for _ in range(rounds):
+                for scope in range(scopes):
+                    current[0] = scope
+                    provider.get(IService)
+            record(
+                results,
+                f"scoped.interleaved.{scopes}_scopes.max_{max_scopes}",
+                Service.constructions,
+                "constructions",
+            )
+
+
+def many_implementations(results: Results, number: int) -> None:
+    for implementations in (10, 100, 1000):
+        container = new_container()
+        for i in range(implementations):
+            container.add_transient(IPlugin, Plugin, marker=str(i))
+        last = str(implementations - 1)
+
+        record(
+            results,
+            f"lookup.{implementations}_implementations.marker",
+            ns_per_call(lambda: container.get(IPlugin, marker=last), number=number),
+            "ns",
+        )
+        record(
+            results,
+            f"lookup.{implementations}_implementations.resolver",
+            ns_per_call(
+                lambda: container.get(IPlugin, last_registered),
+                number=number,
+            ),
+            "ns",
+        )
+
+
+def contention(container: Container, threads: int, per_thread: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        with container.scope():
+            barrier.wait()
+            for _ in range(per_thread):
+                container.get_concrete_instance(IService)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    return threads * per_thread / (time.perf_counter() - start)
+
+
+def thread_contention(results: Results, number: int) -> None:
+    for lifetime in LIFETIMES:
+        container = container_for(lifetime)
+        for threads in (1, 4, 16):
+            record(
+                results,
+                f"threads.{lifetime}.{threads}",
+                max(
+                    contention(container, threads, number // threads)
+                    for _ in range(REPEATS)
+                ),
+                "resolves/s",
+            )
+
+
+def run(quick: bool) -> Results:
+    number = 10_000 if quick else 100_000
+    results: Results = {}
+    resolves_per_second(results, number)
+    allocations_per_resolve(results, number // 10)
+    proxy_overhead(results, number)
+    scoped_interleaving(results, 10 if quick else 100)
+    many_implementations(results, number // 10)
+    thread_contention(results, number)
+    Container._delete_instance()
+    return results
+
+
+def run_many(quick: bool, runs: int) -> Results:
+    samples: dict[str, list[float]] = {}
+    units: dict[str, str] = {}
+    for _ in range(runs):
+        for name, result in run(quick).items():
+            samples.setdefault(name, []).append(result["value"])
+            units[name] = result["unit"]
+
+    results: Results = {}
+    for name, values in samples.items():
+        median = statistics.median(values)
+        results[name] = {
+            "value": round(median, 3),
+            "unit": units[name],
+            "spread": round((max(values) - min(values)) / abs(median), 3)
+            if median
+            else 0.0,
+            "runs": len(values),
+        }
+    return results
+
+
+def environment() -> dict[str, Hashable]:
+    try:
+        version = metadata.version("uncoupled")
+    except metadata.PackageNotFoundError:
+        version = None
+    return {
+        "uncoupled": version,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "date": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+
+
+def regressions(
+    results: Results, baseline: Results, threshold: float
+) -> list[list[Any]]:
+    rows = []
+    for name, result in results.items():
+        if name.endswith(NOT_COMPARED):
+            continue
+        previous = baseline.get(name)
+        if previous is None or not previous["value"] or not result["value"]:
+            continue
+
+        ratio = result["value"] / previous["value"]
+        if result["unit"] in HIGHER_IS_BETTER:
+            ratio = 1 / ratio
+        tolerance = max(
+            threshold, result.get("spread", 0.0), previous.get("spread", 0.0)
+        )
+        if ratio > 1 + tolerance:
+            rows.append(
+                [name, previous["value"], result["value"], f"{ratio:.2f}x worse"]
+            )
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the uncoupled benchmark suite.")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.3,
+        help="relative slowdown reported as a regression when it also exceeds "
+        "the run-to-run spread of either run (default: 0.3)",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=RUNS,
+        help=f"runs of the suite whose median is reported (default: {RUNS})",
+    )
+    parser.add_argument("--quick", action="store_true", help="fewer iterations")
+    args = parser.parse_args()
+
+    results = run_many(args.quick, args.runs)
+    print_table(
+        ["benchmark", "median", "unit", "spread"],
+        [
+            [name, r["value"], r["unit"], f"{r['spread']:.0%}"]
+            for name, r in results.items()
+        ],
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        rows = regressions(results, baseline, args.threshold)
+        if rows:
+            print()
+            print_table(["regression", "baseline", "current", "change"], rows)
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+import asyncio
+import logging
+from typing import Protocol
+
+from benchmarks._timing import ns_per_call, print_table
+from uncoupled.container import Container
+
+
+class IClient(Protocol): ...
+
+
+class Client(IClient):
+    def __init__(self) -> None:
+        self.buffer = bytearray(4096)
+
+
+def main() -> None:
+    rows = []
+    for lifetime in ("transient", "singleton", "thread_local", "task_local"):
+        Container._delete_instance()
+        container = Container.create(log_level=logging.ERROR)
+        getattr(container, f"add_{lifetime}")(IClient, Client)
+
+        async def in_task() -> float:
+            return ns_per_call(lambda: container.get(IClient))
+
+        rows.append(
+            [
+                lifetime,
+                ns_per_call(lambda: container.get(IClient)),
+                asyncio.run(in_task()),
+            ]
+        )
+    Container._delete_instance()
+
+    print_table(["lifetime", "thread (ns)", "asyncio task (ns)"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import threading
+import time
+from typing import Protocol
+
+from benchmarks._timing import print_table
+from uncoupled.container import Container
+
+constructions = 0
+
+
+class ISingleton(Protocol): ...
+
+
+class IScoped(Protocol): ...
+
+
+class ConnectionPool(ISingleton):
+    def __init__(self) -> None:
+        global constructions
+        time.sleep(0.05)
+        constructions += 1
+
+
+class Session(IScoped): ...
+
+
+def hammer(
+    container: Container, interface: type, threads: int, per_thread: int
+) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        with container.scope():
+            barrier.wait()
+            for _ in range(per_thread):
+                container.get_concrete_instance(interface)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    return threads * per_thread / (time.perf_counter() - start)
+
+
+def main() -> None:
+    container = (
+        Container.create()
+        .add_singleton(ISingleton, ConnectionPool)
+        .add_scoped(IScoped, Session)
+    )
+
+    cold = hammer(container, ISingleton, 16, 1)
+    print(f"Cold singleton built {constructions} time(s) by 16 threads ({cold:.0f}/s)")
+
+    rows = []
+    for interface in (ISingleton, IScoped):
+        baseline = None
+        for threads in (1, 4, 16):
+            throughput = hammer(container, interface, threads, 200_000 // threads)
+            baseline = baseline or throughput
+            rows.append(
+                [
+                    interface.__name__,
+                    threads,
+                    f"{throughput:,.0f}",
+                    f"{throughput / baseline:.2f}x",
+                ]
+            )
+
+    print_table(["interface", "threads", "resolves/s", "scaling"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,15 +25,16 @@ class SecondImplementation(Interface):
 
 def run(
     foo_first_impl: Interface = Depends(Interface),
-    foo_second_impl: Interface = Depends(
-        Interface,
-        resolver=lambda registered: next(
-            impl for impl in registered if impl.marker == "multi"
-        ),
+    # Select an implementation by its marker
+    foo_second_impl: Interface = Depends(Interface, marker="multi"),
+    # Or pick one from the registered implementations with a custom resolver
+    foo_last_impl: Interface = Depends(
+        Interface, resolver=lambda registered: registered[-1]
     ),
 ) -> None:
     print(foo_first_impl.foo(10))  # Should return 42 + 10 = 52
     print(foo_second_impl.foo(10))  # Should return 51 * 10 = 510
+    print(foo_last_impl.foo(10))  # Should return 51 * 10 = 510
 
 
 if __name__ == "__main__":
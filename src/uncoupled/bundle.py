@@ -0,0 +1,40 @@
+from collections.abc import Callable
+from typing import Any
+
+from uncoupled.container import Container
+
+
+class Bundle:
+    def __init__(self, *interfaces: type) -> None:
+        self._interfaces = interfaces
+        self._cache: (
+            tuple[Container, int, Callable[[], tuple[Any, ...]], bool] | None
+        ) = None
+
+    def _resolver(self, container: Container) -> tuple[Callable[[], Any], bool]:
+        cache = self._cache
+        if (
+            cache is None
+            or cache[0] is not container
+            or cache[1] != container._generation
+        ):
+            cache = self._cache = (
+                container,
+                container._generation,
+                *container._bundle(self._interfaces),
+            )
+        return cache[2], cache[3]
+
+    def resolve(self) -> tuple[Any, ...]:
+        container = Container._get_instance()
+        if container._observers:
+            return container.get_many(*self._interfaces)
+        return self._resolver(container)[0]()
+
+    async def aresolve(self) -> tuple[Any, ...]:
+        container = Container._get_instance()
+        if not container._observers:
+            resolve, is_async = self._resolver(container)
+            if not is_async:
+                return resolve()
+        return await container.aget_many(*self._interfaces)
@@ -0,0 +1,218 @@
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any
+
+from uncoupled.exception import (
+    AsyncRegistrationError,
+    CircularDependencyError,
+    OutdatedCompilationError,
+    UnregisteredInterfaceError,
+)
+from uncoupled.lazy import load
+from uncoupled.providers.provider import Marker, Provider, Registered
+
+if TYPE_CHECKING:
+    from uncoupled.container import Container
+
+
+class CompiledContainer:
+    def __init__(
+        self,
+        container: "Container",
+        factories: dict[Hashable, Callable[[], Any]],
+        source: str,
+    ) -> None:
+        self._container = container
+        self._generation = container._generation
+        self._factories = factories
+        self.source = source
+
+    def get[I](self, interface: type[I], marker: Marker | None = None) -> I:
+        if self._container._generation != self._generation:
+            raise OutdatedCompilationError()
+        return self._factories[interface if marker is None else (interface, marker)]()
+
+    def factory[I](
+        self, interface: type[I], marker: Marker | None = None
+    ) -> Callable[[], I]:
+        if self._container._generation != self._generation:
+            raise OutdatedCompilationError()
+        return self._factories[interface if marker is None else (interface, marker)]
+
+
+class _Compiler:
+    def __init__(self, container: "Container") -> None:
+        self._container = container
+        self._index = container._get_index()
+        self._namespace: dict[str, Any] = {
+            "get": container.get_concrete_instance,
+            "get_scope": container._get_scope,
+        }
+        self._names: dict[int, str] = {}
+        self._scoped_functions: dict[Registered[Any], str] = {}
+        self._lines: list[str] = []
+        self.is_async = False
+
+    def compile(self) -> CompiledContainer:
+        entries: dict[Hashable, str] = {}
+        for key, (provider, registered) in self._index.items():
+            name = f"make_{len(entries)}"
+            scoped: dict[str, str] = {}
+            expression = self._expression(provider, registered, (), scoped)
+            self._function(name, scoped, [], expression)
+            entries[key] = name
+
+        self._exec("<uncoupled-compiled>")
+        factories = {key: self._namespace[name] for key, name in entries.items()}
+        return CompiledContainer(self._container, factories, self._source())
+
+    def bundle(self, keys: tuple[Hashable, ...]) -> Callable[[], tuple[Any, ...]]:
+        scoped: dict[str, str] = {}
+        shared: dict[Registered[Any], str] = {}
+        statements: list[str] = []
+        expressions: list[str] = []
+        for key in keys:
+            entry = self._index.get(key)
+            if entry is None:
+                interface, marker = key if isinstance(key, tuple) else (key, None)
+                raise UnregisteredInterfaceError(interface, marker)
+            expressions.append(self._expression(*entry, (), scoped, shared, statements))
+
+        self._function(
+            "bundle", scoped, statements, f"({''.join(e + ', ' for e in expressions)})"
+        )
+        self._exec("<uncoupled-bundle>")
+        return self._namespace["bundle"]
+
+    def _function(
+        self,
+        name: str,
+        scoped: dict[str, str],
+        statements: list[str],
+        expression: str,
+    ) -> None:
+        self._lines.append(f"def {name}():")
+        if scoped:
+            self._lines.append("    scope = get_scope()")
+            self._lines += [
+                f"    {local} = {function}(scope)" for function, local in scoped.items()
+            ]
+        self._lines += [f"    {statement}" for statement in statements]
+        self._lines += [f"    return {expression}", ""]
+
+    def _source(self) -> str:
+        return "\n".join(self._lines)
+
+    def _exec(self, filename: str) -> None:
+        exec(compile(self._source(), filename, "exec"), self._namespace)
+
+    def _constant(self, value: Any, prefix: str) -> str:
+        name = self._names.get(id(value))
+        if name is None:
+            name = self._names[id(value)] = f"{prefix}_{len(self._names)}"
+            self._namespace[name] = value
+        return name
+
+    def _expression(
+        self,
+        provider: Provider,
+        registered: Registered[Any],
+        chain: tuple[Registered[Any], ...],
+        scoped: dict[str, str],
+        shared: dict[Registered[Any], str] | None = None,
+        statements: list[str] | None = None,
+    ) -> str:
+        if registered.lifetime == "singleton":
+            try:
+                return self._constant(provider.get_instance(registered), "singleton")
+            except AsyncRegistrationError:
+                self.is_async = True
+                return self._provider_call(provider, registered)
+
+        concrete = load(registered)
+        self.is_async |= registered.is_async
+        if registered.is_async or registered.lifetime not in ("transient", "scoped"):
+            return self._provider_call(provider, registered)
+
+        if registered.lifetime == "scoped":
+            function = self._scoped_function(provider, registered)
+            return scoped.setdefault(function, f"{function}_instance")
+
+        if shared is not None and registered in shared:
+            return shared[registered]
+
+        if registered in chain:
+            raise CircularDependencyError(
+                [r.concrete for r in chain] + [registered.concrete]
+            )
+
+        plan = self._container._plan(concrete)
+        arguments: list[str] = []
+        for dependency in plan.dependencies:
+            interface = self._constant(dependency.interface, "interface")
+            if dependency.resolver is not None:
+                resolver = self._constant(dependency.resolver, "resolver")
+                arguments.append(f"{dependency.name}=get({interface}, {resolver})")
+                continue
+
+            marker = dependency.marker
+            entry = self._index.get(
+                dependency.interface
+                if marker is None
+                else (dependency.interface, marker)
+            )
+            if entry is None:
+                if not dependency.optional:
+                    arguments.append(
+                        f"{dependency.name}=get({interface}, None, {marker!r})"
+                    )
+                continue
+
+            expression = self._expression(
+                *entry, chain + (registered,), scoped, shared, statements
+            )
+            arguments.append(f"{dependency.name}={expression}")
+
+        expression = f"{self._constant(concrete, 'concrete')}({', '.join(arguments)})"
+        if shared is None or statements is None:
+            return expression
+
+        local = shared[registered] = f"shared_{len(shared)}"
+        statements.append(f"{local} = {expression}")
+        return local
+
+    def _provider_call(self, provider: Provider, registered: Registered[Any]) -> str:
+        get_instance = self._constant(provider.get_instance, "get_instance")
+        return f"{get_instance}({self._constant(registered, 'registered')})"
+
+    def _scoped_function(self, provider: Provider, registered: Registered[Any]) -> str:
+        name = self._scoped_functions.get(registered)
+        if name is not None:
+            return name
+
+        name = self._scoped_functions[registered] = (
+            f"scoped_{len(self._scoped_functions)}"
+        )
+        key = self._constant(registered, "registered")
+        scopes = self._constant(provider._scope_to_instances, "scopes")  # type: ignore[attr-defined]
+        self._lines += [
+            f"def {name}(scope):",
+            f"    instances = {scopes}.get(scope)",
+            "    if instances is not None:",
+            f"        instance = instances.get({key})",
+            "        if instance is not None:",
+            "            return instance",
+            f"    return {self._provider_call(provider, registered)}",
+            "",
+        ]
+        return name
+
+
+def compile_container(container: "Container") -> CompiledContainer:
+    return _Compiler(container).compile()
+
+
+def compile_bundle(
+    container: "Container", keys: tuple[Hashable, ...]
+) -> tuple[Callable[[], tuple[Any, ...]], bool]:
+    compiler = _Compiler(container)
+    return compiler.bundle(keys), compiler.is_async
@@ -1,18 +1,54 @@
-from collections.abc import Callable, Hashable
+import atexit
+import os
+import sys
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from weakref import WeakSet
 from typing import TYPE_CHECKING, Any, Self, cast
-from uncoupled.lifetime import Lifetime
+from uncoupled.compiler import CompiledContainer, compile_bundle, compile_container
+from uncoupled.fork import aprefork, prefork, track
+from uncoupled.lazy import LazyConcrete, import_path, lazy, load
+from uncoupled.lifetime import ForkPolicy, Lifetime
+from uncoupled.observer import Observer
+from uncoupled.plan_cache import PlanCache
+from uncoupled.scan import ScanReport, scan
 
 from uncoupled.exception import (
+    AsyncRegistrationError,
     ContainerAlreadyCreatedError,
     ContainerNotCreatedError,
     ResolverError,
     UnregisteredInterfaceError,
 )
-from uncoupled.providers.provider import Provider, Marker, Resolver
-from uncoupled.providers.scoped import ScopedProvider
+from uncoupled.providers.provider import (
+    Marker,
+    Provider,
+    Registered,
+    Resolver,
+    constructing,
+    enter_construction,
+    warn_multiple_concretes,
+)
+from uncoupled.providers.registry import Registry
+from uncoupled.providers.pooled import DEFAULT_POOL_SIZE, PooledProvider, PoolStats
+from uncoupled.providers.scoped import DEFAULT_MAX_SCOPES, ScopedProvider
 from uncoupled.providers.singleton import SingletonProvider
+from uncoupled.providers.task_local import TaskLocalProvider
+from uncoupled.providers.thread_local import ThreadLocalProvider
 from uncoupled.providers.transient import TransientProvider
+from uncoupled.scope import Scope, current_scope
+from uncoupled.warm_up import WarmUpReport, awarm_up, warm_up
+from uncoupled.wiring import ConstructionPlan, make_plan
 import logging
 
 if TYPE_CHECKING:
@@ -31,26 +67,138 @@ def _default_get_scope() -> None:
     return None
 
 
+class _OverlayIndex(dict[Hashable, tuple[Provider, Registered[Any]]]):
+    def __init__(
+        self,
+        container: "Container",
+        entries: dict[Hashable, tuple[Provider, Registered[Any]]],
+    ) -> None:
+        super().__init__(entries)
+        self._container = container
+        self._parent = cast("Container", container._parent)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = dict.get(self, key)
+        if entry is None:
+            entry = self._parent._get_index().get(key)
+            if entry is None:
+                return default
+            entry = self._container._inherited(entry)
+            dict.__setitem__(self, key, entry)
+        return entry
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self._parent._get_index()
+
+    def items(self) -> Any:
+        for key, entry in self._parent._get_index().items():
+            if not dict.__contains__(self, key):
+                dict.__setitem__(self, key, self._container._inherited(entry))
+        return dict.items(self)
+
+
+_SHARED_WITH_CHILDREN = frozenset(("singleton", "pooled"))
+MAX_RESOLVED = 1024
+
+_active_container: ContextVar["Container | None"] = ContextVar(
+    "uncoupled_active_container", default=None
+)
+
+
 class Container:
     _instance: "Container | None" = None
 
     @staticmethod
     def _get_instance() -> "Container":
-        if Container._instance is None:
+        container = _active_container.get() or Container._instance
+        if container is None:
             raise ContainerNotCreatedError()
 
-        return Container._instance
+        return container
 
-    def __init__(self, get_scope: Callable[[], Hashable], log_level: "_Level") -> None:
+    def __init__(
+        self,
+        get_scope: Callable[[], Hashable],
+        log_level: "_Level",
+        max_scopes: int,
+        parent: "Container | None" = None,
+    ) -> None:
         self._logger = logging.getLogger("uncoupled")
         self._logger.setLevel(log_level)
-
+        self._debug = self._logger.isEnabledFor(logging.DEBUG)
+        self._warned: set[type] = set()
+
+        self._user_get_scope = get_scope
+        self._plans: dict[Callable[..., Any], ConstructionPlan] = {}
+        self._plan_cache: PlanCache | None = None
+        self._registry = Registry()
+        self._scoped_provider = ScopedProvider(
+            get_scope=self._get_scope,
+            logger=self._logger,
+            max_scopes=max_scopes,
+            factory=self._build,
+            afactory=self._abuild,
+            registry=self._registry,
+        )
+        self._pooled_provider = PooledProvider(
+            get_scope=current_scope.get,
+            logger=self._logger,
+            factory=self._build,
+            afactory=self._abuild,
+            registry=self._registry,
+        )
+        self._singleton_provider = SingletonProvider(
+            logger=self._logger,
+            factory=self._build,
+            afactory=self._abuild,
+            registry=self._registry,
+        )
         self._lifetime_to_provider: dict[Lifetime, Provider] = {
-            "transient": TransientProvider(logger=self._logger),
-            "singleton": SingletonProvider(logger=self._logger),
-            "scoped": ScopedProvider(get_scope=get_scope, logger=self._logger),
+            "transient": TransientProvider(
+                logger=self._logger,
+                factory=self._build,
+                afactory=self._abuild,
+                registry=self._registry,
+            ),
+            "singleton": self._singleton_provider,
+            "scoped": self._scoped_provider,
+            "pooled": self._pooled_provider,
+            "thread_local": ThreadLocalProvider(
+                logger=self._logger,
+                factory=self._build,
+                afactory=self._abuild,
+                registry=self._registry,
+            ),
+            "task_local": TaskLocalProvider(
+                logger=self._logger,
+                factory=self._build,
+                afactory=self._abuild,
+                registry=self._registry,
+            ),
         }
+        self._parent = parent
+        self._children: WeakSet[Container] = WeakSet()
+        self._scoped_providers = [self._scoped_provider]
+        if parent is not None:
+            self._scoped_providers += parent._scoped_providers
         self._must_warn_about_default_get_scope = get_scope is _default_get_scope
+        self._index: dict[Hashable, tuple[Provider, Registered[Any]]] | None = None
+        self._resolved: dict[
+            tuple[type, Resolver[Any]], tuple[Provider, Registered[Any]]
+        ] = {}
+        self._bundles: dict[
+            tuple[type, ...], tuple[Callable[[], tuple[Any, ...]], bool]
+        ] = {}
+        self._all_instances: dict[type, tuple[Any, ...]] = {}
+        self._generation = 0
+        self._observers: tuple[Observer, ...] = ()
+        track(self)
+
+    def _get_scope(self) -> Hashable:
+        scope = current_scope.get()
+        if scope is None:
+            return self._user_get_scope()
+        return scope
 
     @classmethod
     def _delete_instance(cls) -> None:
@@ -61,83 +209,771 @@ class Container:
         cls,
         get_scope: Callable[[], Hashable] = _default_get_scope,
         log_level: "_Level" = logging.WARNING,
+        max_scopes: int = DEFAULT_MAX_SCOPES,
     ) -> Self:
         if cls._instance is not None:
             raise ContainerAlreadyCreatedError()
 
-        c = cls(get_scope, log_level)
+        c = cls(get_scope, log_level, max_scopes)
         cls._instance = c
         return c
 
+    def child(self) -> Self:
+        child = type(self)(
+            self._user_get_scope,
+            self._logger.level,
+            self._scoped_provider._max_scopes,
+            parent=self,
+        )
+        child._must_warn_about_default_get_scope = False
+        child._plan_cache = self._plan_cache
+        self._children.add(child)
+        return child
+
+    @contextmanager
+    def activate(self) -> Iterator[Self]:
+        token = _active_container.set(self)
+        try:
+            yield self
+        finally:
+            _active_container.reset(token)
+
+    def set_log_level(self, log_level: "_Level") -> Self:
+        self._logger.setLevel(log_level)
+        self._debug = self._logger.isEnabledFor(logging.DEBUG)
+        return self
+
     def add_transient[I, C](
-        self, interface: type[I], concrete: type[C], marker: Marker | None = None
+        self,
+        interface: type[I],
+        concrete: type[C] | Callable[..., Awaitable[C]] | str,
+        marker: Marker | None = None,
     ) -> Self:
-        self._logger.debug(f"Registering transient {interface} -> {concrete}")
+        self._logger.debug("Registering transient %s -> %s", interface, concrete)
 
-        self._lifetime_to_provider["transient"].register(interface, concrete, marker)
+        self._register("transient", interface, concrete, marker)
+        self._invalidate()
         return self
 
     def add_singleton[I, C](
-        self, interface: type[I], concrete: type[C], marker: Marker | None = None
+        self,
+        interface: type[I],
+        concrete: type[C] | Callable[..., Awaitable[C]] | str,
+        marker: Marker | None = None,
+        fork: ForkPolicy = "share",
     ) -> Self:
-        self._logger.debug(f"Registering singleton {interface} -> {concrete}")
+        self._logger.debug("Registering singleton %s -> %s", interface, concrete)
 
-        self._lifetime_to_provider["singleton"].register(interface, concrete, marker)
+        self._register("singleton", interface, concrete, marker, fork)
+        self._invalidate()
         return self
 
     def add_scoped[I, C](
-        self, interface: type[I], concrete: type[C], marker: Marker | None = None
+        self,
+        interface: type[I],
+        concrete: type[C] | Callable[..., Awaitable[C]] | str,
+        marker: Marker | None = None,
+    ) -> Self:
+        self._logger.debug("Registering scoped %s -> %s", interface, concrete)
+
+        self._warn_about_default_get_scope()
+        self._register("scoped", interface, concrete, marker)
+        self._invalidate()
+        return self
+
+    def add_thread_local[I, C](
+        self,
+        interface: type[I],
+        concrete: type[C] | Callable[..., Awaitable[C]] | str,
+        marker: Marker | None = None,
+    ) -> Self:
+        self._logger.debug("Registering thread local %s -> %s", interface, concrete)
+
+        self._register("thread_local", interface, concrete, marker)
+        self._invalidate()
+        return self
+
+    def add_task_local[I, C](
+        self,
+        interface: type[I],
+        concrete: type[C] | Callable[..., Awaitable[C]] | str,
+        marker: Marker | None = None,
+    ) -> Self:
+        self._logger.debug("Registering task local %s -> %s", interface, concrete)
+
+        self._register("task_local", interface, concrete, marker)
+        self._invalidate()
+        return self
+
+    def add_pooled[I, C](
+        self,
+        interface: type[I],
+        concrete: type[C] | Callable[..., Awaitable[C]] | str,
+        marker: Marker | None = None,
+        size: int = DEFAULT_POOL_SIZE,
+        timeout: float | None = None,
     ) -> Self:
-        self._logger.debug(f"Registering scoped {interface} -> {concrete}")
+        self._logger.debug(
+            "Registering pooled %s -> %s (size %d)", interface, concrete, size
+        )
 
+        self._register("pooled", interface, concrete, marker, size, timeout)
+        self._invalidate()
+        return self
+
+    def register_many(
+        self,
+        lifetime: Lifetime,
+        registrations: Mapping[type, type | Callable[..., Any] | str]
+        | Iterable[tuple[type, type | Callable[..., Any] | str, Marker | None]],
+    ) -> Self:
+        if lifetime not in self._lifetime_to_provider:
+            raise ValueError(f"Unknown lifetime {lifetime!r}.")
+        if lifetime == "scoped":
+            self._warn_about_default_get_scope()
+
+        intern = sys.intern
+        rows = (
+            (
+                (interface, lazy(concrete), None)
+                for interface, concrete in registrations.items()
+            )
+            if isinstance(registrations, Mapping)
+            else (
+                (interface, lazy(concrete), None if marker is None else intern(marker))
+                for interface, concrete, marker in registrations
+            )
+        )
+        try:
+            count = self._lifetime_to_provider[lifetime].register_many(rows)
+        finally:
+            self._invalidate()
+
+        self._logger.debug("Registered %d %s concretes", count, lifetime)
+        return self
+
+    def add_mapping(
+        self, mapping: Mapping[Lifetime, Mapping[type | str, type | str]]
+    ) -> Self:
+        for lifetime, registrations in mapping.items():
+            self.register_many(
+                lifetime,
+                {
+                    import_path(interface)
+                    if isinstance(interface, str)
+                    else interface: (concrete)
+                    for interface, concrete in registrations.items()
+                },
+            )
+        return self
+
+    def scan(
+        self, package: str, cache: str | os.PathLike[str] | None = None
+    ) -> ScanReport:
+        return scan(self, package, cache)
+
+    def _warn_about_default_get_scope(self) -> None:
         if self._must_warn_about_default_get_scope:
             self._logger.warning(
-                "Scoped instances will be created with the default scope. "
-                "Therfore, they will be singletons. "
+                "Scoped instances will be created with the default scope "
+                "outside of `container.scope()`. "
+                "Therfore, they will be singletons there. "
                 "Consider providing a custom scope using the `get_scope` parameter."
             )
             self._must_warn_about_default_get_scope = False
 
-        self._lifetime_to_provider["scoped"].register(interface, concrete, marker)
+    def _register(
+        self,
+        lifetime: Lifetime,
+        interface: type,
+        concrete: type | Callable[..., Any] | str,
+        marker: Marker | None,
+        *options: Any,
+    ) -> None:
+        self._lifetime_to_provider[lifetime].register(  # type: ignore[call-arg]
+            interface,
+            lazy(concrete),
+            None if marker is None else sys.intern(marker),
+            *options,
+        )
+
+    def _pooled(self, interface: type, marker: Marker | None) -> Registered[Any]:
+        _, registered = self._lookup(interface, None, marker)
+        if registered.lifetime != "pooled":
+            raise UnregisteredInterfaceError(interface, marker)
+        return registered
+
+    @contextmanager
+    def checkout[I](
+        self,
+        interface: type[I],
+        marker: Marker | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[I]:
+        registered = self._pooled(interface, marker)
+        instance = self._pooled_provider.acquire(registered, timeout)
+        try:
+            yield instance
+        finally:
+            self._pooled_provider.release(registered, instance)
+
+    @asynccontextmanager
+    async def acheckout[I](
+        self,
+        interface: type[I],
+        marker: Marker | None = None,
+        timeout: float | None = None,
+    ) -> AsyncIterator[I]:
+        registered = self._pooled(interface, marker)
+        instance = await self._pooled_provider.aacquire(registered, timeout)
+        try:
+            yield instance
+        finally:
+            self._pooled_provider.release(registered, instance)
+
+    def pool_stats(self, interface: type, marker: Marker | None = None) -> PoolStats:
+        return self._pooled_provider.stats(self._pooled(interface, marker))
+
+    def scope(self) -> Scope:
+        return Scope(self._scoped_providers, self._logger)
+
+    def compile(self) -> "CompiledContainer":
+        return compile_container(self)
+
+    def warm_up(self, max_workers: int | None = None) -> WarmUpReport:
+        return warm_up(self, max_workers)
+
+    async def awarm_up(self) -> WarmUpReport:
+        return await awarm_up(self)
+
+    def cache_plans(self, path: str | os.PathLike[str]) -> Self:
+        if self._plan_cache is not None:
+            atexit.unregister(self._plan_cache.save)
+        self._plan_cache = PlanCache(path)
+        atexit.register(self._plan_cache.save)
         return self
 
-    def get_concrete_instance[I](
-        self, interface: type[I], resolver: Resolver[I] | None = None
-    ) -> I:
+    def save_plans(self) -> None:
+        if self._plan_cache is not None:
+            self._plan_cache.save()
+
+    def prefork(self) -> int:
+        return prefork(self)
+
+    async def aprefork(self) -> int:
+        return await aprefork(self)
+
+    def _after_fork(self) -> None:
+        for _, registrations in self._registry.items():
+            for registered in registrations:
+                if type(registered.concrete) is LazyConcrete:
+                    registered.concrete._after_fork()
+        self._scoped_provider.after_fork()
+        rebuilt = self._pooled_provider.after_fork()
+        if self._singleton_provider.after_fork() or rebuilt:
+            self._invalidate()
+
+    def observe(self, observer: Observer) -> Self:
+        self._observers = (*self._observers, observer)
+        self._set_observed()
+        return self
+
+    def unobserve(self, observer: Observer) -> Self:
+        self._observers = tuple(o for o in self._observers if o is not observer)
+        self._set_observed()
+        return self
+
+    def _set_observed(self) -> None:
+        observed = bool(self._observers)
+        if observed:
+            self.get_concrete_instance = self.get = self._observed_get  # type: ignore[method-assign]
+            self.aget = self._observed_aget  # type: ignore[method-assign]
+        else:
+            for name in ("get_concrete_instance", "get", "aget"):
+                self.__dict__.pop(name, None)
+
         for provider in self._lifetime_to_provider.values():
-            try:
-                concrete = provider.get(interface, resolver)
-                self._logger.debug(
-                    f"Resolved {interface} to {concrete} with {provider.__class__.__name__}"
+            provider._factory = self._observed_build if observed else self._build  # type: ignore[attr-defined]
+            provider._afactory = self._observed_abuild if observed else self._abuild  # type: ignore[attr-defined]
+
+    def _invalidate(self) -> None:
+        self._index = None
+        self._resolved.clear()
+        self._bundles.clear()
+        self._all_instances.clear()
+        self._generation += 1
+        if self._children:
+            for child in self._children:
+                child._invalidate()
+
+    def _build_index(self) -> dict[Hashable, tuple[Provider, Registered[Any]]]:
+        providers = self._lifetime_to_provider
+        rank = {lifetime: i for i, lifetime in enumerate(providers)}
+        index: dict[Hashable, tuple[Provider, Registered[Any]]] = {}
+        for interface, registrations in self._registry.items():
+            if len(registrations) == 1:
+                registered = registrations[0]
+                entry = index[interface] = providers[registered.lifetime], registered
+                if registered.marker is not None:
+                    index[(interface, registered.marker)] = entry
+                continue
+
+            ordered = sorted(registrations, key=lambda r: rank[r.lifetime])
+            first = ordered[0]
+            index[interface] = providers[first.lifetime], first
+            if ordered[1].lifetime == first.lifetime and interface not in self._warned:
+                warn_multiple_concretes(self._logger, self._warned, interface)
+
+            for registered in ordered:
+                if registered.marker is not None:
+                    index.setdefault(
+                        (interface, registered.marker),
+                        (providers[registered.lifetime], registered),
+                    )
+
+        if self._parent is not None:
+            return _OverlayIndex(self, index)
+        return index
+
+    def _inherited[I](
+        self, entry: tuple[Provider, Registered[I]]
+    ) -> tuple[Provider, Registered[I]]:
+        registered = entry[1]
+        if registered.lifetime in _SHARED_WITH_CHILDREN:
+            return entry
+        return self._lifetime_to_provider[registered.lifetime], registered
+
+    def _get_index(self) -> dict[Hashable, tuple[Provider, Registered[Any]]]:
+        index = self._index
+        if index is None:
+            index = self._index = self._build_index()
+        return index
+
+    def _plan(self, concrete: Callable[..., Any]) -> ConstructionPlan:
+        plan = self._plans.get(concrete)
+        if plan is None:
+            cache = self._plan_cache
+            plan = None if cache is None else cache.get(concrete)
+            if plan is None:
+                plan = make_plan(concrete)
+                if cache is not None:
+                    cache.put(plan)
+            self._plans[concrete] = plan
+        return plan
+
+    def _build[T](self, registered: Registered[T]) -> T:
+        concrete = registered.concrete
+        if type(concrete) is LazyConcrete:
+            concrete = load(registered)
+        if registered.is_async:
+            raise AsyncRegistrationError(concrete)
+
+        plan = self._plans.get(concrete) or self._plan(concrete)
+        if not plan.dependencies:
+            return concrete()  # type: ignore[return-value]
+
+        token = enter_construction(registered)
+        try:
+            index = self._get_index()
+            kwargs: dict[str, Any] = {}
+            for dependency in plan.dependencies:
+                if dependency.optional and dependency.interface not in index:
+                    continue
+                kwargs[dependency.name] = self.get_concrete_instance(
+                    dependency.interface, dependency.resolver, dependency.marker
                 )
-                return concrete
-            except UnregisteredInterfaceError:
-                pass
-            except ResolverError:
-                pass
+            return concrete(**kwargs)  # type: ignore[return-value]
+        finally:
+            constructing.reset(token)
+
+    async def _abuild[T](self, registered: Registered[T]) -> T:
+        concrete = registered.concrete
+        if type(concrete) is LazyConcrete:
+            concrete = load(registered)
+        plan = self._plans.get(concrete) or self._plan(concrete)
+
+        token = enter_construction(registered)
+        try:
+            index = self._get_index()
+            kwargs: dict[str, Any] = {}
+            for dependency in plan.dependencies:
+                if dependency.optional and dependency.interface not in index:
+                    continue
+                kwargs[dependency.name] = await self.aget(
+                    dependency.interface, dependency.resolver, dependency.marker
+                )
+
+            instance = concrete(**kwargs)
+            if registered.is_async:
+                return await instance  # type: ignore[misc]
+            return instance  # type: ignore[return-value]
+        finally:
+            constructing.reset(token)
+
+    def _observed_build[T](self, registered: Registered[T]) -> T:
+        for observer in self._observers:
+            observer.on_construct_start(registered)
+        try:
+            return self._build(registered)
+        finally:
+            for observer in reversed(self._observers):
+                observer.on_construct_end(registered)
+
+    async def _observed_abuild[T](self, registered: Registered[T]) -> T:
+        for observer in self._observers:
+            observer.on_construct_start(registered)
+        try:
+            return await self._abuild(registered)
+        finally:
+            for observer in reversed(self._observers):
+                observer.on_construct_end(registered)
+
+    def _observed_instance[I](
+        self, interface: type[I], provider: Provider, registered: Registered[I]
+    ) -> I:
+        for observer in self._observers:
+            observer.on_resolve_start(interface, registered)
+        try:
+            return provider.get_instance(registered)
+        finally:
+            for observer in reversed(self._observers):
+                observer.on_resolve_end(interface, registered)
+
+    async def _aobserved_instance[I](
+        self, interface: type[I], provider: Provider, registered: Registered[I]
+    ) -> I:
+        for observer in self._observers:
+            observer.on_resolve_start(interface, registered)
+        try:
+            return await provider.aget_instance(registered)
+        finally:
+            for observer in reversed(self._observers):
+                observer.on_resolve_end(interface, registered)
+
+    def _observed_get[I](
+        self,
+        interface: type[I],
+        resolver: Resolver[I] | None = None,
+        marker: Marker | None = None,
+    ) -> I:
+        provider, registered = self._lookup(interface, resolver, marker)
+        concrete = self._observed_instance(interface, provider, registered)
+        if self._debug:
+            self._logger.debug(
+                "Resolved %s to %s with %s",
+                interface,
+                concrete,
+                provider.__class__.__name__,
+            )
+        return concrete
 
+    async def _observed_aget[I](
+        self,
+        interface: type[I],
+        resolver: Resolver[I] | None = None,
+        marker: Marker | None = None,
+    ) -> I:
+        provider, registered = self._lookup(interface, resolver, marker)
+        concrete = await self._aobserved_instance(interface, provider, registered)
+        if self._debug:
+            self._logger.debug(
+                "Resolved %s to %s with %s",
+                interface,
+                concrete,
+                provider.__class__.__name__,
+            )
+        return concrete
+
+    def _lookup[I](
+        self,
+        interface: type[I],
+        resolver: Resolver[I] | None,
+        marker: Marker | None = None,
+    ) -> tuple[Provider, Registered[I]]:
+        if resolver is None:
+            key = interface if marker is None else (interface, marker)
+            entry = self._get_index().get(key)
+            if entry is None:
+                raise UnregisteredInterfaceError(interface, marker)
+            return entry
+
+        entry = self._resolved.get((interface, resolver))
+        if entry is not None:
+            return entry
+
+        error: Exception | None = None
+        for lifetime, provider in self._lifetime_to_provider.items():
+            concretes = self._registry.of(interface, lifetime)
+            if not concretes:
+                continue
+            try:
+                entry = provider, resolver(concretes)
+            except Exception as e:
+                error = e
+                continue
+
+            resolved = self._resolved
+            if len(resolved) >= MAX_RESOLVED:
+                resolved.pop(next(iter(resolved), None), None)
+            resolved[(interface, resolver)] = entry
+            return entry
+
+        if error is not None:
+            raise ResolverError(interface) from error
+        if self._parent is not None:
+            return self._inherited(self._parent._lookup(interface, resolver))
         raise UnregisteredInterfaceError(interface)
 
+    def get_concrete_instance[I](
+        self,
+        interface: type[I],
+        resolver: Resolver[I] | None = None,
+        marker: Marker | None = None,
+    ) -> I:
+        if resolver is None:
+            index = self._index
+            if index is None:
+                index = self._index = self._build_index()
+
+            entry = index.get(interface if marker is None else (interface, marker))
+            if entry is None:
+                raise UnregisteredInterfaceError(interface, marker)
+            provider, registered = entry
+        else:
+            provider, registered = self._lookup(interface, resolver)
+
+        concrete = provider.get_instance(registered)
+        if self._debug:
+            self._logger.debug(
+                "Resolved %s to %s with %s",
+                interface,
+                concrete,
+                provider.__class__.__name__,
+            )
+        return concrete
+
+    get = get_concrete_instance
+
+    def _bundle(
+        self, interfaces: tuple[type, ...]
+    ) -> tuple[Callable[[], tuple[Any, ...]], bool]:
+        bundle = self._bundles.get(interfaces)
+        if bundle is None:
+            bundle = self._bundles[interfaces] = compile_bundle(self, interfaces)
+        return bundle
+
+    def get_many(self, *interfaces: type) -> tuple[Any, ...]:
+        if self._observers:
+            return tuple(self.get(interface) for interface in interfaces)
+        return self._bundle(interfaces)[0]()
+
+    async def aget_many(self, *interfaces: type) -> tuple[Any, ...]:
+        if not self._observers:
+            resolve, is_async = self._bundle(interfaces)
+            if not is_async:
+                return resolve()
+        return tuple([await self.aget(interface) for interface in interfaces])
+
+    def _all(self, interface: type) -> list[tuple[Provider, Registered[Any]]]:
+        entries = [
+            (self._lifetime_to_provider[registered.lifetime], registered)
+            for registered in self._registry.all(interface)
+        ]
+        if self._parent is not None:
+            return [self._inherited(e) for e in self._parent._all(interface)] + entries
+        return entries
+
+    def get_all[I](self, interface: type[I]) -> tuple[I, ...]:
+        if self._observers:
+            return tuple(
+                self._observed_instance(interface, provider, registered)
+                for provider, registered in self._all(interface)
+            )
+
+        instances = self._all_instances.get(interface)
+        if instances is None:
+            entries = self._all(interface)
+            instances = tuple(
+                provider.get_instance(registered) for provider, registered in entries
+            )
+            if all(registered.lifetime == "singleton" for _, registered in entries):
+                self._all_instances[interface] = instances
+        return instances
+
+    async def aget_all[I](self, interface: type[I]) -> tuple[I, ...]:
+        if self._observers:
+            return tuple(
+                [
+                    await self._aobserved_instance(interface, provider, registered)
+                    for provider, registered in self._all(interface)
+                ]
+            )
+
+        instances = self._all_instances.get(interface)
+        if instances is None:
+            entries = self._all(interface)
+            instances = tuple(
+                [
+                    await provider.aget_instance(registered)
+                    for provider, registered in entries
+                ]
+            )
+            if all(registered.lifetime == "singleton" for _, registered in entries):
+                self._all_instances[interface] = instances
+        return instances
+
+    async def aget[I](
+        self,
+        interface: type[I],
+        resolver: Resolver[I] | None = None,
+        marker: Marker | None = None,
+    ) -> I:
+        provider, registered = self._lookup(interface, resolver, marker)
+        concrete = await provider.aget_instance(registered)
+        if self._debug:
+            self._logger.debug(
+                "Resolved %s to %s with %s",
+                interface,
+                concrete,
+                provider.__class__.__name__,
+            )
+        return concrete
+
+
+_UNCACHED_LIFETIMES = frozenset(("transient", "thread_local", "task_local"))
+
+_call_bindings: ContextVar[dict["LazyProxy[Any]", Any] | None] = ContextVar(
+    "uncoupled_call_bindings", default=None
+)
+
+
+@contextmanager
+def per_call() -> Iterator[None]:
+    token = _call_bindings.set({})
+    try:
+        yield
+    finally:
+        _call_bindings.reset(token)
+
+
+def _resolve_proxy_target(proxy: "LazyProxy[Any]") -> Any:
+    container = Container._get_instance()
+
+    cache = object.__getattribute__(proxy, "_cache")
+    if cache is not None:
+        cached_container, generation, lifetime, scope, target = cache
+        if cached_container is container and generation == container._generation:
+            if lifetime == "singleton":
+                return target
+            if scope == container._get_scope():
+                return target
+
+    bindings = _call_bindings.get()
+    if bindings is not None and proxy in bindings:
+        return bindings[proxy]
+
+    interface = object.__getattribute__(proxy, "_interface")
+    resolver = object.__getattribute__(proxy, "_resolver")
+    marker = object.__getattribute__(proxy, "_marker")
+    provider, registered = container._lookup(interface, resolver, marker)
+    if container._observers:
+        target = container._observed_instance(interface, provider, registered)
+    else:
+        target = provider.get_instance(registered)
+    if container._debug:
+        container._logger.debug(
+            "Resolved %s to %s with %s",
+            interface,
+            target,
+            provider.__class__.__name__,
+        )
+
+    lifetime = registered.lifetime
+    if lifetime in _UNCACHED_LIFETIMES:
+        if bindings is not None:
+            bindings[proxy] = target
+    else:
+        scope = container._get_scope() if lifetime != "singleton" else None
+        cache = (container, container._generation, lifetime, scope, target)
+        object.__setattr__(proxy, "_cache", cache)
+        if isinstance(scope, Scope):
+            scope.callback(lambda: _drop_proxy_cache(proxy, cache))
+
+    return target
+
+
+def _drop_proxy_cache(proxy: "LazyProxy[Any]", cache: tuple[Any, ...]) -> None:
+    if object.__getattribute__(proxy, "_cache") is cache:
+        object.__setattr__(proxy, "_cache", None)
+
 
 def make_proxy_method(name: str):
     def proxy_method(self, *args: Any, **kwargs: Any) -> Any:
-        interface = object.__getattribute__(self, "_interface")
-        resolver = object.__getattribute__(self, "_resolver")
-        concrete = Container._get_instance().get_concrete_instance(interface, resolver)
-        return getattr(concrete, name)(*args, **kwargs)
+        return getattr(_resolve_proxy_target(self), name)(*args, **kwargs)
 
     return proxy_method
 
 
 class LazyProxy[I]:
-    def __init__(self, interface: type[I], resolver: Resolver | None = None) -> None:
+    def __init__(
+        self,
+        interface: type[I],
+        resolver: Resolver | None = None,
+        marker: Marker | None = None,
+    ) -> None:
         self._interface = interface
         self._resolver = resolver
+        self._marker = marker
+        self._cache: tuple[Container, int, Lifetime, Hashable, I] | None = None
 
     __call__ = make_proxy_method("__call__")
     __getattribute__ = make_proxy_method("__getattribute__")
     __repr__ = make_proxy_method("__repr__")
 
 
-def Depends[I](interface: type[I], resolver: Resolver[I] | None = None) -> I:
-    return cast(I, LazyProxy[I](interface, resolver))
+def _resolve_all_target(proxy: "LazyAllProxy[Any]") -> tuple[Any, ...]:
+    container = Container._get_instance()
+    interface = object.__getattribute__(proxy, "_interface")
+    instances = container._all_instances.get(interface)
+    if instances is not None and not container._observers:
+        return instances
+
+    bindings = _call_bindings.get()
+    if bindings is not None and proxy in bindings:
+        return bindings[proxy]
+
+    instances = container.get_all(interface)
+    if bindings is not None:
+        bindings[proxy] = instances
+    return instances
+
+
+def make_all_proxy_method(name: str):
+    def proxy_method(self, *args: Any, **kwargs: Any) -> Any:
+        return getattr(_resolve_all_target(self), name)(*args, **kwargs)
+
+    return proxy_method
+
+
+class LazyAllProxy[I]:
+    def __init__(self, interface: type[I]) -> None:
+        self._interface = interface
+
+    __getattribute__ = make_all_proxy_method("__getattribute__")
+    __iter__ = make_all_proxy_method("__iter__")
+    __len__ = make_all_proxy_method("__len__")
+    __getitem__ = make_all_proxy_method("__getitem__")
+    __contains__ = make_all_proxy_method("__contains__")
+    __repr__ = make_all_proxy_method("__repr__")
+
+
+def Depends[I](
+    interface: type[I],
+    resolver: Resolver[I] | None = None,
+    marker: Marker | None = None,
+) -> I:
+    return cast(I, LazyProxy[I](interface, resolver, marker))
+
+
+def DependsAll[I](interface: type[I]) -> tuple[I, ...]:
+    return cast(tuple[I, ...], LazyAllProxy[I](interface))
@@ -1,6 +1,11 @@
 class UnregisteredInterfaceError(Exception):
-    def __init__(self, interface: type):
-        super().__init__(f"Interface {interface} not registered.")
+    def __init__(self, interface: type, marker: str | None = None):
+        if marker is None:
+            super().__init__(f"Interface {interface} not registered.")
+        else:
+            super().__init__(
+                f"Interface {interface} with marker {marker!r} not registered."
+            )
 
 
 class ContainerNotCreatedError(Exception):
@@ -18,3 +23,56 @@ class ContainerAlreadyCreatedError(Exception):
 class ResolverError(Exception):
     def __init__(self, interface: type):
         super().__init__(f"Resolver for interface {interface} failed.")
+
+
+class CircularDependencyError(Exception):
+    def __init__(self, chain: list[type]):
+        super().__init__(
+            "Circular dependency: " + " -> ".join(c.__name__ for c in chain) + "."
+        )
+
+
+class UnresolvedAnnotationError(Exception):
+    def __init__(self, concrete: object, parameter: str):
+        super().__init__(
+            f"Cannot resolve the annotation of parameter {parameter!r} of {concrete}."
+        )
+
+
+class OutdatedCompilationError(Exception):
+    def __init__(self):
+        super().__init__(
+            "Registrations changed since the container was compiled. "
+            "Consider calling `container.compile()` again."
+        )
+
+
+class AsyncRegistrationError(Exception):
+    def __init__(self, concrete: object):
+        super().__init__(
+            f"{concrete} is an async factory that has not been awaited yet. "
+            "Consider using `await container.aget()`."
+        )
+
+
+class PoolTimeoutError(Exception):
+    def __init__(self, concrete: object, timeout: float):
+        super().__init__(
+            f"No pooled instance of {concrete} became available within {timeout}s."
+        )
+
+
+class ScopeRequiredError(Exception):
+    def __init__(self, concrete: object):
+        super().__init__(
+            f"Pooled {concrete} must be resolved inside `container.scope()`. "
+            "Consider using `container.checkout()` instead."
+        )
+
+
+class ForkPolicyConflictError(Exception):
+    def __init__(self, concrete: object, registered: str, requested: str):
+        super().__init__(
+            f"Singleton {concrete} is already registered with fork={registered!r}, "
+            f"it cannot also use fork={requested!r}."
+        )
@@ -0,0 +1,50 @@
+import gc
+import os
+from typing import TYPE_CHECKING, Protocol
+from weakref import WeakSet
+
+if TYPE_CHECKING:
+    from uncoupled.container import Container
+
+
+class _ForkAware(Protocol):
+    def _after_fork(self) -> None: ...
+
+
+_tracked: "WeakSet[_ForkAware]" = WeakSet()
+
+
+def track(obj: _ForkAware) -> None:
+    _tracked.add(obj)
+
+
+def _after_fork_in_child() -> None:
+    for obj in list(_tracked):
+        obj._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _freeze() -> None:
+    gc.collect()
+    gc.freeze()
+
+
+def prefork(container: "Container") -> int:
+    provider = container._singleton_provider
+    shared = provider.shared()
+    for registered in shared:
+        provider.get_instance(registered)
+    _freeze()
+    return len(shared)
+
+
+async def aprefork(container: "Container") -> int:
+    provider = container._singleton_provider
+    shared = provider.shared()
+    for registered in shared:
+        await provider.aget_instance(registered)
+    _freeze()
+    return len(shared)
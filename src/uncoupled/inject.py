@@ -0,0 +1,63 @@
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from uncoupled.container import Container, LazyAllProxy, LazyProxy
+
+_INJECTABLE_KINDS = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+def inject[F: Callable[..., Any]](fn: F) -> F:
+    is_async = inspect.iscoroutinefunction(fn)
+    namespace: dict[str, Any] = {"fn": fn, "get_container": Container._get_instance}
+    body: list[str] = []
+
+    for position, (name, parameter) in enumerate(
+        inspect.signature(fn).parameters.items()
+    ):
+        default = parameter.default
+        if parameter.kind not in _INJECTABLE_KINDS or type(default) not in (
+            LazyProxy,
+            LazyAllProxy,
+        ):
+            continue
+
+        dependency = f"dependency_{len(body)}"
+        if type(default) is LazyAllProxy:
+            method = "get_all"
+            namespace[dependency] = (object.__getattribute__(default, "_interface"),)
+        else:
+            method = "get"
+            namespace[dependency] = (
+                object.__getattribute__(default, "_interface"),
+                object.__getattribute__(default, "_resolver"),
+                object.__getattribute__(default, "_marker"),
+            )
+        supplied = f"{name!r} in kwargs"
+        if parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            supplied = f"len(args) > {position} or {supplied}"
+        if is_async:
+            get = f"await container.a{method}(*{dependency})"
+        else:
+            get = f"container.{method}(*{dependency})"
+        body += [f"    if not ({supplied}):", f"        kwargs[{name!r}] = {get}"]
+
+    if not body:
+        return fn
+
+    prefix = "async " if is_async else ""
+    call = "await fn(*args, **kwargs)" if is_async else "fn(*args, **kwargs)"
+    source = "\n".join(
+        [
+            f"{prefix}def wrapper(*args, **kwargs):",
+            "    container = get_container()",
+            *body,
+            f"    return {call}",
+        ]
+    )
+    exec(compile(source, f"<uncoupled-inject {fn.__qualname__}>", "exec"), namespace)
+    return functools.wraps(fn)(namespace["wrapper"])
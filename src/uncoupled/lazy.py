@@ -0,0 +1,70 @@
+import importlib
+from collections.abc import Callable
+from inspect import iscoroutinefunction
+from threading import Lock
+from typing import Any
+
+from uncoupled.providers.provider import Registered
+
+
+def import_path(path: str) -> Any:
+    module, sep, name = path.partition(":")
+    if not sep or not module or not name:
+        raise ValueError(f"Expected a 'package.module:Name' path, got {path!r}.")
+
+    obj = importlib.import_module(module)
+    for attribute in name.split("."):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+class LazyConcrete:
+    def __init__(self, path: str) -> None:
+        module, sep, name = path.partition(":")
+        if not sep or not module or not name:
+            raise ValueError(f"Expected a 'package.module:Name' path, got {path!r}.")
+
+        self.path = path
+        self.__module__ = module
+        self.__qualname__ = name
+        self.__name__ = name.rpartition(".")[2]
+        self._concrete: Callable[..., Any] | None = None
+        self._lock = Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._concrete is not None
+
+    def load(self) -> Callable[..., Any]:
+        concrete = self._concrete
+        if concrete is None:
+            with self._lock:
+                concrete = self._concrete
+                if concrete is None:
+                    concrete = self._concrete = import_path(self.path)
+        return concrete
+
+    def _after_fork(self) -> None:
+        self._lock = Lock()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyConcrete({self.path!r})"
+
+
+def lazy[C](concrete: C | str) -> C | LazyConcrete:
+    if isinstance(concrete, str):
+        return LazyConcrete(concrete)
+    return concrete
+
+
+def load[T](registered: Registered[T]) -> Callable[..., Any]:
+    concrete = registered.concrete
+    if type(concrete) is not LazyConcrete:
+        return concrete
+
+    loaded = concrete.load()
+    object.__setattr__(registered, "is_async", iscoroutinefunction(loaded))
+    return loaded
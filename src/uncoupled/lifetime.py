@@ -1,4 +1,8 @@
 from typing import Literal
 
 
-Lifetime = Literal["transient", "singleton", "scoped"]
+Lifetime = Literal[
+    "transient", "singleton", "scoped", "pooled", "thread_local", "task_local"
+]
+
+ForkPolicy = Literal["share", "rebuild"]
@@ -0,0 +1,166 @@
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, get_args
+
+from uncoupled.lifetime import Lifetime
+from uncoupled.fork import track
+from uncoupled.observer import Observer
+from uncoupled.providers.provider import Registered
+from uncoupled.scope import Scope, current_scope
+
+LATENCY_BOUNDS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+RESOLUTION_BOUNDS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+def _name(obj: Any) -> str:
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+class Histogram:
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        self._buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self._bounds):
+            if value <= bound:
+                break
+        else:
+            i = len(self._bounds)
+        self._buckets[i] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> dict[str, Any]:
+        labels = [str(bound) for bound in self._bounds] + ["+Inf"]
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "buckets": dict(zip(labels, self._buckets)),
+        }
+
+
+@dataclass(slots=True)
+class _Resolution:
+    registered: Registered[Any]
+    constructed: bool = False
+
+
+@dataclass(slots=True)
+class _Construction:
+    registered: Registered[Any]
+    start: float = field(default_factory=time.perf_counter)
+
+
+_resolutions: ContextVar[tuple[_Resolution, ...]] = ContextVar(
+    "uncoupled_metrics_resolutions", default=()
+)
+_constructions: ContextVar[tuple[_Construction, ...]] = ContextVar(
+    "uncoupled_metrics_constructions", default=()
+)
+
+
+class Metrics(Observer):
+    def __init__(self, amplification_threshold: int = 100) -> None:
+        self._amplification_threshold = amplification_threshold
+        self._lock = Lock()
+        self.reset()
+        track(self)
+
+    def _after_fork(self) -> None:
+        self._lock = Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._resolutions: Counter[type] = Counter()
+            self._hits: Counter[Lifetime] = Counter()
+            self._misses: Counter[Lifetime] = Counter()
+            self._latencies: defaultdict[Any, Histogram] = defaultdict(
+                lambda: Histogram(LATENCY_BOUNDS)
+            )
+            self._scope_to_resolutions: dict[Scope, int] = {}
+            self._per_scope = Histogram(RESOLUTION_BOUNDS)
+            self._amplified = 0
+
+    def on_resolve_start(self, interface: type, registered: Registered[Any]) -> None:
+        _resolutions.set((*_resolutions.get(), _Resolution(registered)))
+
+        scope = current_scope.get()
+        with self._lock:
+            self._resolutions[interface] += 1
+            if scope is None:
+                return
+
+            count = self._scope_to_resolutions.get(scope)
+            if count is None:
+                scope.callback(lambda: self._end_scope(scope))
+                count = 0
+            self._scope_to_resolutions[scope] = count + 1
+
+    def on_resolve_end(self, interface: type, registered: Registered[Any]) -> None:
+        stack = _resolutions.get()
+        if not stack:
+            return
+
+        _resolutions.set(stack[:-1])
+        with self._lock:
+            if stack[-1].constructed:
+                self._misses[registered.lifetime] += 1
+            else:
+                self._hits[registered.lifetime] += 1
+
+    def on_construct_start(self, registered: Registered[Any]) -> None:
+        stack = _resolutions.get()
+        if stack and stack[-1].registered == registered:
+            stack[-1].constructed = True
+        _constructions.set((*_constructions.get(), _Construction(registered)))
+
+    def on_construct_end(self, registered: Registered[Any]) -> None:
+        stack = _constructions.get()
+        if not stack:
+            return
+
+        _constructions.set(stack[:-1])
+        seconds = time.perf_counter() - stack[-1].start
+        with self._lock:
+            self._latencies[registered.concrete].observe(seconds)
+
+    def _end_scope(self, scope: Scope) -> None:
+        with self._lock:
+            count = self._scope_to_resolutions.pop(scope, 0)
+            self._per_scope.observe(count)
+            if count > self._amplification_threshold:
+                self._amplified += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "resolutions": {
+                    _name(interface): count
+                    for interface, count in self._resolutions.most_common()
+                },
+                "lifetimes": {
+                    lifetime: {
+                        "hits": self._hits[lifetime],
+                        "constructions": self._misses[lifetime],
+                    }
+                    for lifetime in get_args(Lifetime)
+                },
+                "construction_seconds": {
+                    _name(concrete): histogram.snapshot()
+                    for concrete, histogram in self._latencies.items()
+                },
+                "scopes": {
+                    "resolutions": self._per_scope.snapshot(),
+                    "amplified": self._amplified,
+                    "amplification_threshold": self._amplification_threshold,
+                },
+            }
@@ -0,0 +1,15 @@
+from typing import Any, Protocol
+
+from uncoupled.providers.provider import Registered
+
+
+class Observer(Protocol):
+    def on_resolve_start(
+        self, interface: type, registered: Registered[Any]
+    ) -> None: ...
+
+    def on_resolve_end(self, interface: type, registered: Registered[Any]) -> None: ...
+
+    def on_construct_start(self, registered: Registered[Any]) -> None: ...
+
+    def on_construct_end(self, registered: Registered[Any]) -> None: ...
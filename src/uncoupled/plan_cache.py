@@ -0,0 +1,113 @@
+import os
+import pickle
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from uncoupled.wiring import ConstructionPlan
+
+FORMAT = 2
+
+type _Key = tuple[str, str]
+type _Source = tuple[str, int, int]
+
+
+def _key(concrete: Callable[..., Any]) -> _Key | None:
+    module = getattr(concrete, "__module__", None)
+    qualname = getattr(concrete, "__qualname__", None)
+    if not module or not qualname or "<locals>" in qualname:
+        return None
+    return module, qualname
+
+
+def _source(module: str) -> _Source | None:
+    path = getattr(sys.modules.get(module), "__file__", None)
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+class PlanCache:
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[_Key, tuple[tuple[_Source, ...], bytes]] = self._read()
+        self._sources: dict[str, _Source | None] = {}
+        self._dirty = False
+
+    def _read(self) -> dict[_Key, tuple[tuple[_Source, ...], bytes]]:
+        try:
+            with open(self.path, "rb") as f:
+                header, entries = pickle.load(f)
+        except Exception:
+            return {}
+        if header != (FORMAT, sys.version_info[:2]):
+            return {}
+        return entries
+
+    def _current(self, module: str) -> _Source | None:
+        if module not in self._sources:
+            self._sources[module] = _source(module)
+        return self._sources[module]
+
+    def _all_sources(self, concrete: Callable[..., Any]) -> tuple[_Source, ...] | None:
+        own = self._current(concrete.__module__)
+        if own is None:
+            return None
+
+        sources = [own]
+        for cls in getattr(concrete, "__mro__", ())[1:]:
+            source = self._current(cls.__module__)
+            if source is not None and source not in sources:
+                sources.append(source)
+        return tuple(sources)
+
+    def get(self, concrete: Callable[..., Any]) -> ConstructionPlan | None:
+        key = _key(concrete)
+        entry = None if key is None else self._entries.get(key)
+        if entry is None or entry[0] != self._all_sources(concrete):
+            self.misses += 1
+            return None
+
+        try:
+            dependencies = pickle.loads(entry[1])
+        except Exception:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return ConstructionPlan(concrete=concrete, dependencies=dependencies)
+
+    def put(self, plan: ConstructionPlan) -> None:
+        key = _key(plan.concrete)
+        sources = None if key is None else self._all_sources(plan.concrete)
+        if key is None or sources is None:
+            return
+
+        try:
+            dependencies = pickle.dumps(plan.dependencies, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        self._entries[key] = (sources, dependencies)
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(
+                ((FORMAT, sys.version_info[:2]), self._entries),
+                f,
+                pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, self.path)
+        self._dirty = False
@@ -0,0 +1,332 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass, field
+from logging import Logger
+from threading import Event, Lock
+from typing import TYPE_CHECKING, Any, Literal
+
+from uncoupled.exception import (
+    PoolTimeoutError,
+    ScopeRequiredError,
+)
+from uncoupled.providers.registry import Registry
+from uncoupled.providers.provider import (
+    AsyncFactory,
+    Factory,
+    Marker,
+    Provider,
+    Registered,
+    Resolver,
+    aconstruct,
+    construct,
+)
+
+if TYPE_CHECKING:
+    from uncoupled.scope import Scope
+
+DEFAULT_POOL_SIZE = 10
+
+_RETRY = object()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PoolStats:
+    size: int
+    created: int
+    in_use: int
+    peak_in_use: int
+    acquisitions: int
+    exhausted: int
+    timeouts: int
+    wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def utilization(self) -> float:
+        return self.in_use / self.size
+
+
+@dataclass(slots=True)
+class _Waiter:
+    wake: Callable[[], None]
+    ready: bool = False
+    instance: Any = _RETRY
+
+
+@dataclass(kw_only=True, slots=True)
+class _Pool:
+    size: int
+    timeout: float | None
+    idle: list[Any] = field(default_factory=list)
+    waiters: deque[_Waiter] = field(default_factory=deque)
+    lock: Lock = field(default_factory=Lock)
+    created: int = 0
+    peak_in_use: int = 0
+    acquisitions: int = 0
+    exhausted: int = 0
+    timeouts: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def take(
+        self, make_waiter: Callable[[], _Waiter], waited: bool
+    ) -> tuple[Literal["idle", "build", "wait"], Any]:
+        with self.lock:
+            if self.idle:
+                return "idle", self.idle.pop()
+            if self.created < self.size:
+                self.created += 1
+                return "build", None
+
+            waiter = make_waiter()
+            self.waiters.append(waiter)
+            if not waited:
+                self.exhausted += 1
+            return "wait", waiter
+
+    def give_up(self, waiter: _Waiter, timed_out: bool = True) -> bool:
+        with self.lock:
+            if waiter.ready:
+                return False
+            self.waiters.remove(waiter)
+            if timed_out:
+                self.timeouts += 1
+            return True
+
+    def checked_out(self, start: float, waited: bool) -> None:
+        with self.lock:
+            self.acquisitions += 1
+            self.peak_in_use = max(self.peak_in_use, self.created - len(self.idle))
+            if waited:
+                seconds = time.perf_counter() - start
+                self.wait_seconds += seconds
+                self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def hand_over(self, instance: Any) -> None:
+        with self.lock:
+            if instance is _RETRY:
+                self.created -= 1
+            if not self.waiters:
+                if instance is not _RETRY:
+                    self.idle.append(instance)
+                return
+
+            waiter = self.waiters.popleft()
+            waiter.ready = True
+            waiter.instance = instance
+        waiter.wake()
+
+    def stats(self) -> PoolStats:
+        with self.lock:
+            return PoolStats(
+                size=self.size,
+                created=self.created,
+                in_use=self.created - len(self.idle),
+                peak_in_use=self.peak_in_use,
+                acquisitions=self.acquisitions,
+                exhausted=self.exhausted,
+                timeouts=self.timeouts,
+                wait_seconds=self.wait_seconds,
+                max_wait_seconds=self.max_wait_seconds,
+            )
+
+
+def _set_future(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class PooledProvider(Provider):
+    def __init__(
+        self,
+        *,
+        get_scope: "Callable[[], Scope | None]",
+        logger: Logger | None = None,
+        factory: Factory = construct,
+        afactory: AsyncFactory = aconstruct,
+        registry: Registry | None = None,
+    ) -> None:
+        self._registry = Registry() if registry is None else registry
+        self._registered_to_pool: dict[int, _Pool] = {}
+        self._leases: dict[tuple[Hashable, int], Any] = {}
+
+        self._get_scope = get_scope
+        self._logger = logger or Logger("PooledProvider")
+        self._factory = factory
+        self._afactory = afactory
+        self._warned: set[type] = set()
+
+    def get[T](
+        self,
+        interface: type[T],
+        resolver: Resolver[T] | None = None,
+        marker: Marker | None = None,
+    ) -> T:
+        return self.get_instance(
+            self._registry.select(
+                interface, "pooled", resolver, marker, self._logger, self._warned
+            )
+        )
+
+    def get_instance[T](self, registered: Registered[T]) -> T:
+        scope = self._get_scope()
+        if scope is None:
+            raise ScopeRequiredError(registered.concrete)
+
+        instance = self._leases.get((scope, id(registered)))
+        if instance is None:
+            instance = self._lease(scope, registered, self.acquire(registered))
+        return instance
+
+    async def aget_instance[T](self, registered: Registered[T]) -> T:
+        scope = self._get_scope()
+        if scope is None:
+            raise ScopeRequiredError(registered.concrete)
+
+        instance = self._leases.get((scope, id(registered)))
+        if instance is None:
+            instance = self._lease(scope, registered, await self.aacquire(registered))
+        return instance
+
+    def _lease[T](self, scope: "Scope", registered: Registered[T], instance: T) -> T:
+        key = (scope, id(registered))
+        lease = self._leases.setdefault(key, instance)
+        if lease is not instance:
+            self.release(registered, instance)
+        else:
+            scope.callback(lambda: self._end_lease(key, registered))
+        return lease
+
+    def _end_lease(
+        self, key: tuple[Hashable, int], registered: Registered[Any]
+    ) -> None:
+        lease = self._leases.pop(key, None)
+        if lease is not None:
+            self.release(registered, lease)
+
+    def acquire[T](self, registered: Registered[T], timeout: float | None = None) -> T:
+        pool = self._registered_to_pool[id(registered)]
+        timeout = pool.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        waited = False
+        while True:
+            event = Event()
+            state, value = pool.take(lambda: _Waiter(event.set), waited)
+            if state == "idle":
+                pool.checked_out(start, waited)
+                return value
+            if state == "build":
+                return self._build(pool, registered, start, waited)
+
+            waited = True
+            remaining = None
+            if timeout is not None:
+                remaining = max(timeout - (time.perf_counter() - start), 0)
+            event.wait(remaining)
+            if pool.give_up(value):
+                raise PoolTimeoutError(registered.concrete, timeout)  # type: ignore[arg-type]
+            if value.instance is not _RETRY:
+                pool.checked_out(start, waited)
+                return value.instance
+
+    async def aacquire[T](
+        self, registered: Registered[T], timeout: float | None = None
+    ) -> T:
+        pool = self._registered_to_pool[id(registered)]
+        timeout = pool.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        waited = False
+        while True:
+            future = loop.create_future()
+            state, value = pool.take(
+                lambda: _Waiter(lambda: loop.call_soon_threadsafe(_set_future, future)),
+                waited,
+            )
+            if state == "idle":
+                pool.checked_out(start, waited)
+                return value
+            if state == "build":
+                return await self._abuild(pool, registered, start, waited)
+
+            waited = True
+            remaining = None
+            if timeout is not None:
+                remaining = max(timeout - (time.perf_counter() - start), 0)
+            try:
+                async with asyncio.timeout(remaining):
+                    await future
+            except TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                if not pool.give_up(value, timed_out=False):
+                    pool.hand_over(value.instance)
+                raise
+            if pool.give_up(value):
+                raise PoolTimeoutError(registered.concrete, timeout)  # type: ignore[arg-type]
+            if value.instance is not _RETRY:
+                pool.checked_out(start, waited)
+                return value.instance
+
+    def _build[T](
+        self, pool: _Pool, registered: Registered[T], start: float, waited: bool
+    ) -> T:
+        try:
+            instance = self._factory(registered)
+        except BaseException:
+            pool.hand_over(_RETRY)
+            raise
+        pool.checked_out(start, waited)
+        return instance
+
+    async def _abuild[T](
+        self, pool: _Pool, registered: Registered[T], start: float, waited: bool
+    ) -> T:
+        try:
+            instance = await self._afactory(registered)
+        except BaseException:
+            pool.hand_over(_RETRY)
+            raise
+        pool.checked_out(start, waited)
+        return instance
+
+    def release[T](self, registered: Registered[T], instance: T) -> None:
+        self._registered_to_pool[id(registered)].hand_over(instance)
+
+    def stats(self, registered: Registered[Any]) -> PoolStats:
+        return self._registered_to_pool[id(registered)].stats()
+
+    def register[T](
+        self,
+        interface: type[T],
+        concrete: type[T] | Callable[..., Awaitable[T]],
+        marker: Marker | None = None,
+        size: int = DEFAULT_POOL_SIZE,
+        timeout: float | None = None,
+    ) -> Registered[T]:
+        registered = Registered(concrete=concrete, lifetime="pooled", marker=marker)
+        self._registered_to_pool[id(registered)] = _Pool(size=size, timeout=timeout)
+        return self._registry.add(interface, registered)
+
+    def register_many(
+        self, registrations: Iterable[tuple[type, Callable[..., Any], Marker | None]]
+    ) -> int:
+        return self._registry.extend("pooled", registrations, self._add_pool)
+
+    def _add_pool(self, registered: Registered[Any]) -> None:
+        self._registered_to_pool[id(registered)] = _Pool(
+            size=DEFAULT_POOL_SIZE, timeout=None
+        )
+
+    def after_fork(self) -> bool:
+        self._leases = {}
+        rebuilt = False
+        for key, pool in self._registered_to_pool.items():
+            rebuilt = rebuilt or pool.created > 0
+            self._registered_to_pool[key] = _Pool(size=pool.size, timeout=pool.timeout)
+        return rebuilt
+
+    def registrations(self) -> Mapping[type, list[Registered[Any]]]:
+        return self._registry.by_lifetime("pooled")
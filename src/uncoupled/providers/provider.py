@@ -1,7 +1,11 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from contextvars import ContextVar, Token
+from inspect import iscoroutinefunction
+from logging import Logger
+from uncoupled.exception import AsyncRegistrationError, CircularDependencyError
 from uncoupled.lifetime import Lifetime
-from dataclasses import dataclass
-from typing import Protocol
+from dataclasses import dataclass, field
+from typing import Any, Protocol
 
 
 Marker = str
@@ -9,17 +13,86 @@ Marker = str
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class Registered[T]:
-    concrete: type[T]
+    concrete: type[T] | Callable[..., Awaitable[T]]
     lifetime: Lifetime
     marker: Marker | None = None
+    is_async: bool = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "is_async",
+            not isinstance(self.concrete, type) and iscoroutinefunction(self.concrete),
+        )
 
 
 type Resolver[T] = Callable[[list[Registered[T]]], Registered[T]]
+type Factory = Callable[[Registered[Any]], Any]
+type AsyncFactory = Callable[[Registered[Any]], Awaitable[Any]]
+
+
+def construct[T](registered: Registered[T]) -> T:
+    if registered.is_async:
+        raise AsyncRegistrationError(registered.concrete)
+    return registered.concrete()  # type: ignore[return-value]
+
+
+async def aconstruct[T](registered: Registered[T]) -> T:
+    instance = registered.concrete()
+    if registered.is_async:
+        return await instance  # type: ignore[misc]
+    return instance  # type: ignore[return-value]
+
+
+constructing: ContextVar[tuple[Registered[Any], ...]] = ContextVar(
+    "uncoupled_constructing", default=()
+)
+
+
+def ensure_not_constructing(registered: Registered[Any]) -> None:
+    chain = constructing.get()
+    if registered in chain:
+        cycle = (*chain[chain.index(registered) :], registered)
+        raise CircularDependencyError([r.concrete for r in cycle])
+
+
+def enter_construction(
+    registered: Registered[Any],
+) -> Token[tuple[Registered[Any], ...]]:
+    ensure_not_constructing(registered)
+    return constructing.set((*constructing.get(), registered))
+
+
+def warn_multiple_concretes(logger: Logger, warned: set[type], interface: type) -> None:
+    warned.add(interface)
+    logger.warning(
+        "Multiple concretes registered for interface %s. "
+        "Using the first registered one.",
+        interface,
+    )
 
 
 class Provider(Protocol):
-    def get[T](self, interface: type[T], resolver: Resolver[T] | None = None) -> T: ...
+    def get[T](
+        self,
+        interface: type[T],
+        resolver: Resolver[T] | None = None,
+        marker: Marker | None = None,
+    ) -> T: ...
+
+    def get_instance[T](self, registered: Registered[T]) -> T: ...
+
+    async def aget_instance[T](self, registered: Registered[T]) -> T: ...
 
     def register[T](
-        self, interface: type[T], concrete: type[T], marker: Marker | None = None
-    ) -> None: ...
+        self,
+        interface: type[T],
+        concrete: type[T] | Callable[..., Awaitable[T]],
+        marker: Marker | None = None,
+    ) -> Registered[T]: ...
+
+    def register_many(
+        self, registrations: Iterable[tuple[type, Callable[..., Any], Marker | None]]
+    ) -> int: ...
+
+    def registrations(self) -> Mapping[type, list[Registered[Any]]]: ...
@@ -0,0 +1,105 @@
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from logging import Logger
+from typing import Any
+
+from uncoupled.exception import ResolverError, UnregisteredInterfaceError
+from uncoupled.lifetime import Lifetime
+from uncoupled.providers.provider import (
+    Marker,
+    Registered,
+    Resolver,
+    warn_multiple_concretes,
+)
+
+
+class Registry:
+    __slots__ = ("_interfaces",)
+
+    def __init__(self) -> None:
+        self._interfaces: dict[type, tuple[Registered[Any], ...]] = {}
+
+    def add[T](self, interface: type[T], registered: Registered[T]) -> Registered[T]:
+        registrations = self._interfaces.get(interface)
+        self._interfaces[interface] = (
+            (registered,) if registrations is None else (*registrations, registered)
+        )
+        return registered
+
+    def extend(
+        self,
+        lifetime: Lifetime,
+        registrations: Iterable[tuple[type, Callable[..., Any], Marker | None]],
+        added: Callable[[Registered[Any]], None] | None = None,
+    ) -> int:
+        interfaces = self._interfaces
+        grouped: dict[type, list[Registered[Any]]] = {}
+        count = 0
+        try:
+            for interface, concrete, marker in registrations:
+                registered = Registered(
+                    concrete=concrete, lifetime=lifetime, marker=marker
+                )
+                if added is not None:
+                    added(registered)
+                count += 1
+                existing = interfaces.get(interface)
+                if existing is None:
+                    interfaces[interface] = (registered,)
+                    continue
+                pending = grouped.get(interface)
+                if pending is None:
+                    grouped[interface] = [*existing, registered]
+                else:
+                    pending.append(registered)
+        finally:
+            for interface, pending in grouped.items():
+                interfaces[interface] = tuple(pending)
+        return count
+
+    def all(self, interface: type) -> tuple[Registered[Any], ...]:
+        return self._interfaces.get(interface, ())
+
+    def of(self, interface: type, lifetime: Lifetime) -> list[Registered[Any]]:
+        return [
+            r for r in self._interfaces.get(interface, ()) if r.lifetime == lifetime
+        ]
+
+    def items(self) -> Iterator[tuple[type, tuple[Registered[Any], ...]]]:
+        return iter(self._interfaces.items())
+
+    def by_lifetime(self, lifetime: Lifetime) -> Mapping[type, list[Registered[Any]]]:
+        mapping: dict[type, list[Registered[Any]]] = {}
+        for interface, registrations in self._interfaces.items():
+            concretes = [r for r in registrations if r.lifetime == lifetime]
+            if concretes:
+                mapping[interface] = concretes
+        return mapping
+
+    def select[T](
+        self,
+        interface: type[T],
+        lifetime: Lifetime,
+        resolver: Resolver[T] | None,
+        marker: Marker | None,
+        logger: Logger,
+        warned: set[type],
+    ) -> Registered[T]:
+        concretes = self.of(interface, lifetime)
+        if marker is not None:
+            for registered in concretes:
+                if registered.marker == marker:
+                    return registered
+            raise UnregisteredInterfaceError(interface, marker)
+
+        if not concretes:
+            raise UnregisteredInterfaceError(interface)
+
+        if resolver is None:
+            if len(concretes) > 1 and interface not in warned:
+                warn_multiple_concretes(logger, warned, interface)
+            return concretes[0]
+
+        try:
+            return resolver(concretes)
+        except Exception:
+            raise ResolverError(interface)
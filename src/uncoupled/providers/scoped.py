@@ -1,70 +1,188 @@
-from collections import defaultdict
-from collections.abc import Callable, Hashable
-from dataclasses import dataclass
-from logging import Logger
+import asyncio
+import itertools
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from logging import DEBUG, Logger
+from threading import Lock, RLock
 from typing import Any
 
-from uncoupled.exception import ResolverError, UnregisteredInterfaceError
-from uncoupled.providers.provider import Provider, Registered, Resolver, Marker
+from uncoupled.providers.registry import Registry
+from uncoupled.providers.provider import (
+    AsyncFactory,
+    Factory,
+    Marker,
+    Provider,
+    Registered,
+    Resolver,
+    aconstruct,
+    construct,
+    ensure_not_constructing,
+)
 
 
-@dataclass(kw_only=True, slots=True)
-class Scoped[I]:
-    type: type[I]
-    current_scope: Hashable | None = None
-    current_instance: I | None = None
+DEFAULT_MAX_SCOPES = 1024
+
+_creations = itertools.count()
+
+
+class _Instances(dict[Registered[Any], Any]):
+    __slots__ = ("created",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.created: list[int] = []
+
+    def add(self, registered: Registered[Any], instance: Any) -> Any:
+        current = self.get(registered)
+        if current is not None:
+            return current
+        self[registered] = instance
+        self.created.append(next(_creations))
+        return instance
 
 
 class ScopedProvider(Provider):
     def __init__(
-        self, *, get_scope: Callable[[], Hashable], logger: Logger | None = None
+        self,
+        *,
+        get_scope: Callable[[], Hashable],
+        logger: Logger | None = None,
+        max_scopes: int = DEFAULT_MAX_SCOPES,
+        factory: Factory = construct,
+        afactory: AsyncFactory = aconstruct,
+        registry: Registry | None = None,
     ) -> None:
-        self._interface_to_concretes: dict[type, list[Registered[Any]]] = defaultdict(
-            list
-        )
-        self._registered_to_scoped: dict[Registered[Any], Scoped[Any]] = {}
+        self._registry = Registry() if registry is None else registry
+        self._scope_to_instances: OrderedDict[Hashable, _Instances] = OrderedDict()
+        self._scope_to_locks: dict[Hashable, dict[Registered[Any], RLock]] = {}
+        self._scopes_lock = Lock()
+        self._pending: dict[tuple[Hashable, Registered[Any]], asyncio.Future[Any]] = {}
 
         self._get_scope = get_scope
+        self._max_scopes = max_scopes
         self._logger = logger or Logger("ScopedProvider")
+        self._factory = factory
+        self._afactory = afactory
+        self._warned: set[type] = set()
+
+    def get[T](
+        self,
+        interface: type[T],
+        resolver: Resolver[T] | None = None,
+        marker: Marker | None = None,
+    ) -> T:
+        return self.get_instance(
+            self._registry.select(
+                interface, "scoped", resolver, marker, self._logger, self._warned
+            )
+        )
+
+    def _lock(self, scope: Hashable, registered: Registered[Any]) -> RLock:
+        with self._scopes_lock:
+            locks = self._scope_to_locks.get(scope)
+            if locks is None:
+                locks = self._scope_to_locks[scope] = {}
+            lock = locks.get(registered)
+            if lock is None:
+                lock = locks[registered] = RLock()
+            return lock
 
-    def get[T](self, interface: type[T], resolver: Resolver[T] | None = None) -> T:
-        if interface not in self._interface_to_concretes:
-            raise UnregisteredInterfaceError(interface)
+    def get_instance[T](self, registered: Registered[T]) -> T:
+        scope = self._get_scope()
+        instances = self._scope_to_instances.get(scope)
+        if instances is not None:
+            instance = instances.get(registered)
+            if instance is not None:
+                return instance
 
-        concretes = self._interface_to_concretes[interface]
-        if len(concretes) == 0:
-            raise UnregisteredInterfaceError(interface)
+        with self._lock(scope, registered):
+            with self._scopes_lock:
+                instances = self._scope_to_instances.get(scope)
+                if instances is None:
+                    instances = self._open_scope(scope)
+                else:
+                    self._scope_to_instances.move_to_end(scope)
 
-        if resolver is None:
-            if len(concretes) > 1:
-                self._logger.warning(
-                    f"Multiple concretes registered for interface {interface}. "
-                    "Using the first registered one."
+            instance = instances.get(registered)
+            if instance is None:
+                if self._logger.isEnabledFor(DEBUG):
+                    self._logger.debug(
+                        "Creating new instance of %s in scope %s",
+                        registered.concrete.__name__,
+                        scope,
+                    )
+                instance = self._factory(registered)
+                with self._scopes_lock:
+                    instance = instances.add(registered, instance)
+            return instance
+
+    async def aget_instance[T](self, registered: Registered[T]) -> T:
+        scope = self._get_scope()
+        instances = self._scope_to_instances.get(scope)
+        if instances is not None:
+            instance = instances.get(registered)
+            if instance is not None:
+                return instance
+
+        key = (scope, registered)
+        with self._scopes_lock:
+            task = self._pending.get(key)
+            if task is not None:
+                ensure_not_constructing(registered)
+            else:
+                task = self._pending[key] = asyncio.ensure_future(
+                    self._abuild(scope, registered)
                 )
-            return self._get_scoped_instance(concretes[0])
+        return await asyncio.shield(task)
 
+    async def _abuild[T](self, scope: Hashable, registered: Registered[T]) -> T:
         try:
-            register = resolver(concretes)
-        except Exception:
-            raise ResolverError(interface)
-
-        return self._get_scoped_instance(register)
-
-    def _get_scoped_instance[T](self, registered: Registered[T]) -> T:
-        scoped = self._registered_to_scoped[registered]
-        new_scope = self._get_scope()
-        if scoped.current_instance is None or scoped.current_scope != new_scope:
-            self._logger.debug(
-                f"Creating new instance of {registered.concrete.__name__} "
-                f"old scope was {scoped.current_scope}, new scope is {new_scope}"
-            )
-            scoped.current_scope = new_scope
-            scoped.current_instance = registered.concrete()
-        return scoped.current_instance
+            instance = await self._afactory(registered)
+            with self._scopes_lock:
+                instances = self._scope_to_instances.get(scope)
+                if instances is None:
+                    instances = self._open_scope(scope)
+                return instances.add(registered, instance)
+        finally:
+            self._pending.pop((scope, registered), None)
+
+    def _open_scope(self, scope: Hashable) -> _Instances:
+        instances = _Instances()
+        self._scope_to_instances[scope] = instances
+        while len(self._scope_to_instances) > self._max_scopes:
+            evicted, _ = self._scope_to_instances.popitem(last=False)
+            self._scope_to_locks.pop(evicted, None)
+            if self._logger.isEnabledFor(DEBUG):
+                self._logger.debug("Evicting least recently used scope %s", evicted)
+        return instances
+
+    def end_scope(self, scope: Hashable) -> list[tuple[int, Any]]:
+        with self._scopes_lock:
+            instances = self._scope_to_instances.pop(scope, None)
+            self._scope_to_locks.pop(scope, None)
+        if instances is None:
+            return []
+        return list(zip(instances.created, instances.values()))
 
     def register[T](
-        self, interface: type[T], concrete: type[T], marker: Marker | None = None
-    ) -> None:
-        registered = Registered(concrete=concrete, marker=marker, lifetime="scoped")
-        self._interface_to_concretes[interface].append(registered)
-        self._registered_to_scoped[registered] = Scoped(type=concrete)
+        self,
+        interface: type[T],
+        concrete: type[T] | Callable[..., Awaitable[T]],
+        marker: Marker | None = None,
+    ) -> Registered[T]:
+        return self._registry.add(
+            interface, Registered(concrete=concrete, lifetime="scoped", marker=marker)
+        )
+
+    def register_many(
+        self, registrations: Iterable[tuple[type, Callable[..., Any], Marker | None]]
+    ) -> int:
+        return self._registry.extend("scoped", registrations)
+
+    def after_fork(self) -> None:
+        self._scopes_lock = Lock()
+        self._scope_to_locks = {}
+        self._pending = {}
+
+    def registrations(self) -> Mapping[type, list[Registered[Any]]]:
+        return self._registry.by_lifetime("scoped")
@@ -1,57 +1,155 @@
-from collections import defaultdict
-from dataclasses import dataclass
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, field
 from logging import Logger
+from threading import Lock, RLock
 from typing import Any, cast
-from uncoupled.exception import ResolverError, UnregisteredInterfaceError
-from uncoupled.providers.provider import Provider, Registered, Resolver, Marker
+from uncoupled.exception import (
+    ForkPolicyConflictError,
+)
+from uncoupled.lifetime import ForkPolicy
+from uncoupled.providers.registry import Registry
+from uncoupled.providers.provider import (
+    AsyncFactory,
+    Factory,
+    Marker,
+    Provider,
+    Registered,
+    Resolver,
+    aconstruct,
+    construct,
+    ensure_not_constructing,
+)
 
 
 @dataclass(kw_only=True, slots=True)
 class Singleton[I]:
     instance: I | None = None
+    lock: RLock = field(default_factory=RLock)
+    task: "asyncio.Future[I] | None" = None
 
 
 class SingletonProvider(Provider):
-    def __init__(self, *, logger: Logger | None = None) -> None:
-        self._interface_to_concretes: dict[type, list[Registered[Any]]] = defaultdict(
-            list
-        )
+    def __init__(
+        self,
+        *,
+        logger: Logger | None = None,
+        factory: Factory = construct,
+        afactory: AsyncFactory = aconstruct,
+        registry: Registry | None = None,
+    ) -> None:
+        self._registry = Registry() if registry is None else registry
+        self._policies: dict[Registered[Any], ForkPolicy] = {}
         self._registered_to_singleton: dict[Registered[Any], Singleton[Any]] = {}
 
         self._logger = logger or Logger("SingletonProvider")
+        self._factory = factory
+        self._afactory = afactory
+        self._warned: set[type] = set()
+        self._singletons_lock = Lock()
+
+    def get[T](
+        self,
+        interface: type[T],
+        resolver: Resolver[T] | None = None,
+        marker: Marker | None = None,
+    ) -> T:
+        return self.get_instance(
+            self._registry.select(
+                interface, "singleton", resolver, marker, self._logger, self._warned
+            )
+        )
+
+    def _singleton(self, registered: Registered[Any]) -> Singleton[Any]:
+        with self._singletons_lock:
+            singleton = self._registered_to_singleton.get(registered)
+            if singleton is None:
+                singleton = self._registered_to_singleton[registered] = Singleton()
+            return singleton
 
-    def get[T](self, interface: type[T], resolver: Resolver[T] | None = None) -> T:
-        if interface not in self._interface_to_concretes:
-            raise UnregisteredInterfaceError(interface)
+    def get_instance[T](self, registered: Registered[T]) -> T:
+        singleton = self._registered_to_singleton.get(registered)
+        if singleton is None:
+            singleton = self._singleton(registered)
+        instance = singleton.instance
+        if instance is None:
+            with singleton.lock:
+                instance = singleton.instance
+                if instance is None:
+                    instance = singleton.instance = self._factory(registered)
+        return cast(Any, instance)
 
-        concretes = self._interface_to_concretes[interface]
-        if len(concretes) == 0:
-            raise UnregisteredInterfaceError(interface)
+    async def aget_instance[T](self, registered: Registered[T]) -> T:
+        singleton = self._registered_to_singleton.get(registered)
+        if singleton is None:
+            singleton = self._singleton(registered)
+        instance = singleton.instance
+        if instance is not None:
+            return instance
 
-        if resolver is None:
-            if len(concretes) > 1:
-                self._logger.warning(
-                    f"Multiple concretes registered for interface {interface}. "
-                    "Using the first registered one."
+        with singleton.lock:
+            task = singleton.task
+            if task is not None:
+                ensure_not_constructing(registered)
+            else:
+                task = singleton.task = asyncio.ensure_future(
+                    self._abuild(registered, singleton)
                 )
-            return self._get_singleton_instance(concretes[0])
+        return await asyncio.shield(task)
 
+    async def _abuild[T](self, registered: Registered[T], singleton: Singleton[T]) -> T:
         try:
-            register = resolver(concretes)
-        except Exception:
-            raise ResolverError(interface)
+            instance = await self._afactory(registered)
+            with singleton.lock:
+                if singleton.instance is None:
+                    singleton.instance = instance
+                return singleton.instance
+        finally:
+            singleton.task = None
 
-        return self._get_singleton_instance(register)
+    def register[T](
+        self,
+        interface: type[T],
+        concrete: type[T] | Callable[..., Awaitable[T]],
+        marker: Marker | None = None,
+        fork: ForkPolicy = "share",
+    ) -> Registered[T]:
+        registered = Registered(concrete=concrete, lifetime="singleton", marker=marker)
+        policy = self._policies.setdefault(registered, fork)
+        if policy != fork:
+            raise ForkPolicyConflictError(concrete, policy, fork)
+        return self._registry.add(interface, registered)
 
-    def _get_singleton_instance[T](self, registered: Registered[T]) -> T:
-        singleton = self._registered_to_singleton[registered]
-        if singleton.instance is None:
-            singleton.instance = registered.concrete()
-        return cast(Any, singleton.instance)
+    def register_many(
+        self, registrations: Iterable[tuple[type, Callable[..., Any], Marker | None]]
+    ) -> int:
+        return self._registry.extend("singleton", registrations, self._share)
 
-    def register[T](
-        self, interface: type[T], concrete: type[T], marker: Marker | None = None
-    ) -> None:
-        registered = Registered(concrete=concrete, marker=marker, lifetime="singleton")
-        self._interface_to_concretes[interface].append(registered)
-        self._registered_to_singleton[registered] = Singleton()
+    def _share(self, registered: Registered[Any]) -> None:
+        policy = self._policies.setdefault(registered, "share")
+        if policy != "share":
+            raise ForkPolicyConflictError(registered.concrete, policy, "share")
+
+    def shared(self) -> list[Registered[Any]]:
+        return [
+            registered
+            for registered, policy in self._policies.items()
+            if policy == "share"
+        ]
+
+    def after_fork(self) -> bool:
+        self._singletons_lock = Lock()
+        rebuilt = False
+        for registered, singleton in self._registered_to_singleton.items():
+            singleton.lock = RLock()
+            singleton.task = None
+            if (
+                self._policies.get(registered) == "rebuild"
+                and singleton.instance is not None
+            ):
+                singleton.instance = None
+                rebuilt = True
+        return rebuilt
+
+    def registrations(self) -> Mapping[type, list[Registered[Any]]]:
+        return self._registry.by_lifetime("singleton")
@@ -0,0 +1,105 @@
+import asyncio
+import weakref
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from contextvars import ContextVar
+from logging import Logger
+from typing import Any
+
+from uncoupled.providers.registry import Registry
+from uncoupled.providers.provider import (
+    AsyncFactory,
+    Factory,
+    Marker,
+    Provider,
+    Registered,
+    Resolver,
+    aconstruct,
+    construct,
+)
+
+type _Owned = tuple[weakref.ref[asyncio.Task[Any]] | None, dict[Registered[Any], Any]]
+
+
+def _current_task() -> asyncio.Task[Any] | None:
+    loop = asyncio._get_running_loop()
+    if loop is None:
+        return None
+    return asyncio.current_task(loop)
+
+
+class TaskLocalProvider(Provider):
+    def __init__(
+        self,
+        *,
+        logger: Logger | None = None,
+        factory: Factory = construct,
+        afactory: AsyncFactory = aconstruct,
+        registry: Registry | None = None,
+    ) -> None:
+        self._registry = Registry() if registry is None else registry
+        self._owned: ContextVar[_Owned | None] = ContextVar(
+            f"uncoupled_task_local_{id(self)}", default=None
+        )
+        self._logger = logger or Logger("TaskLocalProvider")
+        self._factory = factory
+        self._afactory = afactory
+        self._warned: set[type] = set()
+
+    def get[T](
+        self,
+        interface: type[T],
+        resolver: Resolver[T] | None = None,
+        marker: Marker | None = None,
+    ) -> T:
+        return self.get_instance(
+            self._registry.select(
+                interface, "task_local", resolver, marker, self._logger, self._warned
+            )
+        )
+
+    def _instances(self) -> dict[Registered[Any], Any]:
+        task = _current_task()
+        owned = self._owned.get()
+        if owned is not None:
+            owner = owned[0]
+            if (None if owner is None else owner()) is task:
+                return owned[1]
+
+        instances: dict[Registered[Any], Any] = {}
+        self._owned.set((None if task is None else weakref.ref(task), instances))
+        return instances
+
+    def get_instance[T](self, registered: Registered[T]) -> T:
+        instances = self._instances()
+        instance = instances.get(registered)
+        if instance is None:
+            instance = instances[registered] = self._factory(registered)
+        return instance
+
+    async def aget_instance[T](self, registered: Registered[T]) -> T:
+        instances = self._instances()
+        instance = instances.get(registered)
+        if instance is None:
+            instance = instances.setdefault(
+                registered, await self._afactory(registered)
+            )
+        return instance
+
+    def register[T](
+        self,
+        interface: type[T],
+        concrete: type[T] | Callable[..., Awaitable[T]],
+        marker: Marker | None = None,
+    ) -> Registered[T]:
+        return self._registry.add(
+            interface,
+            Registered(concrete=concrete, lifetime="task_local", marker=marker),
+        )
+
+    def register_many(
+        self, registrations: Iterable[tuple[type, Callable[..., Any], Marker | None]]
+    ) -> int:
+        return self._registry.extend("task_local", registrations)
+
+    def registrations(self) -> Mapping[type, list[Registered[Any]]]:
+        return self._registry.by_lifetime("task_local")
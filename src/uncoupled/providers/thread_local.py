@@ -0,0 +1,87 @@
+import threading
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from logging import Logger
+from typing import Any
+
+from uncoupled.providers.registry import Registry
+from uncoupled.providers.provider import (
+    AsyncFactory,
+    Factory,
+    Marker,
+    Provider,
+    Registered,
+    Resolver,
+    aconstruct,
+    construct,
+)
+
+
+class ThreadLocalProvider(Provider):
+    def __init__(
+        self,
+        *,
+        logger: Logger | None = None,
+        factory: Factory = construct,
+        afactory: AsyncFactory = aconstruct,
+        registry: Registry | None = None,
+    ) -> None:
+        self._registry = Registry() if registry is None else registry
+        self._local = threading.local()
+        self._logger = logger or Logger("ThreadLocalProvider")
+        self._factory = factory
+        self._afactory = afactory
+        self._warned: set[type] = set()
+
+    def get[T](
+        self,
+        interface: type[T],
+        resolver: Resolver[T] | None = None,
+        marker: Marker | None = None,
+    ) -> T:
+        return self.get_instance(
+            self._registry.select(
+                interface, "thread_local", resolver, marker, self._logger, self._warned
+            )
+        )
+
+    def _instances(self) -> dict[Registered[Any], Any]:
+        try:
+            return self._local.instances
+        except AttributeError:
+            instances = self._local.instances = {}
+            return instances
+
+    def get_instance[T](self, registered: Registered[T]) -> T:
+        instances = self._instances()
+        instance = instances.get(registered)
+        if instance is None:
+            instance = instances[registered] = self._factory(registered)
+        return instance
+
+    async def aget_instance[T](self, registered: Registered[T]) -> T:
+        instances = self._instances()
+        instance = instances.get(registered)
+        if instance is None:
+            instance = instances.setdefault(
+                registered, await self._afactory(registered)
+            )
+        return instance
+
+    def register[T](
+        self,
+        interface: type[T],
+        concrete: type[T] | Callable[..., Awaitable[T]],
+        marker: Marker | None = None,
+    ) -> Registered[T]:
+        return self._registry.add(
+            interface,
+            Registered(concrete=concrete, lifetime="thread_local", marker=marker),
+        )
+
+    def register_many(
+        self, registrations: Iterable[tuple[type, Callable[..., Any], Marker | None]]
+    ) -> int:
+        return self._registry.extend("thread_local", registrations)
+
+    def registrations(self) -> Mapping[type, list[Registered[Any]]]:
+        return self._registry.by_lifetime("thread_local")
@@ -1,38 +1,67 @@
-from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from logging import Logger
-from uncoupled.exception import ResolverError, UnregisteredInterfaceError
-from uncoupled.providers.provider import Provider, Registered, Resolver, Marker
+from typing import Any
+from uncoupled.providers.registry import Registry
+from uncoupled.providers.provider import (
+    AsyncFactory,
+    Factory,
+    Marker,
+    Provider,
+    Registered,
+    Resolver,
+    aconstruct,
+    construct,
+)
 
 
 class TransientProvider(Provider):
-    def __init__(self, *, logger: Logger | None = None) -> None:
-        self._interface_to_concretes: dict[type, list[Registered]] = defaultdict(list)
+    def __init__(
+        self,
+        *,
+        logger: Logger | None = None,
+        factory: Factory = construct,
+        afactory: AsyncFactory = aconstruct,
+        registry: Registry | None = None,
+    ) -> None:
+        self._registry = Registry() if registry is None else registry
         self._logger = logger or Logger("TransientProvider")
+        self._factory = factory
+        self._afactory = afactory
+        self._warned: set[type] = set()
 
-    def get[T](self, interface: type[T], resolver: Resolver[T] | None = None) -> T:
-        if interface not in self._interface_to_concretes:
-            raise UnregisteredInterfaceError(interface)
-
-        concretes = self._interface_to_concretes[interface]
-        if len(concretes) == 0:
-            raise UnregisteredInterfaceError(interface)
+    def get[T](
+        self,
+        interface: type[T],
+        resolver: Resolver[T] | None = None,
+        marker: Marker | None = None,
+    ) -> T:
+        return self.get_instance(
+            self._registry.select(
+                interface, "transient", resolver, marker, self._logger, self._warned
+            )
+        )
 
-        if resolver is None:
-            if len(concretes) > 1:
-                self._logger.warning(
-                    f"Multiple concretes registered for interface {interface}. "
-                    "Using the first registered one."
-                )
-            return concretes[0].concrete()
+    def get_instance[T](self, registered: Registered[T]) -> T:
+        return self._factory(registered)
 
-        try:
-            return resolver(concretes).concrete()
-        except Exception:
-            raise ResolverError(interface)
+    async def aget_instance[T](self, registered: Registered[T]) -> T:
+        return await self._afactory(registered)
 
     def register[T](
-        self, interface: type[T], concrete: type[T], marker: Marker | None = None
-    ) -> None:
-        self._interface_to_concretes[interface].append(
-            Registered(concrete=concrete, marker=marker, lifetime="transient")
+        self,
+        interface: type[T],
+        concrete: type[T] | Callable[..., Awaitable[T]],
+        marker: Marker | None = None,
+    ) -> Registered[T]:
+        return self._registry.add(
+            interface,
+            Registered(concrete=concrete, lifetime="transient", marker=marker),
         )
+
+    def register_many(
+        self, registrations: Iterable[tuple[type, Callable[..., Any], Marker | None]]
+    ) -> int:
+        return self._registry.extend("transient", registrations)
+
+    def registrations(self) -> Mapping[type, list[Registered[Any]]]:
+        return self._registry.by_lifetime("transient")
@@ -0,0 +1,286 @@
+import ast
+import importlib.util
+import os
+import pickle
+import sys
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from itertools import groupby
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from uncoupled.lazy import import_path
+from uncoupled.lifetime import Lifetime
+from uncoupled.providers.provider import Marker
+
+if TYPE_CHECKING:
+    from uncoupled.container import Container
+
+FORMAT = 1
+
+_DECORATORS: tuple[Lifetime, ...] = (
+    "transient",
+    "singleton",
+    "scoped",
+    "thread_local",
+    "task_local",
+)
+
+
+def _decorator(lifetime: Lifetime) -> Callable[..., Any]:
+    def decorator[T](interface: type, marker: Marker | None = None) -> Callable[[T], T]:
+        def register(concrete: T) -> T:
+            return concrete
+
+        return register
+
+    decorator.__name__ = decorator.__qualname__ = lifetime
+    return decorator
+
+
+transient = _decorator("transient")
+singleton = _decorator("singleton")
+scoped = _decorator("scoped")
+thread_local = _decorator("thread_local")
+task_local = _decorator("task_local")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Discovered:
+    lifetime: Lifetime
+    interface: str
+    concrete: str
+    marker: Marker | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ScanReport:
+    registrations: tuple[Discovered, ...]
+    modules: int
+    cached: int
+    imported: tuple[str, ...]
+    seconds: float
+
+
+def _is_module(name: str) -> bool:
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class _Visitor:
+    def __init__(self, module: str, is_package: bool) -> None:
+        self._module = module
+        self._package = module if is_package else module.rpartition(".")[0]
+        self._names: dict[str, str] = {}
+        self._modules: dict[str, str] = {}
+        self.found: list[Discovered] = []
+
+    def _absolute(self, module: str | None, level: int) -> str:
+        if level == 0:
+            return module or ""
+        base = self._package.split(".")
+        base = base[: len(base) - level + 1]
+        return ".".join([*base, module] if module else base)
+
+    def _imports(self, node: ast.Import | ast.ImportFrom) -> None:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    self._modules[alias.asname] = alias.name
+                else:
+                    top = alias.name.partition(".")[0]
+                    self._modules[top] = top
+            return
+
+        module = self._absolute(node.module, node.level)
+        for alias in node.names:
+            self._names[alias.asname or alias.name] = f"{module}:{alias.name}"
+            self._modules[alias.asname or alias.name] = f"{module}.{alias.name}"
+
+    def _path(self, node: ast.expr) -> str | None:
+        if isinstance(node, ast.Name):
+            return self._names.get(node.id, f"{self._module}:{node.id}")
+
+        parts: list[str] = []
+        while isinstance(node, ast.Attribute):
+            parts.insert(0, node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name) or node.id not in self._modules:
+            return None
+
+        module = self._modules[node.id]
+        for i in range(len(parts) - 1, 0, -1):
+            candidate = ".".join([module, *parts[:i]])
+            if _is_module(candidate):
+                return f"{candidate}:{'.'.join(parts[i:])}"
+        return f"{module}:{'.'.join(parts)}"
+
+    def _lifetime(self, node: ast.expr) -> Lifetime | None:
+        path = self._path(node)
+        if path is None:
+            return None
+        module, _, name = path.partition(":")
+        if module == "uncoupled.scan" and name in _DECORATORS:
+            return cast(Lifetime, name)
+        return None
+
+    def _decorated(
+        self, node: ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef, qualname: str
+    ) -> None:
+        for decorator in node.decorator_list:
+            if not isinstance(decorator, ast.Call) or not decorator.args:
+                continue
+            lifetime = self._lifetime(decorator.func)
+            if lifetime is None:
+                continue
+
+            interface = self._path(decorator.args[0])
+            marker = next(
+                (k.value for k in decorator.keywords if k.arg == "marker"),
+                decorator.args[1] if len(decorator.args) > 1 else None,
+            )
+            if interface is None or not (
+                marker is None
+                or (isinstance(marker, ast.Constant) and isinstance(marker.value, str))
+            ):
+                raise ValueError(
+                    f"Cannot read the registration of {qualname} in {self._module} "
+                    f"(line {decorator.lineno}) without importing it."
+                )
+
+            self.found.append(
+                Discovered(
+                    lifetime=lifetime,
+                    interface=interface,
+                    concrete=f"{self._module}:{qualname}",
+                    marker=None if marker is None else marker.value,
+                )
+            )
+
+    def visit(self, body: list[ast.stmt], prefix: str = "") -> None:
+        for node in body:
+            if isinstance(node, ast.Import | ast.ImportFrom):
+                self._imports(node)
+            elif isinstance(node, ast.ClassDef):
+                self._decorated(node, prefix + node.name)
+                self.visit(node.body, f"{prefix}{node.name}.")
+            elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+                if not prefix:
+                    self._decorated(node, node.name)
+
+
+def discover(path: Path, module: str) -> list[Discovered]:
+    source = path.read_bytes()
+    if b"uncoupled" not in source:
+        return []
+
+    visitor = _Visitor(module, path.name == "__init__.py")
+    visitor.visit(ast.parse(source, str(path)).body)
+    return visitor.found
+
+
+def _modules(package: str) -> Iterator[tuple[Path, str]]:
+    spec = importlib.util.find_spec(package)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {package!r}", name=package)
+
+    if not spec.submodule_search_locations:
+        if spec.origin and spec.origin.endswith(".py"):
+            yield Path(spec.origin), package
+        return
+
+    for location in spec.submodule_search_locations:
+        root = Path(location)
+        for directory, dirnames, filenames in os.walk(root):
+            current = Path(directory)
+            dirnames[:] = sorted(
+                d for d in dirnames if (current / d / "__init__.py").is_file()
+            )
+            parts = current.relative_to(root).parts
+            for filename in sorted(filenames):
+                if not filename.endswith(".py"):
+                    continue
+                name = filename.removesuffix(".py")
+                names = parts if name == "__init__" else (*parts, name)
+                yield current / filename, ".".join((package, *names))
+
+
+class _DiscoveryCache:
+    def __init__(self, path: str | os.PathLike[str] | None) -> None:
+        self.path = None if path is None else Path(path)
+        self._entries: dict[str, tuple[int, int, str, list[Discovered]]] = {}
+        self._dirty = False
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "rb") as f:
+                header, entries = pickle.load(f)
+        except Exception:
+            return
+        if header == (FORMAT, sys.version_info[:2]):
+            self._entries = entries
+
+    def discover(self, path: Path, module: str) -> tuple[list[Discovered], bool]:
+        stat = path.stat()
+        key = str(path)
+        entry = self._entries.get(key)
+        if entry is not None and entry[:3] == (stat.st_mtime_ns, stat.st_size, module):
+            return entry[3], True
+
+        found = discover(path, module)
+        if self.path is not None:
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, module, found)
+            self._dirty = True
+        return found, False
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(
+                ((FORMAT, sys.version_info[:2]), self._entries),
+                f,
+                pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, self.path)
+
+
+def scan(
+    container: "Container",
+    package: str,
+    cache: str | os.PathLike[str] | None = None,
+) -> ScanReport:
+    start = time.perf_counter()
+    before = set(sys.modules)
+    discovery = _DiscoveryCache(cache)
+
+    found: list[Discovered] = []
+    modules = cached = 0
+    for path, module in _modules(package):
+        discovered, hit = discovery.discover(path, module)
+        found += discovered
+        modules += 1
+        cached += hit
+    discovery.save()
+
+    for lifetime, group in groupby(found, key=lambda d: d.lifetime):
+        container.register_many(
+            lifetime,
+            [(import_path(d.interface), d.concrete, d.marker) for d in group],
+        )
+
+    return ScanReport(
+        registrations=tuple(found),
+        modules=modules,
+        cached=cached,
+        imported=tuple(sorted(set(sys.modules) - before)),
+        seconds=time.perf_counter() - start,
+    )
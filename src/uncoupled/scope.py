@@ -0,0 +1,96 @@
+from collections.abc import Callable, Sequence
+from contextvars import ContextVar, Token
+from logging import Logger
+from operator import itemgetter
+from types import TracebackType
+from typing import Any, Self
+
+from uncoupled.providers.scoped import ScopedProvider
+
+
+class Scope:
+    def __init__(self, providers: Sequence[ScopedProvider], logger: Logger) -> None:
+        self._providers = providers
+        self._logger = logger
+        self._token: Token[Scope | None] | None = None
+        self._callbacks: list[Callable[[], None]] = []
+
+    def callback(self, fn: Callable[[], None]) -> None:
+        self._callbacks.append(fn)
+
+    def __enter__(self) -> Self:
+        self._token = current_scope.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        errors: list[Exception] = []
+        instances, callbacks = self._end()
+        for instance in instances:
+            close = getattr(instance, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    errors.append(e)
+            elif hasattr(instance, "aclose"):
+                self._logger.warning(
+                    "%s only defines `aclose`, use `async with container.scope()` "
+                    "to release it.",
+                    type(instance).__name__,
+                )
+        for fn in reversed(callbacks):
+            fn()
+
+        if errors:
+            raise ExceptionGroup("Failed to close scoped instances", errors)
+
+    async def __aenter__(self) -> Self:
+        return self.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        errors: list[Exception] = []
+        instances, callbacks = self._end()
+        for instance in instances:
+            try:
+                aclose = getattr(instance, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+                    continue
+
+                close = getattr(instance, "close", None)
+                if close is not None:
+                    close()
+            except Exception as e:
+                errors.append(e)
+        for fn in reversed(callbacks):
+            fn()
+
+        if errors:
+            raise ExceptionGroup("Failed to close scoped instances", errors)
+
+    def _end(self) -> tuple[list[Any], list[Callable[[], None]]]:
+        if self._token is not None:
+            current_scope.reset(self._token)
+            self._token = None
+
+        created: list[tuple[int, Any]] = []
+        for provider in self._providers:
+            created += provider.end_scope(self)
+        created.sort(key=itemgetter(0), reverse=True)
+        callbacks, self._callbacks = self._callbacks, []
+        return [instance for _, instance in created], callbacks
+
+
+current_scope: ContextVar[Scope | None] = ContextVar(
+    "uncoupled_current_scope", default=None
+)
@@ -0,0 +1,264 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from uncoupled.lazy import import_path
+from uncoupled.fork import track
+from uncoupled.observer import Observer
+from uncoupled.providers.provider import Registered
+
+if TYPE_CHECKING:
+    from uncoupled.container import Container
+
+
+def _name(obj: Any) -> str:
+    return getattr(obj, "__qualname__", None) or repr(obj)
+
+
+@dataclass(slots=True, eq=False, kw_only=True)
+class TraceNode:
+    interface: type | None
+    registered: Registered[Any]
+    provider: str
+    parent: "TraceNode | None"
+    children: list["TraceNode"] = field(default_factory=list)
+    constructed: bool = False
+    thread: int = field(default_factory=threading.get_ident)
+    start: float = field(default_factory=time.perf_counter)
+    end: float = 0.0
+    cpu_start: float = field(default_factory=time.thread_time)
+    cpu_end: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return _name(
+            self.registered.concrete if self.interface is None else self.interface
+        )
+
+    @property
+    def seconds(self) -> float:
+        return self.end - self.start
+
+    @property
+    def cpu_seconds(self) -> float:
+        return self.cpu_end - self.cpu_start
+
+    @property
+    def self_seconds(self) -> float:
+        return self.seconds - sum(child.seconds for child in self.children)
+
+    def walk(self) -> Iterator["TraceNode"]:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ConstructorTiming:
+    concrete: str
+    lifetime: str
+    count: int
+    seconds: float
+    cpu_seconds: float
+
+
+_stack: ContextVar[tuple[TraceNode, ...]] = ContextVar(
+    "uncoupled_trace_stack", default=()
+)
+
+
+class Tracer(Observer):
+    def __init__(self, container: "Container") -> None:
+        self._container = container
+        self._lock = threading.Lock()
+        self.roots: list[TraceNode] = []
+        self._origin = time.perf_counter()
+        track(self)
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+    def _push(self, interface: type | None, registered: Registered[Any]) -> TraceNode:
+        stack = _stack.get()
+        parent = stack[-1] if stack else None
+        provider = self._container._lifetime_to_provider[registered.lifetime]
+        node = TraceNode(
+            interface=interface,
+            registered=registered,
+            provider=type(provider).__name__,
+            parent=parent,
+        )
+        with self._lock:
+            (self.roots if parent is None else parent.children).append(node)
+        _stack.set((*stack, node))
+        return node
+
+    def _pop(self) -> None:
+        stack = _stack.get()
+        if not stack:
+            return
+
+        node = stack[-1]
+        node.end = time.perf_counter()
+        node.cpu_end = time.thread_time()
+        _stack.set(stack[:-1])
+
+    def on_resolve_start(self, interface: type, registered: Registered[Any]) -> None:
+        self._push(interface, registered)
+
+    def on_resolve_end(self, interface: type, registered: Registered[Any]) -> None:
+        self._pop()
+
+    def on_construct_start(self, registered: Registered[Any]) -> None:
+        stack = _stack.get()
+        if stack and stack[-1].registered == registered and not stack[-1].constructed:
+            stack[-1].constructed = True
+            return
+
+        self._push(None, registered).constructed = True
+
+    def on_construct_end(self, registered: Registered[Any]) -> None:
+        stack = _stack.get()
+        if stack and stack[-1].interface is None and stack[-1].registered == registered:
+            self._pop()
+
+    def nodes(self) -> Iterator[TraceNode]:
+        for root in list(self.roots):
+            yield from root.walk()
+
+    def slowest(self, n: int = 10) -> list[ConstructorTiming]:
+        totals: defaultdict[Registered[Any], list[float]] = defaultdict(
+            lambda: [0, 0.0, 0.0]
+        )
+        for node in self.nodes():
+            if node.constructed:
+                total = totals[node.registered]
+                total[0] += 1
+                total[1] += node.self_seconds
+                total[2] += node.cpu_seconds - sum(
+                    child.cpu_seconds for child in node.children
+                )
+
+        timings = [
+            ConstructorTiming(
+                concrete=_name(registered.concrete),
+                lifetime=registered.lifetime,
+                count=int(count),
+                seconds=seconds,
+                cpu_seconds=cpu_seconds,
+            )
+            for registered, (count, seconds, cpu_seconds) in totals.items()
+        ]
+        return sorted(timings, key=lambda t: t.seconds, reverse=True)[:n]
+
+    def chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": node.name,
+                    "cat": node.registered.lifetime,
+                    "ph": "X",
+                    "ts": (node.start - self._origin) * 1e6,
+                    "dur": node.seconds * 1e6,
+                    "pid": pid,
+                    "tid": node.thread,
+                    "args": {
+                        "concrete": _name(node.registered.concrete),
+                        "provider": node.provider,
+                        "parent": None if node.parent is None else node.parent.name,
+                        "constructed": node.constructed,
+                        "cpu_ms": node.cpu_seconds * 1e3,
+                    },
+                }
+                for node in self.nodes()
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def collapsed_stacks(self) -> str:
+        stacks: defaultdict[str, int] = defaultdict(int)
+        for node in self.nodes():
+            names = []
+            parent: TraceNode | None = node
+            while parent is not None:
+                names.append(parent.name)
+                parent = parent.parent
+            stacks[";".join(reversed(names))] += round(node.self_seconds * 1e6)
+        return "".join(f"{stack} {us}\n" for stack, us in stacks.items())
+
+
+@contextmanager
+def trace(container: "Container") -> Iterator[Tracer]:
+    tracer = Tracer(container)
+    container.observe(tracer)
+    try:
+        yield tracer
+    finally:
+        container.unobserve(tracer)
+
+
+async def _resolve_all(container: "Container") -> list[tuple[str, Exception]]:
+    errors: list[tuple[str, Exception]] = []
+    async with container.scope():
+        for key, _ in list(container._get_index().items()):
+            interface, marker = key if isinstance(key, tuple) else (key, None)
+            try:
+                await container.aget(interface, marker=marker)
+            except Exception as e:
+                errors.append((_name(interface), e))
+    return errors
+
+
+def main(argv: list[str] | None = None) -> int:
+    from uncoupled.container import Container
+
+    parser = argparse.ArgumentParser(
+        prog="python -m uncoupled.trace",
+        description="Resolve every registration of a container and time it.",
+    )
+    parser.add_argument("container", help="'package.module:container' path")
+    parser.add_argument("--top", type=int, default=10, help="constructors to print")
+    parser.add_argument("--chrome", help="write a Chrome trace-event JSON file")
+    parser.add_argument("--collapsed", help="write collapsed stacks for flamegraphs")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.getcwd())
+    container = import_path(args.container)
+    if not isinstance(container, Container):
+        container = container()
+
+    with trace(container) as tracer:
+        errors = asyncio.run(_resolve_all(container))
+
+    print(f"{'seconds':>10}  {'cpu':>10}  {'count':>5}  {'lifetime':<12}  constructor")
+    for timing in tracer.slowest(args.top):
+        print(
+            f"{timing.seconds:>10.4f}  {timing.cpu_seconds:>10.4f}  "
+            f"{timing.count:>5}  {timing.lifetime:<12}  {timing.concrete}"
+        )
+    for name, error in errors:
+        print(f"Failed to resolve {name}: {error!r}", file=sys.stderr)
+
+    if args.chrome:
+        with open(args.chrome, "w") as f:
+            json.dump(tracer.chrome_trace(), f)
+    if args.collapsed:
+        with open(args.collapsed, "w") as f:
+            f.write(tracer.collapsed_stacks())
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING, Any
+
+from uncoupled.observer import Observer
+from uncoupled.providers.provider import Registered
+
+if TYPE_CHECKING:
+    from uncoupled.container import Container
+
+
+class UsageTracker(Observer):
+    def __init__(self) -> None:
+        self._used: set[Registered[Any]] = set()
+
+    def on_resolve_start(self, interface: type, registered: Registered[Any]) -> None:
+        self._used.add(registered)
+
+    def on_resolve_end(self, interface: type, registered: Registered[Any]) -> None:
+        pass
+
+    def on_construct_start(self, registered: Registered[Any]) -> None:
+        self._used.add(registered)
+
+    def on_construct_end(self, registered: Registered[Any]) -> None:
+        pass
+
+    def unused(self, container: "Container") -> list[tuple[type, Registered[Any]]]:
+        return [
+            (interface, registered)
+            for provider in container._lifetime_to_provider.values()
+            for interface, concretes in provider.registrations().items()
+            for registered in concretes
+            if registered not in self._used
+        ]
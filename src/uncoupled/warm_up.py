@@ -0,0 +1,156 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from graphlib import CycleError, TopologicalSorter
+from typing import TYPE_CHECKING, Any
+
+from uncoupled.exception import (
+    AsyncRegistrationError,
+    CircularDependencyError,
+    UnregisteredInterfaceError,
+)
+from uncoupled.lazy import load
+from uncoupled.providers.provider import Registered
+
+if TYPE_CHECKING:
+    from uncoupled.container import Container
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class WarmUpTiming:
+    interface: type
+    registered: Registered[Any]
+    seconds: float
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class WarmUpReport:
+    timings: tuple[WarmUpTiming, ...]
+    seconds: float
+
+    def slowest(self, n: int = 10) -> list[WarmUpTiming]:
+        return sorted(self.timings, key=lambda t: t.seconds, reverse=True)[:n]
+
+
+def _timed(
+    get_instance: Callable[[Registered[Any]], Any], registered: Registered[Any]
+) -> float:
+    start = time.perf_counter()
+    get_instance(registered)
+    return time.perf_counter() - start
+
+
+async def _atimed(instance: Awaitable[Any]) -> float:
+    start = time.perf_counter()
+    await instance
+    return time.perf_counter() - start
+
+
+class _WarmUp:
+    def __init__(self, container: "Container") -> None:
+        self._container = container
+        self._provider = container._lifetime_to_provider["singleton"]
+        self._interfaces: dict[Registered[Any], type] = {}
+        for interface, concretes in self._provider.registrations().items():
+            for registered in concretes:
+                self._interfaces.setdefault(registered, interface)
+
+        graph = {
+            registered: self._dependencies(registered, set())
+            for registered in self._interfaces
+        }
+        self._sorter = TopologicalSorter(graph)
+        try:
+            self._sorter.prepare()
+        except CycleError as e:
+            raise CircularDependencyError([r.concrete for r in e.args[1]]) from e
+
+        self._timings: list[WarmUpTiming] = []
+        self._start = time.perf_counter()
+
+    def _dependencies(
+        self, registered: Registered[Any], seen: set[Registered[Any]]
+    ) -> set[Registered[Any]]:
+        dependencies: set[Registered[Any]] = set()
+        for dependency in self._container._plan(load(registered)).dependencies:
+            try:
+                _, dependency_registered = self._container._lookup(
+                    dependency.interface, dependency.resolver, dependency.marker
+                )
+            except UnregisteredInterfaceError:
+                continue
+
+            if dependency_registered.lifetime == "singleton":
+                dependencies.add(dependency_registered)
+            elif dependency_registered not in seen:
+                seen.add(dependency_registered)
+                dependencies |= self._dependencies(dependency_registered, seen)
+
+        return dependencies
+
+    def _done(self, registered: Registered[Any], seconds: float) -> None:
+        self._timings.append(
+            WarmUpTiming(
+                interface=self._interfaces[registered],
+                registered=registered,
+                seconds=seconds,
+            )
+        )
+        self._sorter.done(registered)
+
+    def _report(self) -> WarmUpReport:
+        return WarmUpReport(
+            timings=tuple(self._timings), seconds=time.perf_counter() - self._start
+        )
+
+    def run(self, max_workers: int | None) -> WarmUpReport:
+        for registered in self._interfaces:
+            if registered.is_async:
+                raise AsyncRegistrationError(registered.concrete)
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            pending: dict[Future[float], Registered[Any]] = {}
+            while self._sorter.is_active():
+                for registered in self._sorter.get_ready():
+                    future = executor.submit(
+                        _timed, self._provider.get_instance, registered
+                    )
+                    pending[future] = registered
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._done(pending.pop(future), future.result())
+
+        return self._report()
+
+    async def arun(self) -> WarmUpReport:
+        pending: dict[asyncio.Future[float], Registered[Any]] = {}
+        while self._sorter.is_active():
+            for registered in self._sorter.get_ready():
+                if registered.is_async:
+                    task = asyncio.ensure_future(
+                        _atimed(self._provider.aget_instance(registered))
+                    )
+                else:
+                    task = asyncio.ensure_future(
+                        asyncio.to_thread(
+                            _timed, self._provider.get_instance, registered
+                        )
+                    )
+                pending[task] = registered
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                self._done(pending.pop(task), task.result())
+
+        return self._report()
+
+
+def warm_up(container: "Container", max_workers: int | None = None) -> WarmUpReport:
+    return _WarmUp(container).run(max_workers)
+
+
+async def awarm_up(container: "Container") -> WarmUpReport:
+    return await _WarmUp(container).arun()
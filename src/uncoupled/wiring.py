@@ -0,0 +1,83 @@
+import inspect
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Annotated, Any, get_args, get_origin
+
+from uncoupled.exception import UnresolvedAnnotationError
+
+from uncoupled.providers.provider import Marker, Resolver
+
+_WIRABLE_KINDS = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Dependency:
+    name: str
+    interface: type
+    resolver: Resolver[Any] | None = None
+    marker: Marker | None = None
+    optional: bool = False
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ConstructionPlan:
+    concrete: Callable[..., Any]
+    dependencies: tuple[Dependency, ...]
+
+
+def _hint(annotation: Any, globalns: dict[str, Any]) -> Any:
+    if isinstance(annotation, str):
+        annotation = eval(annotation, globalns)
+    if get_origin(annotation) is Annotated:
+        return get_args(annotation)[0]
+    return annotation
+
+
+def make_plan(concrete: Callable[..., Any]) -> ConstructionPlan:
+    from uncoupled.container import LazyProxy
+
+    target = concrete.__init__ if isinstance(concrete, type) else concrete
+    try:
+        signature = inspect.signature(concrete)
+        annotations = inspect.get_annotations(target)
+    except (TypeError, ValueError):
+        return ConstructionPlan(concrete=concrete, dependencies=())
+    globalns = getattr(inspect.unwrap(target), "__globals__", {})
+
+    dependencies: list[Dependency] = []
+    for name, parameter in signature.parameters.items():
+        if parameter.kind not in _WIRABLE_KINDS:
+            continue
+
+        default = parameter.default
+        if isinstance(default, LazyProxy):
+            dependencies.append(
+                Dependency(
+                    name=name,
+                    interface=object.__getattribute__(default, "_interface"),
+                    resolver=object.__getattribute__(default, "_resolver"),
+                    marker=object.__getattribute__(default, "_marker"),
+                )
+            )
+            continue
+
+        if name not in annotations:
+            continue
+        optional = default is not inspect.Parameter.empty
+        try:
+            interface = _hint(annotations[name], globalns)
+        except Exception as e:
+            if optional:
+                continue
+            raise UnresolvedAnnotationError(concrete, name) from e
+        if not isinstance(interface, type):
+            continue
+
+        dependencies.append(
+            Dependency(name=name, interface=interface, optional=optional)
+        )
+
+    return ConstructionPlan(concrete=concrete, dependencies=tuple(dependencies))
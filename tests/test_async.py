@@ -0,0 +1,104 @@
+import asyncio
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container
+from uncoupled.exception import AsyncRegistrationError
+
+
+class IClient(Protocol): ...
+
+
+class IService(Protocol):
+    client: IClient
+
+
+class Client(IClient):
+    instances = 0
+
+    def __init__(self) -> None:
+        Client.instances += 1
+
+
+async def make_client() -> Client:
+    await asyncio.sleep(0.01)
+    return Client()
+
+
+class Service(IService):
+    def __init__(self, client: IClient) -> None:
+        self.client = client
+
+
+@pytest.fixture()
+def container() -> Generator[Container]:
+    Client.instances = 0
+    c = Container.create()
+    yield c
+    Container._delete_instance()
+
+
+def test_singleton_single_flight(container: Container) -> None:
+    container.add_singleton(IClient, make_client)
+
+    async def run() -> list[IClient]:
+        return await asyncio.gather(*(container.aget(IClient) for _ in range(10)))
+
+    clients = asyncio.run(run())
+
+    assert Client.instances == 1
+    assert all(c is clients[0] for c in clients)
+
+
+def test_sync_get_on_unready_async_registration(container: Container) -> None:
+    container.add_singleton(IClient, make_client)
+
+    with pytest.raises(AsyncRegistrationError):
+        container.get(IClient)
+
+    client = asyncio.run(container.aget(IClient))
+    assert container.get(IClient) is client
+
+
+def test_singleton_retried_after_failure(container: Container) -> None:
+    attempts: list[int] = []
+
+    async def flaky() -> Client:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError()
+        return Client()
+
+    container.add_singleton(IClient, flaky)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(container.aget(IClient))
+    assert isinstance(asyncio.run(container.aget(IClient)), Client)
+
+
+def test_scoped_single_flight_per_scope(container: Container) -> None:
+    container.add_scoped(IClient, make_client)
+
+    async def request() -> list[IClient]:
+        async with container.scope():
+            return await asyncio.gather(*(container.aget(IClient) for _ in range(5)))
+
+    async def run() -> list[list[IClient]]:
+        return await asyncio.gather(request(), request())
+
+    first, second = asyncio.run(run())
+
+    assert Client.instances == 2
+    assert all(c is first[0] for c in first)
+    assert all(c is second[0] for c in second)
+    assert first[0] is not second[0]
+
+
+def test_async_dependencies_are_awaited(container: Container) -> None:
+    container.add_singleton(IClient, make_client).add_transient(IService, Service)
+
+    service = asyncio.run(container.aget(IService))
+
+    assert isinstance(service, Service)
+    assert isinstance(service.client, Client)
@@ -0,0 +1,143 @@
+import asyncio
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.bundle import Bundle
+from uncoupled.container import Container
+from uncoupled.exception import UnregisteredInterfaceError
+from uncoupled.metrics import Metrics
+
+
+class IConfig(Protocol): ...
+
+
+class ISession(Protocol): ...
+
+
+class IUnitOfWork(Protocol): ...
+
+
+class IUsers(Protocol):
+    uow: IUnitOfWork
+    session: ISession
+
+
+class IOrders(Protocol):
+    uow: IUnitOfWork
+
+
+class IClient(Protocol): ...
+
+
+class Config(IConfig): ...
+
+
+class Session(ISession): ...
+
+
+class UnitOfWork(IUnitOfWork): ...
+
+
+class Users(IUsers):
+    def __init__(self, uow: IUnitOfWork, session: ISession) -> None:
+        self.uow = uow
+        self.session = session
+
+
+class Orders(IOrders):
+    def __init__(self, uow: IUnitOfWork) -> None:
+        self.uow = uow
+
+
+class Client(IClient): ...
+
+
+async def make_client() -> IClient:
+    return Client()
+
+
+@pytest.fixture(autouse=True)
+def container() -> Generator[Container, None, None]:
+    Container._delete_instance()
+    container = (
+        Container.create()
+        .add_singleton(IConfig, Config)
+        .add_scoped(ISession, Session)
+        .add_transient(IUnitOfWork, UnitOfWork)
+        .add_transient(IUsers, Users)
+        .add_transient(IOrders, Orders)
+        .add_scoped(IClient, make_client)
+    )
+    yield container
+    Container._delete_instance()
+
+
+def test_get_many_respects_lifetimes(container: Container) -> None:
+    with container.scope():
+        config, session, users = container.get_many(IConfig, ISession, IUsers)
+        users2 = container.get_many(IUsers)[0]
+
+        assert config is container.get(IConfig)
+        assert session is container.get(ISession)
+        assert users.session is session
+        assert users2 is not users
+
+
+def test_shared_transient_dependencies_are_built_once(container: Container) -> None:
+    with container.scope():
+        users, orders = container.get_many(IUsers, IOrders)
+        users2, orders2 = container.get_many(IUsers, IOrders)
+
+    assert users.uow is orders.uow
+    assert users2.uow is orders2.uow
+    assert users.uow is not users2.uow
+
+
+def test_unregistered(container: Container) -> None:
+    class IUnknown(Protocol): ...
+
+    with pytest.raises(UnregisteredInterfaceError):
+        container.get_many(IConfig, IUnknown)
+
+
+def test_bundle_follows_registrations(container: Container) -> None:
+    class ICache(Protocol): ...
+
+    class Cache(ICache): ...
+
+    bundle = Bundle(IConfig, ICache)
+
+    with pytest.raises(UnregisteredInterfaceError):
+        bundle.resolve()
+    container.add_singleton(ICache, Cache)
+    config, cache = bundle.resolve()
+
+    assert isinstance(config, Config)
+    assert isinstance(cache, Cache)
+
+
+def test_bundle_with_async_factory(container: Container) -> None:
+    bundle = Bundle(IClient, ISession)
+
+    async def main() -> tuple[object, ...]:
+        async with container.scope():
+            client, session = await bundle.aresolve()
+            assert client is await container.aget(IClient)
+            assert session is container.get(ISession)
+            return await Bundle(IConfig).aresolve()
+
+    assert isinstance(asyncio.run(main())[0], Config)
+
+
+def test_observed_bundle(container: Container) -> None:
+    metrics = Metrics()
+    container.observe(metrics)
+
+    Bundle(IConfig, IOrders).resolve()
+
+    assert metrics.snapshot()["resolutions"] == {
+        f"{__name__}.IConfig": 1,
+        f"{__name__}.IOrders": 1,
+        f"{__name__}.IUnitOfWork": 1,
+    }
@@ -0,0 +1,143 @@
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container, Depends
+from uncoupled.exception import UnregisteredInterfaceError
+
+closed: list[str] = []
+
+
+class IConfig(Protocol): ...
+
+
+class ISession(Protocol): ...
+
+
+class IRepository(Protocol):
+    config: IConfig
+
+
+class Config(IConfig): ...
+
+
+class TenantConfig(IConfig): ...
+
+
+class Session(ISession):
+    def close(self) -> None:
+        closed.append("session")
+
+
+class IAudit(Protocol): ...
+
+
+class Audit(IAudit):
+    def close(self) -> None:
+        closed.append("audit")
+
+
+class Repository(IRepository):
+    def __init__(self, config: IConfig) -> None:
+        self.config = config
+
+
+@pytest.fixture(autouse=True)
+def container() -> Generator[Container, None, None]:
+    Container._delete_instance()
+    closed.clear()
+    container = (
+        Container.create().add_singleton(IConfig, Config).add_scoped(ISession, Session)
+    )
+    yield container
+    Container._delete_instance()
+
+
+def test_child_shares_parent_instances(container: Container) -> None:
+    child = container.child()
+
+    assert child.get(IConfig) is container.get(IConfig)
+
+
+def test_override_stays_in_child(container: Container) -> None:
+    child = container.child().add_singleton(IConfig, TenantConfig)
+    child.add_transient(IRepository, Repository)
+
+    assert isinstance(child.get(IConfig), TenantConfig)
+    assert isinstance(child.get(IRepository).config, TenantConfig)
+    assert isinstance(container.get(IConfig), Config)
+    with pytest.raises(UnregisteredInterfaceError):
+        container.get(IRepository)
+
+
+def test_child_sees_later_parent_registrations(container: Container) -> None:
+    child = container.child()
+    child.get(IConfig)
+
+    container.add_transient(IRepository, Repository)
+
+    assert isinstance(child.get(IRepository), Repository)
+
+
+def test_child_scope_closes_parent_scoped_instances(container: Container) -> None:
+    child = container.child()
+
+    with child.scope():
+        session = child.get(ISession)
+        assert child.get(ISession) is session
+
+    assert closed == ["session"]
+    assert container._scoped_provider._scope_to_instances == {}
+
+
+def test_child_scope_closes_across_containers_in_reverse_creation_order(
+    container: Container,
+) -> None:
+    child = container.child().add_scoped(IAudit, Audit)
+
+    with child.scope():
+        child.get(IAudit)
+        container.get(ISession)
+
+    assert closed == ["session", "audit"]
+
+
+def test_activate_routes_depends(container: Container) -> None:
+    child = container.child().add_singleton(IConfig, TenantConfig)
+
+    def get_config(config: IConfig = Depends(IConfig)) -> str:
+        return repr(config)
+
+    with child.activate():
+        assert "TenantConfig" in get_config()
+    assert "TenantConfig" not in get_config()
+
+
+def test_compiled_child(container: Container) -> None:
+    child = container.child().add_transient(IRepository, Repository)
+    compiled = child.compile()
+
+    with child.scope():
+        assert compiled.get(ISession) is child.get(ISession)
+    assert compiled.get(IRepository).config is container.get(IConfig)
+
+
+def test_inherited_service_uses_child_overrides(container: Container) -> None:
+    class IService(Protocol):
+        repository: IRepository
+
+    class Service(IService):
+        def __init__(self, repository: IRepository) -> None:
+            self.repository = repository
+
+    class FakeRepository(IRepository):
+        config = Config()
+
+    container.add_transient(IRepository, Repository)
+    container.add_transient(IService, Service)
+    child = container.child().add_transient(IRepository, FakeRepository)
+
+    assert isinstance(child.get(IService).repository, FakeRepository)
+    assert isinstance(child.get_many(IService)[0].repository, FakeRepository)
+    assert isinstance(child.compile().get(IService).repository, FakeRepository)
+    assert isinstance(container.get(IService).repository, Repository)
@@ -0,0 +1,86 @@
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container
+from uncoupled.exception import CircularDependencyError, OutdatedCompilationError
+
+
+class IConfig(Protocol): ...
+
+
+class ISession(Protocol): ...
+
+
+class IRepository(Protocol):
+    config: IConfig
+    session: ISession
+
+
+class Config(IConfig): ...
+
+
+class Session(ISession): ...
+
+
+class Repository(IRepository):
+    def __init__(self, config: IConfig, session: ISession) -> None:
+        self.config = config
+        self.session = session
+
+
+class IChicken(Protocol): ...
+
+
+class IEgg(Protocol): ...
+
+
+class Chicken(IChicken):
+    def __init__(self, egg: IEgg) -> None: ...
+
+
+class Egg(IEgg):
+    def __init__(self, chicken: IChicken) -> None: ...
+
+
+@pytest.fixture()
+def container() -> Generator[Container]:
+    c = Container.create()
+    c.add_singleton(IConfig, Config).add_scoped(ISession, Session).add_transient(
+        IRepository, Repository
+    )
+    yield c
+    Container._delete_instance()
+
+
+def test_compiled_matches_lifetimes(container: Container) -> None:
+    compiled = container.compile()
+
+    with container.scope():
+        repository1 = compiled.get(IRepository)
+        repository2 = compiled.get(IRepository)
+        session = container.get_concrete_instance(ISession)
+
+    with container.scope():
+        repository3 = compiled.get(IRepository)
+
+    assert isinstance(repository1, Repository)
+    assert repository1 is not repository2
+    assert repository1.config is container.get_concrete_instance(IConfig)
+    assert repository1.session is repository2.session is session
+    assert repository3.session is not session
+
+
+def test_compiled_outdated(container: Container) -> None:
+    compiled = container.compile()
+    container.add_transient(IConfig, Config)
+
+    with pytest.raises(OutdatedCompilationError):
+        compiled.get(IRepository)
+
+
+def test_compiled_circular_dependency(container: Container) -> None:
+    container.add_transient(IChicken, Chicken).add_transient(IEgg, Egg)
+
+    with pytest.raises(CircularDependencyError):
+        container.compile()
@@ -1,9 +1,15 @@
 from collections.abc import Generator
+import logging
 from typing import Protocol
 import pytest
 
-from uncoupled.container import Container
-from uncoupled.exception import ContainerAlreadyCreatedError, ContainerNotCreatedError
+from uncoupled.container import MAX_RESOLVED, Container
+from uncoupled.exception import (
+    ContainerAlreadyCreatedError,
+    ContainerNotCreatedError,
+    ResolverError,
+    UnregisteredInterfaceError,
+)
 
 
 @pytest.fixture()
@@ -48,3 +54,107 @@ def test_container_already_created(container: Container) -> None:
 def test_container_not_created() -> None:
     with pytest.raises(ContainerNotCreatedError):
         Container._get_instance()
+
+
+class Impl2(Interface): ...
+
+
+def test_get_unregistered(container: Container) -> None:
+    with pytest.raises(UnregisteredInterfaceError):
+        container.get_concrete_instance(Interface)
+
+
+def test_lifetime_precedence(container: Container) -> None:
+    container.add_scoped(Interface, Impl2).add_transient(Interface, Impl)
+
+    impl = container.get_concrete_instance(Interface)
+    assert isinstance(impl, Impl)
+
+
+def test_registration_invalidates_index(container: Container) -> None:
+    container.add_singleton(Interface, Impl2)
+    assert isinstance(container.get_concrete_instance(Interface), Impl2)
+
+    container.add_transient(Interface, Impl)
+    assert isinstance(container.get_concrete_instance(Interface), Impl)
+
+
+def test_resolution_bypasses_provider_scan(container: Container) -> None:
+    container.add_scoped(Interface, Impl)
+
+    for provider in container._lifetime_to_provider.values():
+        provider.get = None  # type: ignore[method-assign]
+
+    impl = container.get_concrete_instance(Interface)
+    assert isinstance(impl, Impl)
+
+
+def test_multiple_concretes_warned_once(
+    container: Container, caplog: pytest.LogCaptureFixture
+) -> None:
+    container.add_transient(Interface, Impl).add_transient(Interface, Impl2)
+
+    container.get_concrete_instance(Interface)
+    container.add_singleton(Interface, Impl)
+    container.get_concrete_instance(Interface)
+
+    warnings = [r for r in caplog.records if "Multiple concretes" in r.message]
+    assert len(warnings) == 1
+
+
+def test_set_log_level(container: Container, caplog: pytest.LogCaptureFixture) -> None:
+    container.add_transient(Interface, Impl)
+    caplog.set_level(logging.DEBUG, logger="uncoupled")
+
+    container.set_log_level(logging.WARNING)
+    container.get_concrete_instance(Interface)
+    assert not [r for r in caplog.records if r.message.startswith("Resolved")]
+
+    container.set_log_level(logging.DEBUG)
+    container.get_concrete_instance(Interface)
+    assert [r for r in caplog.records if r.message.startswith("Resolved")]
+
+
+def test_get_with_marker(container: Container) -> None:
+    container.add_transient(Interface, Impl).add_singleton(
+        Interface, Impl2, marker="impl2"
+    )
+
+    assert isinstance(container.get(Interface), Impl)
+    assert isinstance(container.get(Interface, marker="impl2"), Impl2)
+
+    with pytest.raises(UnregisteredInterfaceError):
+        container.get(Interface, marker="impl3")
+
+
+def test_resolver_memoized_until_registration(container: Container) -> None:
+    calls: list[int] = []
+
+    def resolver(registered: list) -> object:  # type: ignore[type-arg]
+        calls.append(len(registered))
+        return registered[-1]
+
+    container.add_transient(Interface, Impl)
+    container.get(Interface, resolver)
+    container.get(Interface, resolver)
+    assert calls == [1]
+
+    container.add_transient(Interface, Impl2)
+    assert isinstance(container.get(Interface, resolver), Impl2)
+    assert calls == [1, 2]
+
+
+def test_failing_resolver(container: Container) -> None:
+    container.add_transient(Interface, Impl)
+
+    with pytest.raises(ResolverError):
+        container.get(Interface, resolver=lambda registered: registered[1])
+
+
+def test_inline_resolvers_do_not_grow_the_memo(container: Container) -> None:
+    container.add_transient(Interface, Impl)
+
+    for _ in range(MAX_RESOLVED * 2):
+        container.get(Interface, lambda registered: registered[0])
+
+    assert len(container._resolved) == MAX_RESOLVED
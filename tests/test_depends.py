@@ -67,3 +67,10 @@ def test_injected_with_lifetime() -> None:
         return interface.foo()
 
     assert foo() == 69
+
+
+def test_injected_with_marker() -> None:
+    def foo(interface: Interface = Depends(Interface, marker="scoped")) -> int:
+        return interface.foo()
+
+    assert foo() == 51
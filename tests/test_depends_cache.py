@@ -0,0 +1,107 @@
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container, Depends, per_call
+
+
+class Interface(Protocol):
+    def foo(self) -> int: ...
+
+
+class Counted(Interface):
+    instances = 0
+
+    def __init__(self) -> None:
+        Counted.instances += 1
+
+    def foo(self) -> int:
+        return 42
+
+
+class Other(Interface):
+    def foo(self) -> int:
+        return 51
+
+
+class Scope:
+    scope_id = 0
+
+
+@pytest.fixture(autouse=True)
+def reset_count() -> None:
+    Counted.instances = 0
+
+
+@pytest.fixture()
+def container() -> Generator[Container]:
+    c = Container.create(get_scope=lambda: Scope.scope_id)
+    yield c
+    Container._delete_instance()
+
+
+def test_singleton_resolved_once(container: Container) -> None:
+    container.add_singleton(Interface, Counted)
+    proxy = Depends(Interface)
+
+    proxy.foo()
+    proxy.foo()
+
+    assert Counted.instances == 1
+
+
+def test_singleton_cache_invalidated_by_registration(container: Container) -> None:
+    container.add_singleton(Interface, Counted)
+    proxy = Depends(Interface)
+    assert proxy.foo() == 42
+
+    container.add_transient(Interface, Other)
+    assert proxy.foo() == 51
+
+
+def test_scoped_cached_per_scope(container: Container) -> None:
+    container.add_scoped(Interface, Counted)
+    proxy = Depends(Interface)
+
+    proxy.foo()
+    proxy.foo()
+    assert Counted.instances == 1
+
+    Scope.scope_id = 1
+    proxy.foo()
+    proxy.foo()
+    assert Counted.instances == 2
+
+
+def test_transient_resolved_on_each_access(container: Container) -> None:
+    container.add_transient(Interface, Counted)
+    proxy = Depends(Interface)
+
+    proxy.foo()
+    proxy.foo()
+
+    assert Counted.instances == 2
+
+
+def test_transient_resolved_once_per_call(container: Container) -> None:
+    container.add_transient(Interface, Counted)
+
+    @per_call()
+    def foo(interface: Interface = Depends(Interface)) -> int:
+        return interface.foo() + interface.foo()
+
+    assert foo() == 84
+    assert Counted.instances == 1
+
+    foo()
+    assert Counted.instances == 2
+
+
+def test_cache_not_shared_across_containers(container: Container) -> None:
+    container.add_singleton(Interface, Counted)
+    proxy = Depends(Interface)
+    assert proxy.foo() == 42
+
+    Container._delete_instance()
+    Container.create().add_singleton(Interface, Other)
+    assert proxy.foo() == 51
@@ -0,0 +1,177 @@
+import asyncio
+import gc
+import os
+import signal
+import threading
+from collections.abc import Callable, Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container, Depends
+from uncoupled.exception import ForkPolicyConflictError
+from uncoupled.lazy import LazyConcrete
+from uncoupled.metrics import Metrics
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+
+class IConfig(Protocol): ...
+
+
+class IConnection(Protocol): ...
+
+
+class IClient(Protocol):
+    pid: int
+
+
+class Config(IConfig): ...
+
+
+class Connection(IConnection):
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+
+
+class Client(IClient):
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+
+
+async def make_client() -> IClient:
+    return Client()
+
+
+@pytest.fixture(autouse=True)
+def container() -> Generator[Container, None, None]:
+    Container._delete_instance()
+    container = (
+        Container.create()
+        .add_singleton(IConfig, Config)
+        .add_singleton(IConnection, Connection, fork="rebuild")
+    )
+    yield container
+    Container._delete_instance()
+    gc.unfreeze()
+
+
+def in_child(check: Callable[[], bool]) -> bool:
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        try:
+            os.write(write, b"1" if check() else b"0")
+        finally:
+            os._exit(0)
+
+    os.close(write)
+    with os.fdopen(read, "rb") as f:
+        result = f.read()
+    os.waitpid(pid, 0)
+    return result == b"1"
+
+
+def test_share_and_rebuild(container: Container) -> None:
+    config = container.get(IConfig)
+    connection = container.get(IConnection)
+
+    def get_connection(connection: IConnection = Depends(IConnection)) -> int:
+        return connection.pid
+
+    assert get_connection() == os.getpid()
+    assert in_child(
+        lambda: (
+            container.get(IConfig) is config
+            and container.get(IConnection) is not connection
+            and container.get(IConnection).pid == os.getpid()
+            and get_connection() == os.getpid()
+        )
+    )
+    assert container.get(IConnection) is connection
+
+
+def test_prefork_builds_shared_singletons_only(container: Container) -> None:
+    assert container.prefork() == 1
+
+    provider = container._singleton_provider
+    assert [
+        singleton.instance is not None
+        for singleton in provider._registered_to_singleton.values()
+    ] == [True]
+    assert gc.get_freeze_count() > 0
+
+
+def test_async_prefork(container: Container) -> None:
+    container.add_singleton(IClient, make_client)
+    parent = os.getpid()
+
+    assert asyncio.run(container.aprefork()) == 2
+    assert in_child(lambda: asyncio.run(container.aget(IClient)).pid == parent)
+
+
+def test_conflicting_fork_policies_for_one_singleton(container: Container) -> None:
+    class IOtherConnection(Protocol): ...
+
+    with pytest.raises(ForkPolicyConflictError):
+        container.add_singleton(IOtherConnection, Connection)
+
+    container.add_singleton(IOtherConnection, Connection, fork="rebuild")
+    assert container.get_concrete_instance(
+        IOtherConnection
+    ) is container.get_concrete_instance(IConnection)
+
+
+class IPooledConnection(Protocol):
+    pid: int
+
+
+class IScopedConnection(Protocol):
+    pid: int
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_locks_held_at_fork_are_reset(container: Container) -> None:
+    metrics = Metrics()
+    container.observe(metrics)
+    container.add_pooled(IPooledConnection, Connection, size=1)
+    container.add_scoped(IScopedConnection, "tests.test_fork:Client")
+    with container.scope():
+        pooled = container.get_concrete_instance(IPooledConnection)
+
+    lazy = container._registry.all(IScopedConnection)[0].concrete
+    assert type(lazy) is LazyConcrete
+    (pool,) = container._pooled_provider._registered_to_pool.values()
+    locks = [container._scoped_provider._scopes_lock, pool.lock, lazy._lock]
+    locks.append(metrics._lock)
+
+    held, done = threading.Event(), threading.Event()
+
+    def hold() -> None:
+        for lock in locks:
+            lock.acquire()
+        held.set()
+        done.wait()
+        for lock in locks:
+            lock.release()
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    held.wait()
+
+    def check() -> bool:
+        signal.alarm(5)
+        with container.scope():
+            connection = container.get_concrete_instance(IPooledConnection)
+            client = container.get_concrete_instance(IScopedConnection)
+        return (
+            connection is not pooled
+            and connection.pid == client.pid == os.getpid()
+            and metrics.snapshot() is not None
+        )
+
+    try:
+        assert in_child(check)
+    finally:
+        done.set()
+        thread.join()
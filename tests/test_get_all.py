@@ -0,0 +1,123 @@
+import asyncio
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container, DependsAll, per_call
+from uncoupled.inject import inject
+from uncoupled.metrics import Metrics
+
+
+class IValidator(Protocol):
+    def validate(self, value: str) -> bool: ...
+
+
+class NotEmpty(IValidator):
+    def validate(self, value: str) -> bool:
+        return bool(value)
+
+
+class Short(IValidator):
+    def validate(self, value: str) -> bool:
+        return len(value) < 5
+
+
+class Lowercase(IValidator):
+    def validate(self, value: str) -> bool:
+        return value.islower()
+
+
+async def make_lowercase() -> IValidator:
+    return Lowercase()
+
+
+@pytest.fixture(autouse=True)
+def container() -> Generator[Container, None, None]:
+    Container._delete_instance()
+    container = (
+        Container.create()
+        .add_singleton(IValidator, NotEmpty)
+        .add_singleton(IValidator, Short)
+    )
+    yield container
+    Container._delete_instance()
+
+
+def test_registration_order_and_cache(container: Container) -> None:
+    validators = container.get_all(IValidator)
+
+    assert [type(v) for v in validators] == [NotEmpty, Short]
+    assert container.get_all(IValidator) is validators
+
+
+def test_new_registration_invalidates(container: Container) -> None:
+    validators = container.get_all(IValidator)
+    container.add_transient(IValidator, Lowercase)
+
+    first = container.get_all(IValidator)
+    second = container.get_all(IValidator)
+
+    assert first[:2] == validators
+    assert [type(v) for v in first] == [NotEmpty, Short, Lowercase]
+    assert first[2] is not second[2]
+
+
+def test_nothing_registered(container: Container) -> None:
+    class IUnknown(Protocol): ...
+
+    assert container.get_all(IUnknown) == ()
+
+
+def test_depends_all(container: Container) -> None:
+    def validate(
+        value: str, validators: tuple[IValidator, ...] = DependsAll(IValidator)
+    ) -> bool:
+        return all(v.validate(value) for v in validators)
+
+    assert validate("abc")
+    assert not validate("")
+    assert not validate("abcdef")
+
+
+def test_depends_all_per_call(container: Container) -> None:
+    container.add_transient(IValidator, Lowercase)
+    validators = DependsAll(IValidator)
+
+    with per_call():
+        assert validators[2] is validators[2]
+    assert len(validators) == 3
+    assert validators[2] is not validators[2]
+
+
+def test_inject_and_async(container: Container) -> None:
+    container.add_scoped(IValidator, make_lowercase)
+
+    @inject
+    async def count(validators: tuple[IValidator, ...] = DependsAll(IValidator)) -> int:
+        return len(validators)
+
+    async def main() -> tuple[int, tuple[IValidator, ...]]:
+        async with container.scope():
+            return await count(), await container.aget_all(IValidator)
+
+    total, validators = asyncio.run(main())
+
+    assert total == 3
+    assert isinstance(validators[2], Lowercase)
+
+
+def test_child_adds_to_parent(container: Container) -> None:
+    child = container.child().add_singleton(IValidator, Lowercase)
+
+    assert [type(v) for v in child.get_all(IValidator)] == [NotEmpty, Short, Lowercase]
+    assert child.get_all(IValidator)[0] is container.get_all(IValidator)[0]
+
+
+def test_observed(container: Container) -> None:
+    metrics = Metrics()
+    container.get_all(IValidator)
+    container.observe(metrics)
+
+    container.get_all(IValidator)
+
+    assert metrics.snapshot()["resolutions"] == {f"{__name__}.IValidator": 2}
@@ -0,0 +1,88 @@
+import asyncio
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container, Depends
+from uncoupled.inject import inject
+
+
+class Interface(Protocol):
+    def foo(self) -> int: ...
+
+
+class Impl(Interface):
+    instances = 0
+
+    def __init__(self) -> None:
+        Impl.instances += 1
+
+    def foo(self) -> int:
+        return 42
+
+
+class Impl2(Interface):
+    def foo(self) -> int:
+        return 51
+
+
+async def make_impl() -> Impl2:
+    return Impl2()
+
+
+@pytest.fixture(autouse=True)
+def init_container() -> Generator:
+    Impl.instances = 0
+    c = Container.create()
+    c.add_transient(Interface, Impl).add_singleton(Interface, make_impl, marker="async")
+    yield
+    Container._delete_instance()
+
+
+def test_injects_real_instance() -> None:
+    @inject
+    def foo(interface: Interface = Depends(Interface)) -> Interface:
+        interface.foo()
+        interface.foo()
+        return interface
+
+    interface = foo()
+    assert isinstance(interface, Impl)
+    assert Impl.instances == 1
+
+
+def test_supplied_arguments_are_not_resolved() -> None:
+    @inject
+    def foo(x: int, interface: Interface = Depends(Interface)) -> int:
+        return x + interface.foo()
+
+    assert foo(1, Impl2()) == 52
+    assert foo(1, interface=Impl2()) == 52
+    assert Impl.instances == 0
+
+    assert foo(1) == 43
+    assert Impl.instances == 1
+
+
+def test_keyword_only() -> None:
+    @inject
+    def foo(*, interface: Interface = Depends(Interface, marker="async")) -> int:
+        return interface.foo()
+
+    asyncio.run(Container._get_instance().aget(Interface, marker="async"))
+    assert foo() == 51
+
+
+def test_async_function() -> None:
+    @inject
+    async def foo(interface: Interface = Depends(Interface, marker="async")) -> int:
+        return interface.foo()
+
+    assert asyncio.run(foo()) == 51
+
+
+def test_function_without_depends_is_unchanged() -> None:
+    def foo(x: int) -> int:
+        return x
+
+    assert inject(foo) is foo
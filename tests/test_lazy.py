@@ -0,0 +1,120 @@
+import asyncio
+import sys
+import threading
+from collections.abc import Generator
+from pathlib import Path
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container
+from uncoupled.lazy import LazyConcrete
+from uncoupled.usage import UsageTracker
+
+imported: list[str] = []
+
+
+class IService(Protocol): ...
+
+
+class IClient(Protocol): ...
+
+
+class IConfig(Protocol): ...
+
+
+class Config(IConfig): ...
+
+
+@pytest.fixture(autouse=True)
+def package(tmp_path: Path) -> Generator[str, None, None]:
+    imported.clear()
+    (tmp_path / "lazy_services").mkdir()
+    (tmp_path / "lazy_services" / "__init__.py").write_text("")
+    (tmp_path / "lazy_services" / "heavy.py").write_text(
+        "import time\n"
+        "from tests.test_lazy import IConfig, imported\n"
+        "time.sleep(0.05)\n"
+        "imported.append(__name__)\n"
+        "class Service:\n"
+        "    def __init__(self, config: IConfig) -> None:\n"
+        "        self.config = config\n"
+        "async def make_client():\n"
+        "    return 'client'\n"
+    )
+    sys.path.insert(0, str(tmp_path))
+    yield "lazy_services.heavy"
+    sys.path.remove(str(tmp_path))
+    for name in [n for n in sys.modules if n.startswith("lazy_services")]:
+        del sys.modules[name]
+
+
+@pytest.fixture(autouse=True)
+def container() -> Generator[Container, None, None]:
+    Container._delete_instance()
+    container = Container.create().add_singleton(IConfig, Config)
+    yield container
+    Container._delete_instance()
+
+
+def test_import_on_first_resolution(container: Container, package: str) -> None:
+    container.add_transient(IService, f"{package}:Service")
+
+    assert imported == []
+    service = container.get(IService)
+
+    assert imported == [package]
+    assert type(service).__name__ == "Service"
+    assert service.config is container.get(IConfig)
+
+
+def test_import_once_across_threads(container: Container, package: str) -> None:
+    container.add_singleton(IService, f"{package}:Service")
+    services: list[object] = []
+
+    threads = [
+        threading.Thread(target=lambda: services.append(container.get(IService)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert imported == [package]
+    assert len({id(s) for s in services}) == 1
+
+
+def test_async_factory(container: Container, package: str) -> None:
+    container.add_singleton(IClient, f"{package}:make_client")
+
+    assert asyncio.run(container.aget(IClient)) == "client"
+
+
+def test_mapping(container: Container, package: str) -> None:
+    container.add_mapping(
+        {
+            "transient": {f"{__name__}:IService": f"{package}:Service"},
+            "scoped": {IClient: f"{package}:make_client"},
+        }
+    )
+
+    assert imported == []
+    assert type(container.get(IService)).__name__ == "Service"
+    with pytest.raises(ValueError):
+        container.add_mapping({"unknown": {}})  # type: ignore[dict-item]
+
+
+def test_invalid_path() -> None:
+    with pytest.raises(ValueError):
+        LazyConcrete("lazy_services.heavy.Service")
+
+
+def test_unused_registrations(container: Container, package: str) -> None:
+    usage = UsageTracker()
+    container.observe(usage)
+    container.add_transient(IService, f"{package}:Service")
+    container.add_singleton(IClient, f"{package}:make_client")
+
+    container.get(IService)
+
+    assert [interface for interface, _ in usage.unused(container)] == [IClient]
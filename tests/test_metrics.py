@@ -0,0 +1,129 @@
+import asyncio
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container, Depends
+from uncoupled.metrics import Metrics
+
+
+class IConfig(Protocol): ...
+
+
+class IService(Protocol):
+    def foo(self) -> int: ...
+
+
+class IClient(Protocol): ...
+
+
+class Config(IConfig): ...
+
+
+class Service(IService):
+    def __init__(self, config: IConfig) -> None:
+        self.config = config
+
+    def foo(self) -> int:
+        return 1
+
+
+class Client(IClient): ...
+
+
+async def make_client() -> IClient:
+    await asyncio.sleep(0)
+    return Client()
+
+
+@pytest.fixture(autouse=True)
+def container() -> Generator[Container, None, None]:
+    Container._delete_instance()
+    container = (
+        Container.create()
+        .add_singleton(IConfig, Config)
+        .add_transient(IService, Service)
+        .add_scoped(IClient, make_client)
+    )
+    yield container
+    Container._delete_instance()
+
+
+def test_disabled_by_default(container: Container) -> None:
+    assert "get_concrete_instance" not in container.__dict__
+    assert container._lifetime_to_provider["singleton"]._factory == container._build
+
+
+def test_unobserve_restores_fast_path(container: Container) -> None:
+    metrics = Metrics()
+    container.observe(metrics).unobserve(metrics)
+
+    container.get(IService)
+
+    assert "get_concrete_instance" not in container.__dict__
+    assert metrics.snapshot()["resolutions"] == {}
+
+
+def test_counts_hits_and_constructions(container: Container) -> None:
+    metrics = Metrics()
+    container.observe(metrics)
+
+    container.get(IService)
+    container.get(IService)
+    container.get(IConfig)
+    snapshot = metrics.snapshot()
+
+    assert snapshot["resolutions"] == {
+        f"{__name__}.IService": 2,
+        f"{__name__}.IConfig": 3,
+    }
+    assert snapshot["lifetimes"]["transient"] == {"hits": 0, "constructions": 2}
+    assert snapshot["lifetimes"]["singleton"] == {"hits": 2, "constructions": 1}
+    latencies = snapshot["construction_seconds"]
+    assert latencies[f"{__name__}.Service"]["count"] == 2
+    assert latencies[f"{__name__}.Config"]["count"] == 1
+    assert sum(latencies[f"{__name__}.Config"]["buckets"].values()) == 1
+
+
+def test_proxy_resolutions_are_counted(container: Container) -> None:
+    metrics = Metrics()
+    container.observe(metrics)
+
+    def foo(service: IService = Depends(IService)) -> int:
+        return service.foo() + service.foo()
+
+    foo()
+
+    assert metrics.snapshot()["resolutions"][f"{__name__}.IService"] == 2
+
+
+def test_resolutions_per_scope(container: Container) -> None:
+    metrics = Metrics(amplification_threshold=5)
+    container.observe(metrics)
+
+    with container.scope():
+        container.get(IConfig)
+    with container.scope():
+        for _ in range(10):
+            container.get(IService)
+    scopes = metrics.snapshot()["scopes"]
+
+    assert scopes["resolutions"]["count"] == 2
+    assert scopes["resolutions"]["max"] == 20
+    assert scopes["amplified"] == 1
+
+
+def test_async_construction(container: Container) -> None:
+    metrics = Metrics()
+    container.observe(metrics)
+
+    async def main() -> None:
+        async with container.scope():
+            await asyncio.gather(container.aget(IClient), container.aget(IClient))
+            await container.aget(IClient)
+
+    asyncio.run(main())
+    snapshot = metrics.snapshot()
+
+    assert snapshot["lifetimes"]["scoped"] == {"hits": 2, "constructions": 1}
+    assert snapshot["construction_seconds"][f"{__name__}.make_client"]["count"] == 1
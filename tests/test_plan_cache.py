@@ -0,0 +1,164 @@
+import atexit
+import importlib
+import os
+import sys
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any, Protocol
+import pytest
+
+from uncoupled.container import Container
+from uncoupled.plan_cache import PlanCache
+
+
+class IConfig(Protocol): ...
+
+
+class IRepository(Protocol):
+    config: IConfig
+
+
+class Config(IConfig): ...
+
+
+class Repository(IRepository):
+    def __init__(self, config: IConfig, retries: int = 3) -> None:
+        self.config = config
+
+
+@pytest.fixture(autouse=True)
+def container() -> Generator[Container, None, None]:
+    Container._delete_instance()
+    yield Container.create()
+    Container._delete_instance()
+
+
+def fresh(path: Path) -> Container:
+    Container._delete_instance()
+    return Container.create().cache_plans(path)
+
+
+def fail(concrete: Any) -> None:
+    raise AssertionError(f"{concrete} was introspected")
+
+
+def test_warm_start_skips_introspection(
+    container: Container, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "plans"
+    container.cache_plans(path).add_singleton(IConfig, Config)
+    container.add_transient(IRepository, Repository)
+    container.get(IRepository)
+    container.save_plans()
+    assert container._plan_cache is not None
+    assert container._plan_cache.misses == 2
+
+    container = fresh(path).add_singleton(IConfig, Config)
+    container.add_transient(IRepository, Repository)
+    monkeypatch.setattr("uncoupled.container.make_plan", fail)
+
+    assert container.get(IRepository).config is container.get(IConfig)
+    assert container._plan_cache is not None
+    assert container._plan_cache.hits == 2
+
+
+def test_stale_entries_are_introspected_again(
+    container: Container, tmp_path: Path
+) -> None:
+    module = tmp_path / "cached_services.py"
+    module.write_text("class Service:\n    def __init__(self) -> None: ...\n")
+    sys.path.insert(0, str(tmp_path))
+    try:
+        services = importlib.import_module("cached_services")
+        container.cache_plans(tmp_path / "plans").add_singleton(IConfig, Config)
+        container.add_transient(IRepository, services.Service)
+        container.get(IRepository)
+        container.save_plans()
+
+        module.write_text(
+            "from tests.test_plan_cache import IConfig\n"
+            "class Service:\n"
+            "    def __init__(self, config: IConfig) -> None:\n"
+            "        self.config = config\n"
+        )
+        os.utime(module, ns=(0, 0))
+        services = importlib.reload(services)
+        container = fresh(tmp_path / "plans").add_singleton(IConfig, Config)
+        container.add_transient(IRepository, services.Service)
+
+        assert isinstance(container.get(IRepository).config, Config)
+    finally:
+        sys.path.remove(str(tmp_path))
+        del sys.modules["cached_services"]
+
+
+def test_unreadable_cache_falls_back(container: Container, tmp_path: Path) -> None:
+    path = tmp_path / "plans"
+    path.write_bytes(b"not a pickle")
+    container.cache_plans(path).add_singleton(IConfig, Config)
+    container.add_transient(IRepository, Repository)
+
+    assert isinstance(container.get(IRepository).config, Config)
+    container.save_plans()
+    assert PlanCache(path)._entries.keys() == {
+        (__name__, "Config"),
+        (__name__, "Repository"),
+    }
+
+
+def test_local_classes_are_not_cached(container: Container, tmp_path: Path) -> None:
+    class Local: ...
+
+    cache = PlanCache(tmp_path / "plans")
+    cache.put(container._plan(Local))
+    cache.save()
+
+    assert not (tmp_path / "plans").exists()
+
+
+def test_changed_base_class_is_introspected_again(
+    container: Container, tmp_path: Path
+) -> None:
+    base = tmp_path / "cached_base.py"
+    base.write_text(
+        "from tests.test_plan_cache import IConfig\n"
+        "class Base:\n"
+        "    def __init__(self, config: IConfig) -> None:\n"
+        "        self.config = config\n"
+    )
+    (tmp_path / "cached_impl.py").write_text(
+        "from cached_base import Base\nclass Impl(Base): ...\n"
+    )
+    sys.path.insert(0, str(tmp_path))
+    try:
+        impl = importlib.import_module("cached_impl")
+        container.cache_plans(tmp_path / "plans").add_singleton(IConfig, Config)
+        container.add_transient(IRepository, impl.Impl)
+        container.get(IRepository)
+        container.save_plans()
+
+        base.write_text("class Base:\n    def __init__(self) -> None: ...\n")
+        os.utime(base, ns=(0, 0))
+        importlib.reload(sys.modules["cached_base"])
+        impl = importlib.reload(impl)
+        container = fresh(tmp_path / "plans").add_singleton(IConfig, Config)
+        container.add_transient(IRepository, impl.Impl)
+
+        assert not hasattr(container.get(IRepository), "config")
+    finally:
+        sys.path.remove(str(tmp_path))
+        del sys.modules["cached_base"], sys.modules["cached_impl"]
+
+
+def test_exit_hook_is_registered_once(
+    container: Container, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    hooks: list[Callable[[], None]] = []
+    monkeypatch.setattr(atexit, "register", hooks.append)
+    monkeypatch.setattr(atexit, "unregister", hooks.remove)
+
+    container.cache_plans(tmp_path / "first")
+    container.cache_plans(tmp_path / "second")
+
+    assert container._plan_cache is not None
+    assert hooks == [container._plan_cache.save]
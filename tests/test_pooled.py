@@ -0,0 +1,190 @@
+import asyncio
+import threading
+import time
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container, Depends
+from uncoupled.exception import PoolTimeoutError, ScopeRequiredError
+
+built: list["Parser"] = []
+
+
+class IParser(Protocol):
+    def parse(self) -> "IParser": ...
+
+
+class Parser(IParser):
+    def __init__(self) -> None:
+        built.append(self)
+
+    def parse(self) -> IParser:
+        return self
+
+
+@pytest.fixture(autouse=True)
+def container() -> Generator[Container, None, None]:
+    Container._delete_instance()
+    built.clear()
+    container = Container.create().add_pooled(IParser, Parser, size=2, timeout=0.1)
+    yield container
+    Container._delete_instance()
+
+
+def test_same_instance_within_scope(container: Container) -> None:
+    with container.scope():
+        parser = container.get(IParser)
+
+        assert container.get(IParser) is parser
+        assert container.pool_stats(IParser).in_use == 1
+
+    assert container.pool_stats(IParser).in_use == 0
+
+
+def test_instances_are_reused_across_scopes(container: Container) -> None:
+    with container.scope():
+        first = container.get(IParser)
+    with container.scope():
+        second = container.get(IParser)
+
+    assert first is second
+    assert len(built) == 1
+
+
+def test_proxy_returns_instance_at_scope_exit(container: Container) -> None:
+    def parse(parser: IParser = Depends(IParser)) -> IParser:
+        return parser.parse()
+
+    with container.scope():
+        first = parse()
+    with container.scope():
+        assert parse() is first
+
+    assert container.pool_stats(IParser).in_use == 0
+
+
+def test_requires_scope(container: Container) -> None:
+    with pytest.raises(ScopeRequiredError):
+        container.get(IParser)
+
+
+def test_checkout(container: Container) -> None:
+    with container.checkout(IParser) as first, container.checkout(IParser) as second:
+        assert first is not second
+        stats = container.pool_stats(IParser)
+        assert stats.in_use == 2
+        assert stats.utilization == 1
+
+        with pytest.raises(PoolTimeoutError):
+            with container.checkout(IParser, timeout=0.01):
+                pass
+
+    stats = container.pool_stats(IParser)
+    assert stats.in_use == 0
+    assert stats.created == 2
+    assert stats.exhausted == 1
+    assert stats.timeouts == 1
+
+
+def test_waiting_thread_gets_released_instance(container: Container) -> None:
+    acquired: list[IParser] = []
+
+    def worker() -> None:
+        with container.checkout(IParser, timeout=5) as parser:
+            acquired.append(parser)
+
+    with container.checkout(IParser), container.checkout(IParser) as second:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        time.sleep(0.05)
+        assert acquired == []
+    thread.join()
+
+    assert acquired == [second]
+    stats = container.pool_stats(IParser)
+    assert stats.exhausted == 1
+    assert stats.wait_seconds > 0
+    assert stats.peak_in_use == 2
+
+
+def test_async_checkout(container: Container) -> None:
+    async def use() -> IParser:
+        async with container.acheckout(IParser, timeout=5) as parser:
+            await asyncio.sleep(0.01)
+            return parser
+
+    async def main() -> list[IParser]:
+        return await asyncio.gather(*(use() for _ in range(6)))
+
+    parsers = asyncio.run(main())
+
+    assert len(built) == 2
+    assert set(parsers) == set(built)
+    assert container.pool_stats(IParser).in_use == 0
+
+
+def test_async_timeout(container: Container) -> None:
+    async def main() -> None:
+        async with container.acheckout(IParser), container.acheckout(IParser):
+            async with container.acheckout(IParser, timeout=0.01):
+                pass
+
+    with pytest.raises(PoolTimeoutError):
+        asyncio.run(main())
+
+    assert container.pool_stats(IParser).in_use == 0
+
+
+def test_failed_construction_frees_its_slot(container: Container) -> None:
+    calls = 0
+
+    class Flaky(IParser):
+        def __init__(self) -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError()
+
+        def parse(self) -> IParser:
+            return self
+
+    container.add_pooled(IParser, Flaky, marker="flaky", size=1)
+    with pytest.raises(RuntimeError):
+        with container.checkout(IParser, marker="flaky"):
+            pass
+
+    with container.checkout(IParser, marker="flaky") as parser:
+        assert isinstance(parser, Flaky)
+
+
+def test_lease_outlives_scoped_dependants(container: Container) -> None:
+    in_use: list[int] = []
+
+    class ISession(Protocol): ...
+
+    class Session(ISession):
+        def __init__(self, parser: IParser) -> None:
+            self.parser = parser
+
+        def close(self) -> None:
+            in_use.append(container.pool_stats(IParser).in_use)
+
+    container.add_scoped(ISession, Session)
+    with container.scope():
+        container.get(ISession)
+
+    assert in_use == [1]
+    assert container.pool_stats(IParser).in_use == 0
+
+
+def test_same_concrete_gets_one_pool_per_registration(container: Container) -> None:
+    class IOtherParser(IParser, Protocol): ...
+
+    container.add_pooled(IOtherParser, Parser, size=5, timeout=0.1)
+
+    with container.scope():
+        parser = container.get_concrete_instance(IParser)
+        assert container.get_concrete_instance(IOtherParser) is not parser
+        assert container.pool_stats(IParser).size == 2
+        assert container.pool_stats(IOtherParser).size == 5
@@ -0,0 +1,97 @@
+import logging
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container
+
+
+class IConfig(Protocol): ...
+
+
+class ICache(Protocol): ...
+
+
+class Config(IConfig): ...
+
+
+class Cache(ICache): ...
+
+
+class RedisCache(ICache): ...
+
+
+@pytest.fixture(autouse=True)
+def container() -> Generator[Container, None, None]:
+    Container._delete_instance()
+    yield Container.create(log_level=logging.ERROR)
+    Container._delete_instance()
+
+
+def test_mapping(container: Container) -> None:
+    container.register_many("singleton", {IConfig: Config, ICache: Cache})
+
+    assert container.get(IConfig) is container.get(IConfig)
+    assert isinstance(container.get(ICache), Cache)
+
+
+def test_markers_and_order(container: Container) -> None:
+    container.add_transient(ICache, Cache)
+    container.register_many(
+        "transient",
+        [
+            (ICache, RedisCache, "redis"),
+            (ICache, f"{__name__}:Cache", "memory"),
+        ],
+    )
+
+    assert isinstance(container.get(ICache), Cache)
+    assert isinstance(container.get(ICache, marker="redis"), RedisCache)
+    assert isinstance(container.get(ICache, marker="memory"), Cache)
+    assert [type(c) for c in container.get_all(ICache)] == [Cache, RedisCache, Cache]
+
+
+def test_invalidates_once_per_batch(container: Container) -> None:
+    container.get_all(ICache)
+    generation = container._generation
+
+    container.register_many("scoped", {IConfig: Config, ICache: Cache})
+
+    assert container._generation == generation + 1
+    assert len(container.get_all(ICache)) == 1
+
+
+def test_unknown_lifetime(container: Container) -> None:
+    with pytest.raises(ValueError):
+        container.register_many("eternal", {IConfig: Config})  # type: ignore[arg-type]
+
+
+def test_markers_are_interned(container: Container) -> None:
+    container.add_singleton(ICache, Cache, marker="".join(["re", "dis"]))
+    container.add_singleton(IConfig, Config, marker="".join(["re", "dis"]))
+
+    (first,), (second,) = (
+        [registered.marker for registered in container._registry.all(interface)]
+        for interface in (ICache, IConfig)
+    )
+    assert first is second
+
+
+def test_singleton_state_is_created_on_first_build(container: Container) -> None:
+    container.register_many("singleton", {IConfig: Config, ICache: Cache})
+    singletons = container._singleton_provider._registered_to_singleton
+    assert not singletons
+
+    container.get(IConfig)
+
+    assert [registered.concrete for registered in singletons] == [Config]
+
+
+def test_registrations_share_one_table(container: Container) -> None:
+    container.register_many("singleton", {ICache: Cache})
+    container.register_many("scoped", [(ICache, Cache, "request")])
+
+    singleton, scoped = container._registry.all(ICache)
+    assert (singleton.lifetime, scoped.lifetime) == ("singleton", "scoped")
+    assert container._scoped_provider._registry is container._registry
+    assert container.get(ICache, marker="request") is not container.get(ICache)
@@ -0,0 +1,149 @@
+import asyncio
+import sys
+from collections.abc import Generator
+from pathlib import Path
+import pytest
+
+from uncoupled.container import Container
+
+imported: list[str] = []
+
+
+@pytest.fixture(autouse=True)
+def package(tmp_path: Path) -> Generator[Path, None, None]:
+    imported.clear()
+    root = tmp_path / "scanned_app"
+    (root / "services" / "nested").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "ports.py").write_text(
+        "from typing import Protocol\n"
+        "class IRepository(Protocol): ...\n"
+        "class IClock(Protocol): ...\n"
+        "class IClient(Protocol): ...\n"
+    )
+    (root / "services" / "__init__.py").write_text("")
+    (root / "services" / "repository.py").write_text(
+        "from tests.test_scan import imported\n"
+        "from uncoupled.scan import singleton\n"
+        "from scanned_app.ports import IRepository\n"
+        "imported.append(__name__)\n"
+        "@singleton(IRepository)\n"
+        "class Repository(IRepository): ...\n"
+        "@singleton(IRepository, marker='memory')\n"
+        "class MemoryRepository(IRepository): ...\n"
+    )
+    (root / "services" / "nested" / "__init__.py").write_text("")
+    (root / "services" / "nested" / "clock.py").write_text(
+        "from tests.test_scan import imported\n"
+        "import uncoupled.scan as di\n"
+        "from ... import ports\n"
+        "imported.append(__name__)\n"
+        "@di.scoped(ports.IClock)\n"
+        "class Clock(ports.IClock): ...\n"
+        "class Client(ports.IClient): ...\n"
+        "@di.singleton(ports.IClient)\n"
+        "async def make_client() -> ports.IClient:\n"
+        "    return Client()\n"
+    )
+    (root / "services" / "plain.py").write_text("class NotRegistered: ...\n")
+    sys.path.insert(0, str(tmp_path))
+    yield root
+    sys.path.remove(str(tmp_path))
+    for name in [n for n in sys.modules if n.startswith("scanned_app")]:
+        del sys.modules[name]
+
+
+@pytest.fixture(autouse=True)
+def container() -> Generator[Container, None, None]:
+    Container._delete_instance()
+    yield Container.create()
+    Container._delete_instance()
+
+
+def test_scan_registers_without_importing(container: Container) -> None:
+    report = container.scan("scanned_app.services")
+
+    assert report.modules == 5
+    assert [(d.lifetime, d.concrete, d.marker) for d in report.registrations] == [
+        ("singleton", "scanned_app.services.repository:Repository", None),
+        ("singleton", "scanned_app.services.repository:MemoryRepository", "memory"),
+        ("scoped", "scanned_app.services.nested.clock:Clock", None),
+        ("singleton", "scanned_app.services.nested.clock:make_client", None),
+    ]
+    assert report.imported == ("scanned_app", "scanned_app.ports")
+    assert imported == []
+
+    from scanned_app.ports import IClient, IClock, IRepository
+
+    assert type(container.get(IRepository)).__name__ == "Repository"
+    assert imported == ["scanned_app.services.repository"]
+    assert type(container.get(IRepository, marker="memory")).__name__ == (
+        "MemoryRepository"
+    )
+
+    async def main() -> object:
+        async with container.scope():
+            container.get(IClock)
+            return await container.aget(IClient)
+
+    assert type(asyncio.run(main())).__name__ == "Client"
+
+
+def test_discovery_cache(container: Container, package: Path, tmp_path: Path) -> None:
+    cache = tmp_path / "discovery"
+    assert container.scan("scanned_app.services", cache=cache).cached == 0
+
+    Container._delete_instance()
+    container = Container.create()
+    (package / "services" / "repository.py").write_text(
+        "from uncoupled.scan import singleton\n"
+        "from scanned_app.ports import IRepository\n"
+        "@singleton(IRepository, 'sql')\n"
+        "class SqlRepository(IRepository): ...\n"
+    )
+    report = container.scan("scanned_app.services", cache=cache)
+
+    assert report.cached == 4
+    assert report.registrations[0].concrete.endswith("repository:SqlRepository")
+    assert report.registrations[0].marker == "sql"
+
+
+def test_unreadable_registration(container: Container, package: Path) -> None:
+    (package / "services" / "plain.py").write_text(
+        "from uncoupled.scan import singleton\n"
+        "MARKER = 'dynamic'\n"
+        "@singleton(object, marker=MARKER)\n"
+        "class Dynamic: ...\n"
+    )
+
+    with pytest.raises(ValueError, match="line 3"):
+        container.scan("scanned_app.services")
+
+
+def test_decorators_leave_objects_untouched() -> None:
+    from uncoupled.scan import singleton
+
+    class Service: ...
+
+    assert singleton(object)(Service) is Service
+
+
+def test_interface_through_nested_attribute(
+    container: Container, package: Path
+) -> None:
+    (package / "interfaces.py").write_text(
+        "from typing import Protocol\nclass Outer:\n    class IService(Protocol): ...\n"
+    )
+    (package / "services" / "plain.py").write_text(
+        "from uncoupled.scan import transient\n"
+        "from scanned_app import interfaces\n"
+        "@transient(interfaces.Outer.IService)\n"
+        "class Service(interfaces.Outer.IService): ...\n"
+    )
+
+    report = container.scan("scanned_app.services")
+
+    from scanned_app.interfaces import Outer
+
+    assert report.registrations[0].interface == "scanned_app.interfaces:Outer.IService"
+    assert type(container.get(Outer.IService)).__name__ == "Service"
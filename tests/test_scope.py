@@ -0,0 +1,136 @@
+import asyncio
+import gc
+import threading
+import weakref
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container, Depends
+
+closed: list[str] = []
+
+
+class Interface(Protocol):
+    def name(self) -> str: ...
+
+
+class Session(Interface):
+    def name(self) -> str:
+        return "session"
+
+    def close(self) -> None:
+        closed.append(self.name())
+
+
+class Repository(Interface):
+    def name(self) -> str:
+        return "repository"
+
+    def close(self) -> None:
+        closed.append(self.name())
+
+
+class AsyncSession(Interface):
+    def name(self) -> str:
+        return "async_session"
+
+    async def aclose(self) -> None:
+        closed.append(self.name())
+
+
+@pytest.fixture()
+def container() -> Generator[Container]:
+    closed.clear()
+    c = Container.create()
+    yield c
+    Container._delete_instance()
+
+
+def test_scope_shares_instance(container: Container) -> None:
+    container.add_scoped(Interface, Session)
+
+    with container.scope():
+        impl1 = container.get_concrete_instance(Interface)
+        impl2 = container.get_concrete_instance(Interface)
+
+    with container.scope():
+        impl3 = container.get_concrete_instance(Interface)
+
+    assert impl1 is impl2
+    assert impl1 is not impl3
+
+
+def test_scope_closes_in_reverse_creation_order(container: Container) -> None:
+    container.add_scoped(Interface, Session).add_scoped(
+        Interface, Repository, marker="repository"
+    )
+
+    with container.scope():
+        container.get_concrete_instance(Interface)
+        container.get_concrete_instance(Interface, resolver=lambda r: r[1])
+        assert closed == []
+
+    assert closed == ["repository", "session"]
+
+
+def test_scope_releases_instances(container: Container) -> None:
+    container.add_scoped(Interface, Session)
+    proxy = Depends(Interface)
+
+    with container.scope():
+        ref = weakref.ref(container.get_concrete_instance(Interface))
+        proxy.name()
+
+    gc.collect()
+    assert ref() is None
+
+
+def test_async_scope_awaits_aclose(container: Container) -> None:
+    container.add_scoped(Interface, AsyncSession)
+
+    async def run() -> None:
+        async with container.scope():
+            container.get_concrete_instance(Interface)
+
+    asyncio.run(run())
+    assert closed == ["async_session"]
+
+
+def test_tasks_have_their_own_scope(container: Container) -> None:
+    container.add_scoped(Interface, Session)
+
+    async def request() -> tuple[Interface, Interface]:
+        async with container.scope():
+            impl1 = container.get_concrete_instance(Interface)
+            await asyncio.sleep(0)
+            impl2 = container.get_concrete_instance(Interface)
+        return impl1, impl2
+
+    async def run() -> list[tuple[Interface, Interface]]:
+        return await asyncio.gather(request(), request())
+
+    (a1, a2), (b1, b2) = asyncio.run(run())
+    assert a1 is a2
+    assert b1 is b2
+    assert a1 is not b1
+
+
+def test_threads_have_their_own_scope(container: Container) -> None:
+    container.add_scoped(Interface, Session)
+    barrier = threading.Barrier(2)
+    results: list[Interface] = []
+
+    def request() -> None:
+        with container.scope():
+            barrier.wait()
+            results.append(container.get_concrete_instance(Interface))
+            barrier.wait()
+
+    threads = [threading.Thread(target=request) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results[0] is not results[1]
@@ -1,3 +1,5 @@
+import threading
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Literal, Protocol
@@ -93,6 +95,22 @@ def test_multiple_concretes_with_marker(provider: Provider) -> None:
     assert impl.type == 42
 
 
+def test_get_with_marker(provider: Provider) -> None:
+    provider.register(Interface, Impl2, "impl2")
+    provider.register(Interface, Impl, "impl")
+
+    impl = provider.get(Interface, marker="impl")
+    assert isinstance(impl, Impl)
+    assert impl.type == 42
+
+
+def test_get_with_unregistered_marker(provider: Provider) -> None:
+    provider.register(Interface, Impl2, "impl2")
+
+    with pytest.raises(UnregisteredInterfaceError):
+        provider.get(Interface, marker="impl")
+
+
 def test_multiple_concretes_with_marker_not_found(provider: Provider) -> None:
     provider.register(Interface, Impl2, "impl2")
     provider.register(Interface, Impl, "impl")
@@ -104,3 +122,103 @@ def test_multiple_concretes_with_marker_not_found(provider: Provider) -> None:
                 r for r in registered if r.marker == "not_found"
             ),
         )
+
+
+def test_get_should_keep_instances_of_interleaved_scopes() -> None:
+    scope = Scope(42)
+    provider = ScopedProvider(get_scope=lambda: scope.scope_id)
+    provider.register(Interface, Impl)
+
+    impl1 = provider.get(Interface)
+    scope.scope_id = 51
+    impl2 = provider.get(Interface)
+    scope.scope_id = 42
+    impl3 = provider.get(Interface)
+
+    assert impl1 is not impl2
+    assert impl1 is impl3
+
+
+def test_get_should_evict_least_recently_used_scope() -> None:
+    scope = Scope(1)
+    provider = ScopedProvider(get_scope=lambda: scope.scope_id, max_scopes=2)
+    provider.register(Interface, Impl)
+
+    impl1 = provider.get(Interface)
+    scope.scope_id = 2
+    provider.get(Interface)
+    scope.scope_id = 1
+    assert provider.get(Interface) is impl1
+
+    scope.scope_id = 3
+    provider.get(Interface)
+    scope.scope_id = 2
+    provider.get(Interface)
+    scope.scope_id = 1
+    assert provider.get(Interface) is not impl1
+
+
+def test_end_scope_should_release_instances() -> None:
+    scope = Scope(42)
+    provider = ScopedProvider(get_scope=lambda: scope.scope_id)
+    provider.register(Interface, Impl)
+    provider.register(Interface, Impl2, "impl2")
+
+    impl = provider.get(Interface)
+    impl2 = provider.get(Interface, resolver=lambda registered: registered[1])
+
+    assert [instance for _, instance in provider.end_scope(42)] == [impl, impl2]
+    assert provider.end_scope(42) == []
+    assert provider.get(Interface) is not impl
+
+
+class Slow(Interface):
+    type = 42
+    instances = 0
+
+    def __init__(self) -> None:
+        time.sleep(0.01)
+        Slow.instances += 1
+
+
+def test_get_should_instanciate_once_across_threads() -> None:
+    provider = ScopedProvider(get_scope=lambda: None)
+    provider.register(Interface, Slow)
+    barrier = threading.Barrier(16)
+    results: list[Interface] = []
+
+    def resolve() -> None:
+        barrier.wait()
+        results.append(provider.get(Interface))
+
+    threads = [threading.Thread(target=resolve) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert Slow.instances == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_get_should_build_in_parallel_across_scopes() -> None:
+    local = threading.local()
+    provider = ScopedProvider(get_scope=lambda: local.scope)
+    provider.register(Interface, Slow)
+    barrier = threading.Barrier(8)
+    results: list[Interface] = []
+
+    def resolve(scope: int) -> None:
+        local.scope = scope
+        barrier.wait()
+        results.append(provider.get(Interface))
+
+    threads = [threading.Thread(target=resolve, args=(i,)) for i in range(8)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert time.perf_counter() - start < 0.05
+    assert len({id(r) for r in results}) == 8
@@ -1,3 +1,5 @@
+import threading
+import time
 from typing import Literal, Protocol
 
 import pytest
@@ -72,6 +74,22 @@ def test_multiple_concretes_with_marker(provider: Provider) -> None:
     assert impl.type == 42
 
 
+def test_get_with_marker(provider: Provider) -> None:
+    provider.register(Interface, Impl2, "impl2")
+    provider.register(Interface, Impl, "impl")
+
+    impl = provider.get(Interface, marker="impl")
+    assert isinstance(impl, Impl)
+    assert impl.type == 42
+
+
+def test_get_with_unregistered_marker(provider: Provider) -> None:
+    provider.register(Interface, Impl2, "impl2")
+
+    with pytest.raises(UnregisteredInterfaceError):
+        provider.get(Interface, marker="impl")
+
+
 def test_multiple_concretes_with_marker_not_found(provider: Provider) -> None:
     provider.register(Interface, Impl2, "impl2")
     provider.register(Interface, Impl, "impl")
@@ -83,3 +101,32 @@ def test_multiple_concretes_with_marker_not_found(provider: Provider) -> None:
                 r for r in registered if r.marker == "not_found"
             ),
         )
+
+
+class Slow(Interface):
+    type = 42
+    instances = 0
+
+    def __init__(self) -> None:
+        time.sleep(0.01)
+        Slow.instances += 1
+
+
+def test_get_should_instanciate_once_across_threads() -> None:
+    provider = SingletonProvider()
+    provider.register(Interface, Slow)
+    barrier = threading.Barrier(16)
+    results: list[Interface] = []
+
+    def resolve() -> None:
+        barrier.wait()
+        results.append(provider.get(Interface))
+
+    threads = [threading.Thread(target=resolve) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert Slow.instances == 1
+    assert all(r is results[0] for r in results)
@@ -0,0 +1,68 @@
+import asyncio
+import gc
+import weakref
+from typing import Literal, Protocol
+
+import pytest
+from uncoupled.exception import UnregisteredInterfaceError
+from uncoupled.providers.provider import Provider
+from uncoupled.providers.task_local import TaskLocalProvider
+
+
+class Interface(Protocol):
+    type: Literal[42, 51]
+
+
+class Impl(Interface):
+    type = 42
+
+
+@pytest.fixture
+def provider() -> Provider:
+    return TaskLocalProvider()
+
+
+def test_get_should_instanciate_once_per_task(provider: Provider) -> None:
+    provider.register(Interface, Impl)
+
+    async def work() -> tuple[Interface, Interface]:
+        first = provider.get(Interface)
+        await asyncio.sleep(0)
+        return first, await provider.aget_instance(
+            provider.registrations()[Interface][0]
+        )
+
+    async def main() -> list[tuple[Interface, Interface]]:
+        provider.get(Interface)
+        return await asyncio.gather(work(), work())
+
+    (a1, a2), (b1, b2) = asyncio.run(main())
+
+    assert a1 is a2
+    assert b1 is b2
+    assert a1 is not b1
+
+
+def test_get_outside_task(provider: Provider) -> None:
+    provider.register(Interface, Impl)
+
+    assert provider.get(Interface) is provider.get(Interface)
+
+
+def test_get_unregistered(provider: Provider) -> None:
+    with pytest.raises(UnregisteredInterfaceError):
+        provider.get(Interface)
+
+
+def test_instance_released_with_task(provider: Provider) -> None:
+    provider.register(Interface, Impl)
+
+    async def work() -> weakref.ref[Interface]:
+        return weakref.ref(provider.get(Interface))
+
+    async def main() -> weakref.ref[Interface]:
+        ref = await asyncio.create_task(work())
+        gc.collect()
+        return ref
+
+    assert asyncio.run(main())() is None
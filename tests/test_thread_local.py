@@ -0,0 +1,87 @@
+import gc
+import threading
+import weakref
+from typing import Literal, Protocol
+
+import pytest
+from uncoupled.container import Container, Depends
+from uncoupled.exception import UnregisteredInterfaceError
+from uncoupled.providers.provider import Provider
+from uncoupled.providers.thread_local import ThreadLocalProvider
+
+
+class Interface(Protocol):
+    type: Literal[42, 51]
+
+
+class Impl(Interface):
+    type = 42
+
+
+@pytest.fixture
+def provider() -> Provider:
+    return ThreadLocalProvider()
+
+
+def test_get_should_instanciate_once_per_thread(provider: Provider) -> None:
+    provider.register(Interface, Impl)
+    instances: list[Interface] = []
+
+    def worker() -> None:
+        instances.extend([provider.get(Interface), provider.get(Interface)])
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert instances[0] is instances[1]
+    assert instances[2] is instances[3]
+    assert instances[0] is not instances[2]
+
+
+def test_get_unregistered(provider: Provider) -> None:
+    with pytest.raises(UnregisteredInterfaceError):
+        provider.get(Interface)
+
+
+def test_instance_released_with_thread(provider: Provider) -> None:
+    provider.register(Interface, Impl)
+    refs: list[weakref.ref[Interface]] = []
+
+    thread = threading.Thread(
+        target=lambda: refs.append(weakref.ref(provider.get(Interface)))
+    )
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    assert refs[0]() is None
+
+
+def test_proxy_is_not_shared_between_threads() -> None:
+    class Counted(Interface):
+        count = 0
+
+        def __init__(self) -> None:
+            Counted.count += 1
+            self.number = Counted.count
+
+    Container._delete_instance()
+    Container.create().add_thread_local(Interface, Counted)
+    proxy = Depends(Interface)
+    ids: list[int] = []
+
+    def worker() -> None:
+        ids.append(proxy.number)  # type: ignore[attr-defined]
+        ids.append(proxy.number)  # type: ignore[attr-defined]
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    Container._delete_instance()
+
+    assert sorted(ids) == [1, 1, 2, 2]
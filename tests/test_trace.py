@@ -0,0 +1,129 @@
+import asyncio
+import json
+from collections.abc import Generator
+from pathlib import Path
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container
+from uncoupled.trace import main, trace
+
+
+class IConfig(Protocol): ...
+
+
+class IDatabase(Protocol): ...
+
+
+class IRepository(Protocol): ...
+
+
+class IClient(Protocol): ...
+
+
+class Config(IConfig): ...
+
+
+class Database(IDatabase):
+    def __init__(self, config: IConfig) -> None:
+        self.config = config
+
+
+class Repository(IRepository):
+    def __init__(self, database: IDatabase, config: IConfig) -> None:
+        self.database = database
+
+
+class Client(IClient): ...
+
+
+async def make_client(config: IConfig) -> IClient:
+    await asyncio.sleep(0)
+    return Client()
+
+
+def create_container() -> Container:
+    return (
+        Container.create()
+        .add_singleton(IConfig, Config)
+        .add_singleton(IDatabase, Database)
+        .add_transient(IRepository, Repository)
+        .add_singleton(IClient, make_client)
+    )
+
+
+@pytest.fixture(autouse=True)
+def container() -> Generator[Container, None, None]:
+    Container._delete_instance()
+    yield create_container()
+    Container._delete_instance()
+
+
+def test_dependency_tree(container: Container) -> None:
+    with trace(container) as tracer:
+        container.get(IRepository)
+        container.get(IRepository)
+
+    first, second = tracer.roots
+    assert [node.name for node in first.walk()] == [
+        "IRepository",
+        "IDatabase",
+        "IConfig",
+        "IConfig",
+    ]
+    database, config = first.children
+    assert database.constructed and database.children[0].constructed
+    assert not config.constructed
+    assert [child.constructed for child in second.children] == [False, False]
+    assert all(node.seconds >= node.self_seconds >= 0 for node in tracer.nodes())
+    assert not container._observers
+
+
+def test_async_factory(container: Container) -> None:
+    with trace(container) as tracer:
+        asyncio.run(container.aget(IClient))
+
+    (client,) = tracer.roots
+    assert client.constructed
+    assert [child.name for child in client.children] == ["IConfig"]
+
+
+def test_exports(container: Container) -> None:
+    with trace(container) as tracer:
+        container.get(IRepository)
+
+    events = tracer.chrome_trace()["traceEvents"]
+    assert [event["name"] for event in events] == [
+        "IRepository",
+        "IDatabase",
+        "IConfig",
+        "IConfig",
+    ]
+    assert events[1]["args"]["parent"] == "IRepository"
+    assert events[1]["args"]["provider"] == "SingletonProvider"
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+
+    stacks = [line.rpartition(" ")[0] for line in tracer.collapsed_stacks().split("\n")]
+    assert stacks == [
+        "IRepository",
+        "IRepository;IDatabase",
+        "IRepository;IDatabase;IConfig",
+        "IRepository;IConfig",
+        "",
+    ]
+
+    slowest = {timing.concrete: timing for timing in tracer.slowest()}
+    assert slowest.keys() == {"Repository", "Database", "Config"}
+    assert slowest["Database"].lifetime == "singleton"
+
+
+def test_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    Container._delete_instance()
+    chrome = tmp_path / "trace.json"
+
+    code = main([f"{__name__}:create_container", "--top", "2", "--chrome", str(chrome)])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert code == 0
+    assert len(lines) == 3
+    assert len(json.loads(chrome.read_text())["traceEvents"]) == 8
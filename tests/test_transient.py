@@ -1,3 +1,4 @@
+import logging
 from typing import Literal, Protocol
 
 import pytest
@@ -48,6 +49,18 @@ def test_multiple_concretes_no_resolver(provider: Provider) -> None:
     assert impl.type == 51
 
 
+def test_multiple_concretes_warned_once(caplog: pytest.LogCaptureFixture) -> None:
+    provider = TransientProvider(logger=logging.getLogger("uncoupled"))
+    provider.register(Interface, Impl2)
+    provider.register(Interface, Impl)
+
+    provider.get(Interface)
+    provider.get(Interface)
+
+    warnings = [r for r in caplog.records if "Multiple concretes" in r.message]
+    assert len(warnings) == 1
+
+
 def test_multiple_concretes_with_resolver(provider: Provider) -> None:
     provider.register(Interface, Impl2)
     provider.register(Interface, Impl)
@@ -72,6 +85,22 @@ def test_multiple_concretes_with_marker(provider: Provider) -> None:
     assert impl.type == 42
 
 
+def test_get_with_marker(provider: Provider) -> None:
+    provider.register(Interface, Impl2, "impl2")
+    provider.register(Interface, Impl, "impl")
+
+    impl = provider.get(Interface, marker="impl")
+    assert isinstance(impl, Impl)
+    assert impl.type == 42
+
+
+def test_get_with_unregistered_marker(provider: Provider) -> None:
+    provider.register(Interface, Impl2, "impl2")
+
+    with pytest.raises(UnregisteredInterfaceError):
+        provider.get(Interface, marker="impl")
+
+
 def test_multiple_concretes_with_marker_not_found(provider: Provider) -> None:
     provider.register(Interface, Impl2, "impl2")
     provider.register(Interface, Impl, "impl")
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from collections.abc import Generator
+from typing import Protocol
+import pytest
+
+from uncoupled.container import Container
+from uncoupled.exception import AsyncRegistrationError, CircularDependencyError
+
+built: list[str] = []
+
+
+class IConfig(Protocol): ...
+
+
+class IPool(Protocol): ...
+
+
+class ICache(Protocol): ...
+
+
+class IClient(Protocol): ...
+
+
+class Config(IConfig):
+    def __init__(self) -> None:
+        time.sleep(0.05)
+        built.append("config")
+
+
+class Pool(IPool):
+    def __init__(self, config: IConfig) -> None:
+        time.sleep(0.1)
+        built.append("pool")
+
+
+class Cache(ICache):
+    def __init__(self, config: IConfig) -> None:
+        time.sleep(0.1)
+        built.append("cache")
+
+
+class Client(IClient): ...
+
+
+async def make_client(pool: IPool) -> IClient:
+    await asyncio.sleep(0.01)
+    built.append("client")
+    return Client()
+
+
+class CyclicPool(IPool):
+    def __init__(self, cache: ICache) -> None: ...
+
+
+class CyclicCache(ICache):
+    def __init__(self, pool: IPool) -> None: ...
+
+
+@pytest.fixture()
+def container() -> Generator[Container]:
+    built.clear()
+    c = Container.create()
+    yield c
+    Container._delete_instance()
+
+
+def test_warm_up_builds_in_dependency_order(container: Container) -> None:
+    container.add_singleton(IPool, Pool).add_singleton(ICache, Cache).add_singleton(
+        IConfig, Config
+    )
+
+    report = container.warm_up()
+
+    assert built[0] == "config"
+    assert sorted(built[1:]) == ["cache", "pool"]
+    assert {t.interface for t in report.timings} == {IConfig, IPool, ICache}
+    assert report.slowest(1)[0].seconds >= 0.1
+    assert report.seconds < 0.3
+
+
+def test_warm_up_detects_cycles(container: Container) -> None:
+    container.add_singleton(IPool, CyclicPool).add_singleton(ICache, CyclicCache)
+
+    with pytest.raises(CircularDependencyError):
+        container.warm_up()
+
+
+def test_warm_up_rejects_async_factories(container: Container) -> None:
+    container.add_singleton(IConfig, Config).add_singleton(IPool, Pool)
+    container.add_singleton(IClient, make_client)
+
+    with pytest.raises(AsyncRegistrationError):
+        container.warm_up()
+
+
+def test_awarm_up(container: Container) -> None:
+    container.add_singleton(IConfig, Config).add_singleton(IPool, Pool)
+    container.add_singleton(ICache, Cache).add_singleton(IClient, make_client)
+
+    report = asyncio.run(container.awarm_up())
+
+    assert built[0] == "config"
+    assert built[-1] == "client"
+    assert len(report.timings) == 4
+    assert isinstance(container.get(IClient), Client)
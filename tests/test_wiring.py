@@ -0,0 +1,181 @@
+import asyncio
+from collections.abc import Generator
+from typing import TYPE_CHECKING, Protocol
+import pytest
+
+from uncoupled import container as container_module
+from uncoupled.container import Container, Depends, LazyProxy
+from uncoupled.exception import (
+    CircularDependencyError,
+    UnregisteredInterfaceError,
+    UnresolvedAnnotationError,
+)
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+
+class IConfig(Protocol):
+    url: str
+
+
+class IRepository(Protocol):
+    config: IConfig
+
+
+class IService(Protocol):
+    repository: IRepository
+
+
+class Config(IConfig):
+    url = "sqlite://"
+
+
+class OtherConfig(IConfig):
+    url = "postgres://"
+
+
+class Repository(IRepository):
+    def __init__(self, config: IConfig, retries: int = 3) -> None:
+        self.config = config
+        self.retries = retries
+
+
+class Service(IService):
+    def __init__(self, repository: IRepository) -> None:
+        self.repository = repository
+
+
+class ServiceWithDepends(IService):
+    def __init__(
+        self,
+        config: IConfig = Depends(
+            IConfig, resolver=lambda r: next(i for i in r if i.marker == "other")
+        ),
+    ) -> None:
+        self.config = config
+
+
+@pytest.fixture()
+def container() -> Generator[Container]:
+    c = Container.create()
+    yield c
+    Container._delete_instance()
+
+
+def test_constructor_dependencies_are_injected(container: Container) -> None:
+    container.add_singleton(IConfig, Config).add_transient(
+        IRepository, Repository
+    ).add_transient(IService, Service)
+
+    service = container.get_concrete_instance(IService)
+
+    assert isinstance(service, Service)
+    assert isinstance(service.repository, Repository)
+    assert type(service.repository.config) is Config
+    assert service.repository.config is container.get_concrete_instance(IConfig)
+
+
+def test_unregistered_optional_dependency_uses_default(container: Container) -> None:
+    container.add_singleton(IConfig, Config).add_transient(IRepository, Repository)
+
+    repository = container.get_concrete_instance(IRepository)
+    assert isinstance(repository, Repository)
+    assert repository.retries == 3
+
+
+def test_unregistered_required_dependency(container: Container) -> None:
+    container.add_transient(IRepository, Repository)
+
+    with pytest.raises(UnregisteredInterfaceError):
+        container.get_concrete_instance(IRepository)
+
+
+def test_depends_default_is_resolved_eagerly(container: Container) -> None:
+    container.add_singleton(IConfig, Config).add_singleton(
+        IConfig, OtherConfig, marker="other"
+    ).add_transient(IService, ServiceWithDepends)
+
+    service = container.get_concrete_instance(IService)
+    assert isinstance(service, ServiceWithDepends)
+    assert not isinstance(service.config, LazyProxy)
+    assert type(service.config) is OtherConfig
+
+
+def test_plan_is_computed_once_per_concrete(
+    container: Container, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    planned: list[type] = []
+    make_plan = container_module.make_plan
+
+    def counting_make_plan(concrete: type):  # type: ignore[no-untyped-def]
+        planned.append(concrete)
+        return make_plan(concrete)
+
+    monkeypatch.setattr(container_module, "make_plan", counting_make_plan)
+    container.add_singleton(IConfig, Config).add_transient(IRepository, Repository)
+
+    for _ in range(3):
+        container.get_concrete_instance(IRepository)
+
+    assert planned == [Repository, Config]
+
+
+class CachedRepository(IRepository):
+    def __init__(self, inner: IRepository) -> None:
+        self.inner = inner
+
+
+def test_self_dependency_raises(container: Container) -> None:
+    container.add_transient(IRepository, CachedRepository)
+
+    with pytest.raises(CircularDependencyError, match="CachedRepository -> Cached"):
+        container.get_concrete_instance(IRepository)
+
+
+def test_async_singleton_cycle_raises(container: Container) -> None:
+    class CyclicService(IService):
+        def __init__(self, repository: IRepository) -> None: ...
+
+    class CyclicRepository(IRepository):
+        def __init__(self, service: IService) -> None: ...
+
+    container.add_singleton(IService, CyclicService)
+    container.add_singleton(IRepository, CyclicRepository)
+
+    async def main() -> None:
+        await asyncio.wait_for(container.aget(IService), 1)
+
+    with pytest.raises(CircularDependencyError):
+        asyncio.run(main())
+
+
+class PreciseService(IService):
+    def __init__(
+        self, repository: "IRepository", precision: "Decimal | None" = None
+    ) -> None:
+        self.repository = repository
+        self.precision = precision
+
+
+class RequiresPrecision(IService):
+    def __init__(self, precision: "Decimal") -> None: ...
+
+
+def test_unresolvable_optional_annotation_keeps_other_dependencies(
+    container: Container,
+) -> None:
+    container.add_singleton(IConfig, Config).add_transient(IRepository, Repository)
+    container.add_transient(IService, PreciseService)
+
+    service = container.get_concrete_instance(IService)
+
+    assert isinstance(service.repository, Repository)
+    assert service.precision is None
+
+
+def test_unresolvable_required_annotation_raises(container: Container) -> None:
+    container.add_transient(IService, RequiresPrecision)
+
+    with pytest.raises(UnresolvedAnnotationError, match="'precision'"):
+        container.get_concrete_instance(IService)